@@ -3,87 +3,76 @@ from dotenv import load_dotenv
 from flask import Flask
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
-from flask_migrate import Migrate
 
 # Cargar variables de entorno desde .env
 load_dotenv()
 
 from config import Config
 from app.infrastructure.db.base import db
+from app.infrastructure.db.statement_timeout import statement_timeout
+from app.infrastructure.auth.password_hasher import password_hasher
+from app.infrastructure.auth.rate_limiter import login_rate_limiter
+from app.infrastructure.auth.token_blocklist import token_blocklist
+from app.infrastructure.auth.user_status_cache import user_status_cache
+from app.infrastructure.auth.jwt_callbacks import register_jwt_callbacks
+from app.infrastructure.monitoring.request_metrics import request_metrics
+from app.infrastructure.monitoring.structured_logging import structured_logging
 
 jwt = JWTManager()
-migrate = Migrate()
 
-def create_database_if_not_exists():
-    try:
-        try:
-            import psycopg2
-            psycopg_driver = psycopg2
-        except ImportError:
-            try:
-                import psycopg
-                psycopg_driver = psycopg
-            except ImportError:
-                raise ImportError("Se requiere psycopg2 o psycopg para PostgreSQL")
-
-        conn = psycopg_driver.connect(
-            host=Config.DB_HOST,
-            port=Config.DB_PORT,
-            dbname='postgres',
-            user=Config.DB_USER,
-            password=Config.DB_PASSWORD
-        )
-        conn.autocommit = True
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT 1 FROM pg_database WHERE datname=%s", (Config.DB_NAME,))
-        exists = cursor.fetchone()
-
-        if not exists:
-            cursor.execute(f"CREATE DATABASE {Config.DB_NAME}")
-            print(f"✅ Base de datos '{Config.DB_NAME}' creada exitosamente")
-        else:
-            print(f"✅ Base de datos '{Config.DB_NAME}' ya existe")
-
-        cursor.close()
-        conn.close()
-
-    except Exception as e:
-        print(f"⚠️  Error al verificar/crear base de datos: {e}")
-        print("⚠️  Asegúrate de que PostgreSQL esté ejecutándose y las credenciales sean correctas")
+def health_status(app) -> dict:
+    """Respuesta de /api/health (compartida con el modo ASGI)"""
+    return {
+        'status': 'success',
+        'message': 'API del Catálogo de Productos funcionando correctamente',
+        'timestamp': '2025-08-20',
+        'version': '1.0.0',
+        'cors_origins': app.config['CORS_ORIGINS']
+    }
 
 def create_app(config_class=Config):
     app = Flask(__name__)
     
     app.config.from_object(config_class)
     
-    create_database_if_not_exists()
-    
+    # Primero: las demás extensiones ya registran a través de la cola de logs
+    structured_logging.init_app(app)
     db.init_app(app)
+    statement_timeout.init_app(app)
     jwt.init_app(app)
-    migrate.init_app(app, db)
+    password_hasher.init_app(app)
+    login_rate_limiter.init_app(app)
+    token_blocklist.init_app(app)
+    user_status_cache.init_app(app)
+    register_jwt_callbacks(jwt)
+    # Antes que CORS: los after_request corren en orden inverso al de registro,
+    # así las métricas miden la respuesta completa
+    request_metrics.init_app(app)
     CORS(app, origins=app.config['CORS_ORIGINS'])
     
+    from app.interface.http.serializers import configure_json_provider
+    configure_json_provider(app)
+    
+    # Comandos `flask db-bootstrap` y `flask db ...` (migraciones)
+    from app.cli import register_commands
+    register_commands(app)
+    
     from app.interface.blueprints.auth_bp import auth_bp
     from app.interface.blueprints.categoria_bp import categoria_bp
     from app.interface.blueprints.presentacion_bp import presentacion_bp
     from app.interface.blueprints.producto_bp import producto_bp
+    from app.interface.blueprints.metrics_bp import metrics_bp
     
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
     app.register_blueprint(categoria_bp, url_prefix='/api/categorias')
     app.register_blueprint(presentacion_bp, url_prefix='/api/presentaciones')
     app.register_blueprint(producto_bp, url_prefix='/api/productos')
+    app.register_blueprint(metrics_bp, url_prefix='/api/metrics')
     
     # Endpoint de salud para verificar que la API esté funcionando
     @app.route('/api/health')
     def health_check():
-        return {
-            'status': 'success',
-            'message': 'API del Catálogo de Productos funcionando correctamente',
-            'timestamp': '2025-08-20',
-            'version': '1.0.0',
-            'cors_origins': app.config['CORS_ORIGINS']
-        }
+        return health_status(app)
     
     # Endpoint raíz de la API
     @app.route('/api')
@@ -95,7 +84,8 @@ def create_app(config_class=Config):
                 'auth': '/api/auth',
                 'categorias': '/api/categorias',
                 'presentaciones': '/api/presentaciones',
-                'productos': '/api/productos'
+                'productos': '/api/productos',
+                'metrics': '/api/metrics'
             },
             'status': 'online'
         }
@@ -1,11 +1,12 @@
-from werkzeug.security import check_password_hash
 from app.infrastructure.repository_impl.usuario_repo import UsuarioRepository
+from app.infrastructure.auth.password_hasher import PasswordHasher, PasswordHasherBusy
 from app.infrastructure.auth.jwt_service import JWTService
 from typing import Dict, Any, Optional
 
 class LoginUserUseCase:
-    def __init__(self, usuario_repo: UsuarioRepository):
+    def __init__(self, usuario_repo: UsuarioRepository, password_hasher: PasswordHasher):
         self.usuario_repo = usuario_repo
+        self.password_hasher = password_hasher
     
     def execute(self, email: str, password: str) -> Optional[Dict[str, Any]]:
         # Buscar el usuario por email
@@ -17,10 +18,18 @@ class LoginUserUseCase:
         if not usuario.activo:
             raise ValueError("La cuenta de usuario está desactivada")
         
-        # Verificar la contraseña
-        if not check_password_hash(usuario.password_hash, password):
+        # Verificar la contraseña (en el pool de hash, fuera del hilo de la petición)
+        if not self.password_hasher.verify(usuario.password_hash, password):
             return None
         
+        # Actualizar el hash si se generó con un método o costo anterior; si el
+        # pool está ocupado se deja para el próximo inicio de sesión
+        try:
+            if self.password_hasher.needs_rehash(usuario.password_hash):
+                self.usuario_repo.update_password_hash(usuario.id, self.password_hasher.hash(password))
+        except PasswordHasherBusy:
+            pass
+        
         # Generar tokens JWT
         tokens = JWTService.create_tokens(usuario.id, usuario.email)
         
@@ -0,0 +1,20 @@
+from app.infrastructure.auth.token_blocklist import TokenBlocklist
+from app.infrastructure.auth.jwt_service import JWTService
+from typing import Any, Dict, Optional
+
+class LogoutUserUseCase:
+    def __init__(self, token_blocklist: TokenBlocklist):
+        self.token_blocklist = token_blocklist
+    
+    def execute(self, current_token: Dict[str, Any], refresh_token: Optional[str] = None) -> None:
+        tokens = [current_token]
+        
+        # El refresh token (válido por 30 días) es el que realmente mantiene la sesión
+        if refresh_token:
+            refresh_claims = JWTService.decode_refresh_token(refresh_token)
+            if refresh_claims["sub"] != current_token["sub"]:
+                raise ValueError("El refresh token no pertenece al usuario autenticado")
+            if refresh_claims["jti"] != current_token["jti"]:
+                tokens.append(refresh_claims)
+        
+        self.token_blocklist.revoke(tokens)
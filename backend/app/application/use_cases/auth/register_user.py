@@ -1,12 +1,13 @@
-from werkzeug.security import generate_password_hash
 from app.domain.entities.usuario import Usuario
 from app.infrastructure.repository_impl.usuario_repo import UsuarioRepository
+from app.infrastructure.auth.password_hasher import PasswordHasher
 from app.infrastructure.auth.jwt_service import JWTService
 from typing import Dict, Any
 
 class RegisterUserUseCase:
-    def __init__(self, usuario_repo: UsuarioRepository):
+    def __init__(self, usuario_repo: UsuarioRepository, password_hasher: PasswordHasher):
         self.usuario_repo = usuario_repo
+        self.password_hasher = password_hasher
     
     def execute(self, email: str, password: str, nombre: str) -> Dict[str, Any]:
         # Validar que el email no esté en uso
@@ -21,7 +22,7 @@ class RegisterUserUseCase:
         usuario = Usuario(
             id=None,
             email=email,
-            password_hash=generate_password_hash(password),
+            password_hash=self.password_hasher.hash(password),
             nombre=nombre,
             activo=True
         )
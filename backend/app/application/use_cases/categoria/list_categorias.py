@@ -1,16 +1,34 @@
-from typing import List, Tuple
+from typing import Optional
 from app.domain.entities.categoria import Categoria
+from app.infrastructure.db.counting import COUNT_EXACT, validate_count_mode
+from app.infrastructure.db.pagination import Page
+from app.infrastructure.db.search import SEARCH_MODE_FULLTEXT, SEARCH_MODE_SUBSTRING, validate_search_mode
 from app.infrastructure.repository_impl.categoria_repo import CategoriaRepository
+from app.infrastructure.db.routing import replica_read
 
 class ListCategoriasUseCase:
     def __init__(self, categoria_repo: CategoriaRepository):
         self.categoria_repo = categoria_repo
     
-    def execute(self, page: int = 1, per_page: int = 10, search: str = None) -> Tuple[List[Categoria], int]:
+    @replica_read
+    def execute(self, page: int = 1, per_page: int = 10, search: str = None,
+                search_mode: str = SEARCH_MODE_SUBSTRING, count_mode: str = COUNT_EXACT) -> Page:
+        validate_search_mode(search_mode)
+        validate_count_mode(count_mode)
         if page < 1:
             page = 1
         if per_page < 1 or per_page > 100:
             per_page = 10
             
-        return self.categoria_repo.get_all(page=page, per_page=per_page, search=search)
-
+        return self.categoria_repo.get_all(page=page, per_page=per_page, search=search,
+                                           search_mode=search_mode, count_mode=count_mode)
+    
+    @replica_read
+    def execute_after(self, after: Optional[str] = None, per_page: int = 10, search: str = None,
+                      search_mode: str = SEARCH_MODE_SUBSTRING) -> Page:
+        if validate_search_mode(search_mode) == SEARCH_MODE_FULLTEXT:
+            raise ValueError("La paginación por cursor no está disponible con búsqueda de texto completo")
+        if per_page < 1 or per_page > 100:
+            per_page = 10
+            
+        return self.categoria_repo.get_all_after(after=after, per_page=per_page, search=search)
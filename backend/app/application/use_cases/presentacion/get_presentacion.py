@@ -1,11 +1,13 @@
 from typing import Optional
 from app.domain.entities.presentacion import Presentacion
 from app.infrastructure.repository_impl.presentacion_repo import PresentacionRepository
+from app.infrastructure.db.routing import replica_read
 
 class GetPresentacionUseCase:
     def __init__(self, presentacion_repo: PresentacionRepository):
         self.presentacion_repo = presentacion_repo
     
+    @replica_read
     def execute(self, presentacion_id: int) -> Optional[Presentacion]:
         if presentacion_id <= 0:
             raise ValueError("El ID de la presentación debe ser mayor a 0")
@@ -1,16 +1,28 @@
-from typing import List, Tuple
+from typing import Optional
 from app.domain.entities.presentacion import Presentacion
+from app.infrastructure.db.counting import COUNT_EXACT, validate_count_mode
+from app.infrastructure.db.pagination import Page
 from app.infrastructure.repository_impl.presentacion_repo import PresentacionRepository
+from app.infrastructure.db.routing import replica_read
 
 class ListPresentacionesUseCase:
     def __init__(self, presentacion_repo: PresentacionRepository):
         self.presentacion_repo = presentacion_repo
     
-    def execute(self, page: int = 1, per_page: int = 10, search: str = None) -> Tuple[List[Presentacion], int]:
+    @replica_read
+    def execute(self, page: int = 1, per_page: int = 10, search: str = None,
+                count_mode: str = COUNT_EXACT) -> Page:
+        validate_count_mode(count_mode)
         if page < 1:
             page = 1
         if per_page < 1 or per_page > 100:
             per_page = 10
             
-        return self.presentacion_repo.get_all(page=page, per_page=per_page, search=search)
-
+        return self.presentacion_repo.get_all(page=page, per_page=per_page, search=search, count_mode=count_mode)
+    
+    @replica_read
+    def execute_after(self, after: Optional[str] = None, per_page: int = 10, search: str = None) -> Page:
+        if per_page < 1 or per_page > 100:
+            per_page = 10
+            
+        return self.presentacion_repo.get_all_after(after=after, per_page=per_page, search=search)
@@ -0,0 +1,26 @@
+from typing import Any, Dict, List, Optional
+from app.infrastructure.repository_impl.producto_repo import ProductoRepository
+
+class BulkDeleteProductosUseCase:
+    def __init__(self, producto_repo: ProductoRepository):
+        self.producto_repo = producto_repo
+    
+    def execute(self, ids: Optional[List[int]] = None, categoria_id: Optional[int] = None,
+                presentacion_id: Optional[int] = None) -> Dict[str, Any]:
+        # Validar la selección: lista de IDs o filtro, nunca ambos
+        if ids and (categoria_id or presentacion_id):
+            raise ValueError("Debe indicar una lista de IDs o un filtro, pero no ambos")
+        if not ids and not categoria_id and not presentacion_id:
+            raise ValueError("Debe indicar una lista de IDs o un filtro por categoría o presentación")
+        
+        # Eliminar todos los productos en una sola sentencia
+        affected, missing = self.producto_repo.bulk_delete(
+            ids=ids,
+            categoria_id=categoria_id,
+            presentacion_id=presentacion_id
+        )
+        
+        return {
+            'affected': affected,
+            'failed': [{'id': producto_id, 'message': 'Producto no encontrado'} for producto_id in missing]
+        }
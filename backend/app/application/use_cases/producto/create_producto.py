@@ -1,28 +1,13 @@
 from decimal import Decimal
 from app.domain.entities.producto import Producto
 from app.infrastructure.repository_impl.producto_repo import ProductoRepository
-from app.infrastructure.repository_impl.categoria_repo import CategoriaRepository
-from app.infrastructure.repository_impl.presentacion_repo import PresentacionRepository
 
 class CreateProductoUseCase:
-    def __init__(self, producto_repo: ProductoRepository, categoria_repo: CategoriaRepository, 
-                 presentacion_repo: PresentacionRepository):
+    def __init__(self, producto_repo: ProductoRepository):
         self.producto_repo = producto_repo
-        self.categoria_repo = categoria_repo
-        self.presentacion_repo = presentacion_repo
     
     def execute(self, nombre: str, precio: float, categoria_id: int, 
                 presentacion_id: int, activo: bool = True) -> Producto:
-        # Validar que la categoría existe
-        categoria = self.categoria_repo.get_by_id(categoria_id)
-        if not categoria:
-            raise ValueError(f"No existe una categoría con ID {categoria_id}")
-        
-        # Validar que la presentación existe
-        presentacion = self.presentacion_repo.get_by_id(presentacion_id)
-        if not presentacion:
-            raise ValueError(f"No existe una presentación con ID {presentacion_id}")
-        
         # Validar datos del producto
         producto = Producto(
             id=None,
@@ -34,10 +19,7 @@ class CreateProductoUseCase:
         )
         producto.validate()
         
-        # Verificar que no exista un producto con el mismo nombre
-        if self.producto_repo.exists_by_nombre(nombre):
-            raise ValueError(f"Ya existe un producto con el nombre '{nombre}'")
-        
-        # Crear el producto
+        # Crear el producto: la existencia de la categoría y la presentación y
+        # la unicidad del nombre las verifican las restricciones de la base de
+        # datos en la misma sentencia (el repositorio traduce los errores)
         return self.producto_repo.create(producto)
-
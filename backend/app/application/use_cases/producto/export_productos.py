@@ -0,0 +1,20 @@
+from typing import Iterator, Optional
+from app.domain.entities.producto import Producto
+from app.infrastructure.repository_impl.producto_repo import ProductoRepository
+
+class ExportProductosUseCase:
+    def __init__(self, producto_repo: ProductoRepository):
+        self.producto_repo = producto_repo
+    
+    def execute(self, search: str = None, categoria_id: Optional[int] = None,
+                presentacion_id: Optional[int] = None, batch_size: int = 1000) -> Iterator[Producto]:
+        """Recorrer el catálogo completo (con los mismos filtros del listado) sin paginar"""
+        if batch_size < 1:
+            raise ValueError("El tamaño de lote debe ser mayor a 0")
+        
+        return self.producto_repo.iter_all(
+            search=search,
+            categoria_id=categoria_id,
+            presentacion_id=presentacion_id,
+            batch_size=batch_size
+        )
@@ -1,14 +1,17 @@
 from typing import Optional
 from app.domain.entities.producto import Producto
+from app.infrastructure.db.expand import PRODUCTO_EXPANSIONS, parse_expand
 from app.infrastructure.repository_impl.producto_repo import ProductoRepository
+from app.infrastructure.db.routing import replica_read
 
 class GetProductoUseCase:
     def __init__(self, producto_repo: ProductoRepository):
         self.producto_repo = producto_repo
     
-    def execute(self, producto_id: int) -> Optional[Producto]:
+    @replica_read
+    def execute(self, producto_id: int, expand: Optional[str] = None) -> Optional[Producto]:
         if producto_id <= 0:
             raise ValueError("El ID del producto debe ser mayor a 0")
         
-        return self.producto_repo.get_by_id(producto_id)
+        return self.producto_repo.get_by_id(producto_id, parse_expand(expand, PRODUCTO_EXPANSIONS))
 
@@ -0,0 +1,145 @@
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from app.domain.entities.producto import Producto
+from app.infrastructure.repository_impl.producto_repo import ProductoRepository
+from app.infrastructure.repository_impl.categoria_repo import CategoriaRepository
+from app.infrastructure.repository_impl.presentacion_repo import PresentacionRepository
+
+# Límite de la columna productos.precio (NUMERIC(10, 2))
+MAX_PRECIO = Decimal('99999999.99')
+
+TRUE_VALUES = {'1', 'true', 't', 'si', 'sí', 's', 'yes', 'y'}
+FALSE_VALUES = {'0', 'false', 'f', 'no', 'n'}
+
+class ImportProductosUseCase:
+    """Importación masiva de productos por lotes.
+    
+    Cada lote se valida en memoria, resuelve categorías, presentaciones y
+    nombres duplicados con una consulta por tipo y se inserta con un INSERT
+    multi-fila. Sólo se mantiene en memoria el lote actual y, como máximo,
+    `max_errors` errores del reporte.
+    """
+    
+    def __init__(self, producto_repo: ProductoRepository, categoria_repo: CategoriaRepository,
+                 presentacion_repo: PresentacionRepository):
+        self.producto_repo = producto_repo
+        self.categoria_repo = categoria_repo
+        self.presentacion_repo = presentacion_repo
+    
+    def execute(self, rows: Iterable[Tuple[int, Optional[Dict[str, Any]], Optional[str]]],
+                batch_size: int = 1000, max_errors: int = 1000) -> Dict[str, Any]:
+        """Importar filas (número de fila, datos, error de lectura) y devolver el reporte"""
+        report = {
+            'processed': 0,
+            'imported': 0,
+            'failed': 0,
+            'errors': [],
+            'errors_truncated': False
+        }
+        
+        iterator = iter(rows)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
+            self._import_batch(batch, report, max_errors)
+        
+        return report
+    
+    def _import_batch(self, batch: List[Tuple[int, Optional[Dict[str, Any]], Optional[str]]],
+                      report: Dict[str, Any], max_errors: int) -> None:
+        report['processed'] += len(batch)
+        
+        # Validar cada fila sin tocar la base de datos
+        candidatos = []
+        for fila, datos, error in batch:
+            if error:
+                self._add_error(report, fila, error, max_errors)
+                continue
+            try:
+                candidatos.append((fila, self._parse_row(datos)))
+            except ValueError as e:
+                self._add_error(report, fila, str(e), max_errors)
+        
+        if not candidatos:
+            return
+        
+        # Resolver referencias y duplicados con una consulta por tipo
+        categorias = self.categoria_repo.get_existing_ids(p.categoria_id for _, p in candidatos)
+        presentaciones = self.presentacion_repo.get_existing_ids(p.presentacion_id for _, p in candidatos)
+        nombres_existentes = self.producto_repo.get_existing_nombres(p.nombre for _, p in candidatos)
+        
+        validos = []
+        for fila, producto in candidatos:
+            if producto.categoria_id not in categorias:
+                self._add_error(report, fila, f"No existe una categoría con ID {producto.categoria_id}", max_errors)
+            elif producto.presentacion_id not in presentaciones:
+                self._add_error(report, fila, f"No existe una presentación con ID {producto.presentacion_id}", max_errors)
+            elif producto.nombre.lower() in nombres_existentes:
+                self._add_error(report, fila, f"Ya existe un producto con el nombre '{producto.nombre}'", max_errors)
+            else:
+                # Evitar duplicados dentro del mismo lote
+                nombres_existentes.add(producto.nombre.lower())
+                validos.append((fila, producto))
+        
+        failures = self.producto_repo.bulk_create([producto for _, producto in validos])
+        for index, mensaje in failures:
+            self._add_error(report, validos[index][0], mensaje, max_errors)
+        
+        report['imported'] += len(validos) - len(failures)
+    
+    def _parse_row(self, datos: Dict[str, Any]) -> Producto:
+        if not isinstance(datos, dict):
+            raise ValueError("La fila debe ser un objeto con los campos del producto")
+        
+        nombre = datos.get('nombre')
+        if not isinstance(nombre, str):
+            raise ValueError("El nombre del producto es requerido")
+        
+        try:
+            precio = Decimal(str(datos.get('precio')).strip())
+        except (InvalidOperation, ValueError):
+            raise ValueError("El precio debe ser un número válido")
+        if not precio.is_finite():
+            raise ValueError("El precio debe ser un número válido")
+        if precio > MAX_PRECIO:
+            raise ValueError("El precio excede el valor máximo permitido")
+        
+        producto = Producto(
+            id=None,
+            nombre=nombre,
+            precio=precio,
+            categoria_id=self._parse_int(datos.get('categoria_id'), 'categoría'),
+            presentacion_id=self._parse_int(datos.get('presentacion_id'), 'presentación'),
+            activo=self._parse_bool(datos.get('activo', True))
+        )
+        producto.validate()
+        return producto
+    
+    def _parse_int(self, value: Any, campo: str) -> int:
+        if isinstance(value, bool):
+            raise ValueError(f"Debe especificar una {campo} válida")
+        try:
+            return int(str(value).strip())
+        except (TypeError, ValueError):
+            raise ValueError(f"Debe especificar una {campo} válida")
+    
+    def _parse_bool(self, value: Any) -> bool:
+        if isinstance(value, bool):
+            return value
+        if value is None or str(value).strip() == '':
+            return True
+        texto = str(value).strip().lower()
+        if texto in TRUE_VALUES:
+            return True
+        if texto in FALSE_VALUES:
+            return False
+        raise ValueError("El campo activo debe ser verdadero o falso")
+    
+    def _add_error(self, report: Dict[str, Any], fila: int, mensaje: str, max_errors: int) -> None:
+        report['failed'] += 1
+        if len(report['errors']) < max_errors:
+            report['errors'].append({'row': fila, 'message': mensaje})
+        else:
+            report['errors_truncated'] = True
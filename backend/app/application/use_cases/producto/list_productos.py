@@ -1,13 +1,24 @@
-from typing import List, Tuple, Optional
+from typing import Optional
 from app.domain.entities.producto import Producto
+from app.infrastructure.db.counting import COUNT_EXACT, validate_count_mode
+from app.infrastructure.db.expand import PRODUCTO_EXPANSIONS, parse_expand
+from app.infrastructure.db.pagination import Page
+from app.infrastructure.db.search import SEARCH_MODE_FULLTEXT, SEARCH_MODE_SUBSTRING, validate_search_mode
 from app.infrastructure.repository_impl.producto_repo import ProductoRepository
+from app.infrastructure.db.routing import replica_read
 
 class ListProductosUseCase:
     def __init__(self, producto_repo: ProductoRepository):
         self.producto_repo = producto_repo
     
+    @replica_read
     def execute(self, page: int = 1, per_page: int = 10, search: str = None, 
-                categoria_id: Optional[int] = None, presentacion_id: Optional[int] = None) -> Tuple[List[Producto], int]:
+                categoria_id: Optional[int] = None, presentacion_id: Optional[int] = None,
+                search_mode: str = SEARCH_MODE_SUBSTRING, count_mode: str = COUNT_EXACT,
+                expand: Optional[str] = None) -> Page:
+        validate_search_mode(search_mode)
+        validate_count_mode(count_mode)
+        relaciones = parse_expand(expand, PRODUCTO_EXPANSIONS)
         if page < 1:
             page = 1
         if per_page < 1 or per_page > 100:
@@ -18,6 +29,27 @@ class ListProductosUseCase:
             per_page=per_page, 
             search=search,
             categoria_id=categoria_id,
-            presentacion_id=presentacion_id
+            presentacion_id=presentacion_id,
+            search_mode=search_mode,
+            count_mode=count_mode,
+            expand=relaciones
+        )
+    
+    @replica_read
+    def execute_after(self, after: Optional[str] = None, per_page: int = 10, search: str = None,
+                      categoria_id: Optional[int] = None, presentacion_id: Optional[int] = None,
+                      search_mode: str = SEARCH_MODE_SUBSTRING, expand: Optional[str] = None) -> Page:
+        if validate_search_mode(search_mode) == SEARCH_MODE_FULLTEXT:
+            raise ValueError("La paginación por cursor no está disponible con búsqueda de texto completo")
+        relaciones = parse_expand(expand, PRODUCTO_EXPANSIONS)
+        if per_page < 1 or per_page > 100:
+            per_page = 10
+            
+        return self.producto_repo.get_all_after(
+            after=after,
+            per_page=per_page,
+            search=search,
+            categoria_id=categoria_id,
+            presentacion_id=presentacion_id,
+            expand=relaciones
         )
-
@@ -0,0 +1,161 @@
+"""
+Comandos de línea de comandos de la aplicación (`flask <comando>`).
+
+Las tareas que necesitan la base de datos o herramientas pesadas se ejecutan
+desde aquí y no al crear la aplicación, para que cada worker arranque sin
+conexiones ni imports innecesarios.
+"""
+
+import click
+from flask import current_app
+from flask.cli import ScriptInfo, with_appcontext
+
+
+def database_name(config) -> str:
+    """Nombre de la base de datos de `SQLALCHEMY_DATABASE_URI` (la ruta en SQLite)"""
+    from sqlalchemy.engine import make_url
+    
+    return make_url(config['SQLALCHEMY_DATABASE_URI']).database or ':memory:'
+
+
+def create_database_if_not_exists(config) -> bool:
+    """Crear la base de datos configurada si no existe. Devuelve True si se creó"""
+    from sqlalchemy.engine import make_url
+    
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() == 'sqlite':
+        return _create_sqlite_database(url.database)
+    
+    try:
+        import psycopg2
+        psycopg_driver = psycopg2
+    except ImportError:
+        try:
+            import psycopg
+            psycopg_driver = psycopg
+        except ImportError:
+            raise click.ClickException("Se requiere psycopg2 o psycopg para PostgreSQL")
+    
+    conn = psycopg_driver.connect(
+        host=config['DB_HOST'],
+        port=config['DB_PORT'],
+        dbname='postgres',
+        user=config['DB_USER'],
+        password=config['DB_PASSWORD']
+    )
+    conn.autocommit = True
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM pg_database WHERE datname=%s", (config['DB_NAME'],))
+        if cursor.fetchone():
+            return False
+        cursor.execute(f"CREATE DATABASE {config['DB_NAME']}")
+        return True
+    finally:
+        conn.close()
+
+
+def _create_sqlite_database(path) -> bool:
+    # SQLite crea el archivo al conectarse; en memoria no hay nada que crear
+    import sqlite3
+    from pathlib import Path
+    
+    if not path or path == ':memory:' or Path(path).exists():
+        return False
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    sqlite3.connect(path).close()
+    return True
+
+
+@click.command('db-bootstrap')
+@with_appcontext
+def db_bootstrap_command():
+    """Crear la base de datos configurada si no existe (antes de `flask db upgrade`)."""
+    db_name = database_name(current_app.config)
+    try:
+        created = create_database_if_not_exists(current_app.config)
+    except click.ClickException:
+        raise
+    except Exception as e:
+        raise click.ClickException(
+            f"Error al verificar/crear base de datos: {e}\n"
+            "Asegúrate de que PostgreSQL esté ejecutándose y las credenciales sean correctas"
+        )
+    
+    if created:
+        click.echo(f"✅ Base de datos '{db_name}' creada exitosamente")
+    else:
+        click.echo(f"✅ Base de datos '{db_name}' ya existe")
+
+
+@click.command('seed')
+@click.option('--productos', type=click.IntRange(min=0), default=0, help='Total de productos a alcanzar.')
+@click.option('--categorias', type=click.IntRange(min=0), default=50, help='Total de categorías a alcanzar.')
+@click.option('--presentaciones', type=click.IntRange(min=0), default=20, help='Total de presentaciones a alcanzar.')
+@click.option('--batch-size', type=click.IntRange(min=1), default=50_000, help='Filas por lote (y por commit).')
+@click.option('--semilla', type=int, default=0, help='Semilla de los datos generados.')
+@with_appcontext
+def seed_command(productos, categorias, presentaciones, batch_size, semilla):
+    """Completar el catálogo con datos sintéticos deterministas hasta los totales indicados."""
+    import time
+    from app.infrastructure.db.models import ProductoModel
+    from app.infrastructure.db.seed import CatalogSeeder
+    
+    seeder = CatalogSeeder(semilla=semilla, batch_size=batch_size)
+    start = time.perf_counter()
+    
+    agregadas = seeder.seed_categorias(categorias)
+    click.echo(f"✅ Categorías: {agregadas} agregadas")
+    agregadas = seeder.seed_presentaciones(presentaciones)
+    click.echo(f"✅ Presentaciones: {agregadas} agregadas")
+    
+    pendientes = productos - seeder.count(ProductoModel)
+    if pendientes > 0:
+        metodo = 'COPY' if seeder.use_copy else 'INSERT multi-fila'
+        with click.progressbar(length=pendientes, label=f'Productos ({metodo})', show_pos=True) as bar:
+            try:
+                agregadas = seeder.seed_productos(productos, on_batch=bar.update)
+            except ValueError as e:
+                raise click.ClickException(str(e))
+        click.echo(f"✅ Productos: {agregadas} agregados")
+    else:
+        click.echo("✅ Productos: 0 agregados")
+    
+    click.echo(f"Tiempo total: {time.perf_counter() - start:.1f} s")
+
+
+def init_migrate(app) -> None:
+    """Registrar Flask-Migrate en `app` (también para usar flask_migrate.upgrade() desde scripts)"""
+    from flask_migrate import Migrate
+    from app.infrastructure.db.base import db
+    
+    if 'migrate' not in app.extensions:
+        Migrate(app, db)
+
+
+class LazyMigrateGroup(click.Group):
+    """Grupo `flask db` que importa Flask-Migrate (y alembic) sólo cuando se usa.
+    
+    Flask-Migrate importa alembic completo al registrarse, lo que duplica el
+    tiempo de import de la aplicación en cada worker aunque nunca se migre.
+    """
+    
+    def _load(self, ctx) -> click.Group:
+        from flask_migrate.cli import db as db_group
+        
+        # `flask` ya empuja el contexto de la aplicación; el runner de pruebas no
+        app = current_app._get_current_object() if current_app else ctx.ensure_object(ScriptInfo).load_app()
+        init_migrate(app)
+        return db_group
+    
+    def list_commands(self, ctx):
+        return self._load(ctx).list_commands(ctx)
+    
+    def get_command(self, ctx, name):
+        return self._load(ctx).get_command(ctx, name)
+
+
+def register_commands(app) -> None:
+    app.cli.add_command(db_bootstrap_command)
+    app.cli.add_command(seed_command)
+    app.cli.add_command(LazyMigrateGroup('db', help='Migraciones de la base de datos (Flask-Migrate).'))
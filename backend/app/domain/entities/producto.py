@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 from decimal import Decimal
+from app.domain.entities.categoria import Categoria
+from app.domain.entities.presentacion import Presentacion
 
 @dataclass
 class Producto:
@@ -13,6 +15,9 @@ class Producto:
     activo: bool = True
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # Sólo presentes cuando la consulta las expande (`?expand=`)
+    categoria: Optional[Categoria] = None
+    presentacion: Optional[Presentacion] = None
     
     def __post_init__(self):
         if self.nombre:
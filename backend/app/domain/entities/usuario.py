@@ -3,6 +3,12 @@ from typing import Optional
 from datetime import datetime
 import re
 
+
+def normalize_email(email: str) -> str:
+    """Forma canónica del email (sin espacios y en minúsculas) usada al guardar y al buscar"""
+    return email.strip().lower()
+
+
 @dataclass
 class Usuario:
     id: Optional[int]
@@ -15,7 +21,7 @@ class Usuario:
     
     def __post_init__(self):
         if self.email:
-            self.email = self.email.strip().lower()
+            self.email = normalize_email(self.email)
         if self.nombre:
             self.nombre = self.nombre.strip()
     
@@ -0,0 +1,39 @@
+from flask import jsonify
+from flask_jwt_extended import JWTManager
+
+from app.infrastructure.auth.token_blocklist import token_blocklist
+from app.infrastructure.auth.user_status_cache import user_status_cache
+from app.infrastructure.repository_impl.usuario_repo import UsuarioRepository
+
+usuario_repo = UsuarioRepository()
+
+
+def register_jwt_callbacks(jwt: JWTManager) -> None:
+    """Registrar los callbacks de Flask-JWT-Extended de la aplicación"""
+    
+    @jwt.token_in_blocklist_loader
+    def token_revocado(jwt_header, jwt_payload):
+        return token_blocklist.is_revoked(jwt_payload['jti'])
+    
+    @jwt.revoked_token_loader
+    def token_revocado_response(jwt_header, jwt_payload):
+        return jsonify({
+            'success': False,
+            'message': 'La sesión fue cerrada, inicie sesión nuevamente'
+        }), 401
+    
+    @jwt.user_lookup_loader
+    def usuario_activo(jwt_header, jwt_payload):
+        # Devuelve el id del usuario (disponible como `current_user`) o None si
+        # la cuenta fue desactivada o eliminada, lo que rechaza la petición
+        usuario_id = int(jwt_payload['sub'])
+        if user_status_cache.get(usuario_id, usuario_repo.get_activo):
+            return usuario_id
+        return None
+    
+    @jwt.user_lookup_error_loader
+    def usuario_inactivo_response(jwt_header, jwt_payload):
+        return jsonify({
+            'success': False,
+            'message': 'La cuenta de usuario está desactivada'
+        }), 401
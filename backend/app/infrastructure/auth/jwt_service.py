@@ -1,5 +1,5 @@
-from flask_jwt_extended import create_access_token, create_refresh_token, get_jwt_identity, get_jwt
-from typing import Dict
+from flask_jwt_extended import create_access_token, create_refresh_token, get_jwt_identity, get_jwt, decode_token
+from typing import Any, Dict
 
 class JWTService:
     
@@ -33,3 +33,15 @@ class JWTService:
         """Obtener el email del usuario actual desde el token JWT"""
         jwt_data = get_jwt()
         return jwt_data.get("email")
+    
+    @staticmethod
+    def decode_refresh_token(token: str) -> Dict[str, Any]:
+        """Decodificar un refresh token recibido en el cuerpo de la petición"""
+        try:
+            # Un token expirado igual se acepta: revocarlo no tiene efecto
+            claims = decode_token(token, allow_expired=True)
+        except Exception:
+            raise ValueError("El refresh token no es válido")
+        if claims.get("type") != "refresh":
+            raise ValueError("El refresh token no es válido")
+        return claims
@@ -0,0 +1,114 @@
+"""
+Servicio de hash de contraseñas fuera del hilo de la petición.
+
+scrypt/pbkdf2 consumen decenas de milisegundos de CPU por llamada; con el GIL,
+hacerlo en el hilo del worker frena todas las demás peticiones del proceso.
+El servicio envía el trabajo a un pool de procesos acotado: como máximo
+`PASSWORD_HASH_WORKERS` hashes en curso y `PASSWORD_HASH_MAX_QUEUE` en espera.
+Si el pool está lleno se rechaza de inmediato con `PasswordHasherBusy`
+(HTTP 503 + Retry-After) en lugar de encolar sin límite.
+
+Con `PASSWORD_HASH_WORKERS=0` el hash se calcula en el hilo de la petición
+(útil en desarrollo y pruebas).
+"""
+
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class PasswordHasherBusy(Exception):
+    """El pool de hash está saturado; el cliente debe reintentar más tarde"""
+    
+    def __init__(self, retry_after: int):
+        super().__init__("El servicio está ocupado, intente nuevamente en unos segundos")
+        self.retry_after = retry_after
+
+
+def _hash(password: str, method: str) -> str:
+    return generate_password_hash(password, method=method)
+
+
+def _verify(password_hash: str, password: str) -> bool:
+    return check_password_hash(password_hash, password)
+
+
+class PasswordHasher:
+    
+    def __init__(self, app=None):
+        self.method = 'scrypt'
+        self.workers = 0
+        self.max_queue = 0
+        self.timeout = None
+        self.retry_after = 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[threading.BoundedSemaphore] = None
+        self._lock = threading.Lock()
+        self._method_prefix: Optional[str] = None
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app) -> None:
+        self.shutdown()
+        self.method = app.config['PASSWORD_HASH_METHOD']
+        self.workers = app.config['PASSWORD_HASH_WORKERS']
+        self.max_queue = app.config['PASSWORD_HASH_MAX_QUEUE']
+        self.timeout = app.config['PASSWORD_HASH_TIMEOUT']
+        self.retry_after = app.config['PASSWORD_HASH_RETRY_AFTER']
+        self._method_prefix = None
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_queue) if self.workers else None
+    
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password, self.method)
+    
+    def verify(self, password_hash: str, password: str) -> bool:
+        return self._run(_verify, password_hash, password)
+    
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Indicar si el hash se generó con otro método o parámetros de costo"""
+        if self._method_prefix is None:
+            # werkzeug completa los parámetros por defecto ('scrypt' -> 'scrypt:32768:8:1');
+            # se obtienen una sola vez generando un hash de referencia
+            self._method_prefix = self._run(_hash, '', self.method).split('$', 1)[0]
+        return password_hash.split('$', 1)[0] != self._method_prefix
+    
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+    
+    def _run(self, fn, *args):
+        if not self.workers:
+            return fn(*args)
+        
+        # Rechazar de inmediato si ya hay `workers + max_queue` hashes pendientes
+        slots = self._slots
+        if not slots.acquire(blocking=False):
+            raise PasswordHasherBusy(self.retry_after)
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise PasswordHasherBusy(self.retry_after)
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # Se crea en el primer uso y no en init_app: con gunicorn cada
+                    # worker tiene su propio pool en lugar de heredar el del maestro
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,154 @@
+"""
+Límite de intentos de inicio de sesión por email y por IP.
+
+Cada intento de login verifica un hash de contraseña, que es caro en CPU; una
+ráfaga de credenciales robadas puede ocupar todos los núcleos. El limitador
+rechaza los intentos que exceden el límite antes de validar el cuerpo,
+consultar la base de datos o calcular hashes.
+
+Se usa una ventana deslizante aproximada (contador de la ventana actual más
+el de la anterior ponderado por la parte que aún se solapa), que necesita
+sólo dos enteros por clave. Los contadores viven en memoria del proceso
+(`RATE_LIMIT_STORAGE_URL=memory://`) o, para compartirlos entre workers y
+servidores, en Redis (`redis://...`, requiere el paquete `redis`).
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitExceeded(Exception):
+    """Se superó el límite de intentos; el cliente debe esperar `retry_after` segundos"""
+    
+    def __init__(self, retry_after: int):
+        super().__init__("Demasiados intentos de inicio de sesión, intente nuevamente más tarde")
+        self.retry_after = retry_after
+
+
+class MemoryRateLimitBackend:
+    """Contadores por ventana en un diccionario del proceso, ordenado por último intento"""
+    
+    # Tope de claves para que una ráfaga con emails aleatorios no agote la memoria
+    MAX_KEYS = 100_000
+    
+    def __init__(self):
+        # clave -> [índice de ventana, intentos en la ventana, intentos en la anterior]
+        self._counters: OrderedDict[str, List[int]] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def hit(self, key: str, window_index: int) -> Tuple[int, int]:
+        """Registrar un intento y devolver (intentos en la ventana actual, en la anterior)"""
+        with self._lock:
+            self._expire(window_index)
+            
+            counter = self._counters.get(key)
+            if counter is None:
+                if len(self._counters) >= self.MAX_KEYS:
+                    # Descartar la clave con el intento más antiguo
+                    self._counters.popitem(last=False)
+                counter = self._counters[key] = [window_index, 0, 0]
+            else:
+                self._counters.move_to_end(key)
+                if counter[0] < window_index - 1:
+                    counter[:] = [window_index, 0, 0]
+                elif counter[0] == window_index - 1:
+                    counter[:] = [window_index, 0, counter[1]]
+            counter[1] += 1
+            return counter[1], counter[2]
+    
+    def _expire(self, window_index: int) -> None:
+        # Las claves sin intentos en las dos últimas ventanas ya no limitan nada.
+        # Como cada intento mueve su clave al final, las vencidas están al
+        # principio: se quitan sólo ésas, sin recorrer el resto
+        counters = self._counters
+        while counters:
+            key = next(iter(counters))
+            if counters[key][0] >= window_index - 1:
+                break
+            del counters[key]
+
+
+class RedisRateLimitBackend:
+    """Contadores compartidos entre procesos: una clave por ventana con expiración"""
+    
+    def __init__(self, url: str, window: int):
+        # Import diferido: el paquete es opcional y sólo se carga si se configura
+        import redis
+        self.client = redis.Redis.from_url(url)
+        self.window = window
+    
+    def hit(self, key: str, window_index: int) -> Tuple[int, int]:
+        current_key = f'ratelimit:{key}:{window_index}'
+        pipeline = self.client.pipeline()
+        pipeline.incr(current_key)
+        pipeline.expire(current_key, self.window * 2)
+        pipeline.get(f'ratelimit:{key}:{window_index - 1}')
+        current, _, previous = pipeline.execute()
+        return int(current), int(previous or 0)
+
+
+class LoginRateLimiter:
+    
+    def __init__(self, app=None):
+        self.window = 60
+        self.limits: Dict[str, int] = {}
+        self.backend = MemoryRateLimitBackend()
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app) -> None:
+        self.window = app.config['LOGIN_RATE_LIMIT_WINDOW']
+        self.limits = {
+            'email': app.config['LOGIN_RATE_LIMIT_PER_EMAIL'],
+            'ip': app.config['LOGIN_RATE_LIMIT_PER_IP'],
+        }
+        self.backend = self._create_backend(app.config['RATE_LIMIT_STORAGE_URL'])
+    
+    def check(self, ip: Optional[str], email: Optional[str]) -> None:
+        """Registrar un intento de login y lanzar RateLimitExceeded si supera algún límite"""
+        now = time.time()
+        window_index = int(now // self.window)
+        # Fracción de la ventana actual ya transcurrida
+        elapsed = (now % self.window) / self.window
+        
+        retry_after = 0
+        for scope, value in (('ip', ip), ('email', email)):
+            limit = self.limits[scope]
+            if not value or limit <= 0:
+                continue
+            current, previous = self.backend.hit(f'login:{scope}:{value}', window_index)
+            if previous * (1 - elapsed) + current > limit:
+                retry_after = max(retry_after, self._retry_after(current, previous, elapsed, limit))
+        
+        if retry_after:
+            raise RateLimitExceeded(retry_after)
+    
+    def _retry_after(self, current: int, previous: int, elapsed: float, limit: int) -> int:
+        """Segundos hasta que el conteo ponderado vuelva a quedar dentro del límite"""
+        if current >= limit or not previous:
+            # Hay que esperar a la próxima ventana (y a que ésta deje de pesar)
+            seconds = (1 - elapsed) * self.window
+            if current > limit:
+                seconds += (1 - limit / current) * self.window
+        else:
+            # El aporte de la ventana anterior decrece linealmente
+            seconds = ((1 - (limit - current) / previous) - elapsed) * self.window
+        return max(1, math.ceil(seconds))
+    
+    def _create_backend(self, url: str):
+        if url.startswith('redis://') or url.startswith('rediss://'):
+            try:
+                return RedisRateLimitBackend(url, self.window)
+            except ImportError:
+                logger.warning("RATE_LIMIT_STORAGE_URL usa Redis pero el paquete redis no está instalado; "
+                               "se usan contadores en memoria")
+        return MemoryRateLimitBackend()
+
+
+login_rate_limiter = LoginRateLimiter()
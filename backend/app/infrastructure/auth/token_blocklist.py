@@ -0,0 +1,76 @@
+"""
+Lista en memoria de tokens JWT revocados.
+
+`jwt_required()` consulta la lista en cada petición autenticada, así que la
+comprobación debe ser una búsqueda en un diccionario y no una consulta SQL.
+Cada proceso mantiene los `jti` revocados con su expiración; los demás
+workers se enteran de una revocación comparando, como mucho cada
+`TOKEN_BLOCKLIST_SYNC_INTERVAL` segundos, el contador de generación de
+`tokens_revocados` en `tabla_versiones` (una consulta por clave primaria).
+Sólo si cambió se recarga la lista desde la tabla.
+
+El proceso que revoca un token lo ve de inmediato; en los demás el retraso
+máximo es el intervalo de sincronización.
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from app.infrastructure.repository_impl.tabla_version_repo import TablaVersionRepository
+from app.infrastructure.repository_impl.token_revocado_repo import TokenRevocadoRepository
+
+TABLA = 'tokens_revocados'
+
+
+class TokenBlocklist:
+    
+    def __init__(self, app=None):
+        self.sync_interval = 5.0
+        self.token_repo = TokenRevocadoRepository()
+        self.version_repo = TablaVersionRepository()
+        self._revoked: Dict[str, float] = {}
+        self._version: Optional[int] = None
+        self._next_sync = 0.0
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app) -> None:
+        self.sync_interval = app.config['TOKEN_BLOCKLIST_SYNC_INTERVAL']
+        self._revoked = {}
+        self._version = None
+        self._next_sync = 0.0
+    
+    def is_revoked(self, jti: str) -> bool:
+        if time.monotonic() >= self._next_sync:
+            self._sync()
+        return jti in self._revoked
+    
+    def revoke(self, tokens: Iterable[Dict]) -> None:
+        """Revocar tokens a partir de sus claims (`jti`, `type`, `sub`, `exp`)"""
+        tokens = list(tokens)
+        self.token_repo.add_all(tokens)
+        with self._lock:
+            self._revoked.update((token['jti'], token['exp']) for token in tokens)
+    
+    def _sync(self) -> None:
+        # Si otro hilo ya está sincronizando se responde con la lista actual
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._next_sync = time.monotonic() + self.sync_interval
+            now = time.time()
+            version = self.version_repo.get_versions([TABLA])[TABLA]
+            
+            # Los tokens expirados ya los rechaza la verificación del JWT
+            revoked = {jti: exp for jti, exp in self._revoked.items() if exp > now}
+            if version != self._version:
+                revoked.update(self.token_repo.get_active())
+                self._version = version
+            self._revoked = revoked
+        finally:
+            self._lock.release()
+
+
+token_blocklist = TokenBlocklist()
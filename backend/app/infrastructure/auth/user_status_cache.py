@@ -0,0 +1,85 @@
+"""
+Caché en memoria del estado (activo/inactivo) de los usuarios autenticados.
+
+El `user_lookup_loader` de JWT se ejecuta en cada petición autenticada; sin
+caché cada petición del catálogo haría una consulta extra a `usuarios`.
+La caché es un LRU acotado (`USER_STATUS_CACHE_SIZE` entradas) cuyas entradas
+expiran a los `USER_STATUS_CACHE_TTL` segundos. `UsuarioRepository.update`
+invalida la entrada al cambiar `activo`, así que en el proceso que hace el
+cambio el efecto es inmediato; en los demás workers, como mucho al expirar
+el TTL.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+_MISSING = object()
+
+
+class UserStatusCache:
+    
+    def __init__(self, app=None):
+        self.max_size = 10000
+        self.ttl = 30.0
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app) -> None:
+        self.max_size = app.config['USER_STATUS_CACHE_SIZE']
+        self.ttl = app.config['USER_STATUS_CACHE_TTL']
+        self.clear()
+    
+    def get(self, usuario_id: int, loader: Callable[[int], Optional[bool]]) -> Optional[bool]:
+        """Estado del usuario (None si no existe), llamando a `loader` si no está en caché"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(usuario_id, _MISSING)
+            if entry is not _MISSING and entry[1] > now:
+                self._entries.move_to_end(usuario_id)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        
+        # La consulta se hace fuera del lock para no serializar las peticiones
+        activo = loader(usuario_id)
+        with self._lock:
+            self._entries[usuario_id] = (activo, now + self.ttl)
+            self._entries.move_to_end(usuario_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return activo
+    
+    def invalidate(self, usuario_id: int) -> None:
+        with self._lock:
+            self._entries.pop(usuario_id, None)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+    
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': round(self.hits / total, 4) if total else 0.0
+            }
+
+
+user_status_cache = UserStatusCache()
@@ -0,0 +1,61 @@
+"""
+Engines asíncronos de SQLAlchemy para el modo ASGI (`asgi.py`).
+
+Se crean a partir de la misma configuración que los engines de
+Flask-SQLAlchemy (`SQLALCHEMY_DATABASE_URI`, `DB_REPLICA_URL` y
+`SQLALCHEMY_ENGINE_OPTIONS`), cambiando el driver por su variante asíncrona:
+psycopg 3 sirve para ambos modos; SQLite requiere `aiosqlite`. Las lecturas
+usan la réplica si está configurada, igual que `read_only()` en modo WSGI.
+
+Requiere `greenlet` (dependencia de `sqlalchemy.ext.asyncio`). El módulo sólo
+se importa desde la aplicación ASGI, por lo que los workers WSGI no lo cargan.
+"""
+
+from typing import Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from app.infrastructure.db.routing import REPLICA_BIND
+
+# Driver asíncrono para cada driver (o dialecto sin driver explícito) síncrono
+ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+psycopg',
+    'postgresql+psycopg2': 'postgresql+psycopg',
+    'sqlite': 'sqlite+aiosqlite',
+    'sqlite+pysqlite': 'sqlite+aiosqlite',
+}
+
+
+def async_url(url: str):
+    """URL de SQLAlchemy equivalente con un driver asíncrono"""
+    url = make_url(url)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.drivername, url.drivername))
+
+
+class AsyncDatabase:
+    
+    def __init__(self, app=None):
+        self.engine: Optional[AsyncEngine] = None
+        self.replica_engine: Optional[AsyncEngine] = None
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app) -> None:
+        options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+        self.engine = create_async_engine(async_url(app.config['SQLALCHEMY_DATABASE_URI']), **options)
+        
+        replica_url = app.config.get('SQLALCHEMY_BINDS', {}).get(REPLICA_BIND)
+        self.replica_engine = create_async_engine(async_url(replica_url), **options) if replica_url else None
+    
+    def read_session(self) -> AsyncSession:
+        """Sesión para consultas de sólo lectura (en la réplica, si existe)"""
+        return AsyncSession(self.replica_engine or self.engine, expire_on_commit=False)
+    
+    async def dispose(self) -> None:
+        for engine in (self.engine, self.replica_engine):
+            if engine is not None:
+                await engine.dispose()
+
+
+async_db = AsyncDatabase()
@@ -1,7 +1,53 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import DDL, event
 from datetime import datetime
+from .pool import InstrumentedQueuePool
+from .routing import RoutingSession
 
-db = SQLAlchemy()
+# Las opciones de SQLALCHEMY_ENGINE_OPTIONS (tamaño del pool, timeouts) se
+# aplican sobre este pool instrumentado; ver /api/metrics/pool. La sesión
+# envía las lecturas de sólo lectura a la réplica si está configurada
+db = SQLAlchemy(
+    engine_options={'poolclass': InstrumentedQueuePool},
+    session_options={'class_': RoutingSession}
+)
+
+# Configuración de texto completo: español sin acentos ("presentacion" == "Presentación")
+FULLTEXT_CONFIG = 'es_unaccent'
+
+FULLTEXT_CONFIG_DDL = f"""
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{FULLTEXT_CONFIG}') THEN
+        CREATE TEXT SEARCH CONFIGURATION {FULLTEXT_CONFIG} (COPY = spanish);
+        ALTER TEXT SEARCH CONFIGURATION {FULLTEXT_CONFIG}
+            ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+    END IF;
+END
+$$
+"""
+
+
+def fulltext_column_ddl(tabla: str, pesos: dict) -> list:
+    """Sentencias de la columna `search_vector` generada y su índice GIN para `tabla`"""
+    vector = ' || '.join(
+        f"setweight(to_tsvector('{FULLTEXT_CONFIG}'::regconfig, coalesce({columna}, '')), '{peso}')"
+        for columna, peso in pesos.items()
+    )
+    return [
+        f"ALTER TABLE {tabla} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({vector}) STORED",
+        f"CREATE INDEX IF NOT EXISTS ix_{tabla}_search_vector ON {tabla} USING gin (search_vector)",
+    ]
+
+
+# Extensiones requeridas por los índices de trigramas y la búsqueda de texto completo
+for statement in (
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'CREATE EXTENSION IF NOT EXISTS unaccent',
+    FULLTEXT_CONFIG_DDL,
+):
+    event.listen(db.metadata, 'before_create', DDL(statement).execute_if(dialect='postgresql'))
 
 class BaseModel(db.Model):
     __abstract__ = True
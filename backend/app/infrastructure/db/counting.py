@@ -0,0 +1,139 @@
+"""
+Paginación por número de página con distintas formas de contar el total.
+
+- `exact`: `COUNT(*)` sobre el conjunto filtrado (comportamiento original).
+- `estimate`: en PostgreSQL, `pg_class.reltuples` para listados sin filtros
+  o la estimación del planificador (`EXPLAIN`) para listados filtrados. Si
+  la estimación es pequeña, o el motor no es PostgreSQL, se cuenta exacto.
+- `none`: no se cuenta; se pide una fila extra para saber si hay más páginas.
+
+La página devuelta indica en `count_mode` qué modo produjo el total, que
+puede diferir del solicitado cuando se recurre al conteo exacto.
+"""
+
+import json
+
+from sqlalchemy import func, select, text
+
+from app.infrastructure.db.base import db
+from app.infrastructure.db.pagination import Page
+
+COUNT_EXACT = 'exact'
+COUNT_ESTIMATE = 'estimate'
+COUNT_NONE = 'none'
+COUNT_MODES = (COUNT_EXACT, COUNT_ESTIMATE, COUNT_NONE)
+
+# Por debajo de este valor estimado el COUNT(*) exacto es barato
+EXACT_COUNT_THRESHOLD = 1000
+
+# Cada paso de la paginación es una consulta (tipo, sentencia): el generador la
+# produce y recibe su resultado, de modo que la misma lógica se ejecuta con la
+# sesión de Flask-SQLAlchemy o con una AsyncSession
+ROWS = 'rows'
+SCALAR = 'scalar'
+EXPLAIN = 'explain'
+
+
+def validate_count_mode(count_mode: str) -> str:
+    if count_mode not in COUNT_MODES:
+        raise ValueError(f"Modo de conteo no válido. Valores permitidos: {', '.join(COUNT_MODES)}")
+    return count_mode
+
+
+def count_statement(stmt):
+    """`SELECT count(*)` sobre la sentencia (sin ORDER BY) como subconsulta"""
+    return select(func.count()).select_from(stmt.order_by(None).subquery())
+
+
+def paginate_counted(stmt, model, page: int, per_page: int, count_mode: str = COUNT_EXACT,
+                     filtered: bool = False) -> Page:
+    """Obtener la página `page` de `stmt` (ya ordenada) contando según `count_mode`"""
+    steps = _paginate_steps(stmt, model, page, per_page, count_mode, filtered, db.engine.dialect)
+    try:
+        step = next(steps)
+        while True:
+            step = steps.send(_execute_step(db.session, step))
+    except StopIteration as done:
+        return done.value
+
+
+async def paginate_counted_async(session, stmt, model, page: int, per_page: int,
+                                 count_mode: str = COUNT_EXACT, filtered: bool = False) -> Page:
+    """Igual que `paginate_counted`, con una `AsyncSession`"""
+    steps = _paginate_steps(stmt, model, page, per_page, count_mode, filtered, session.bind.dialect)
+    try:
+        step = next(steps)
+        while True:
+            step = steps.send(await _execute_step_async(session, step))
+    except StopIteration as done:
+        return done.value
+
+
+def _paginate_steps(stmt, model, page, per_page, count_mode, filtered, dialect):
+    offset = (page - 1) * per_page
+    if count_mode == COUNT_EXACT:
+        rows = yield ROWS, stmt.limit(per_page).offset(offset)
+        total = yield SCALAR, count_statement(stmt)
+        return Page(items=rows, total=total, has_more=page * per_page < total, count_mode=COUNT_EXACT)
+    
+    # Pedir una fila extra para saber si existe una página siguiente sin COUNT(*)
+    rows = yield ROWS, stmt.limit(per_page + 1).offset(offset)
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    
+    if count_mode == COUNT_NONE:
+        return Page(items=rows, has_more=has_more, count_mode=COUNT_NONE)
+    
+    # En la última página el total se conoce sin contar
+    if not has_more and (rows or page == 1):
+        return Page(items=rows, total=offset + len(rows), has_more=False, count_mode=COUNT_EXACT)
+    
+    estimate = yield from _estimate_steps(stmt, model, filtered, dialect)
+    if estimate is None or estimate < EXACT_COUNT_THRESHOLD:
+        total = yield SCALAR, count_statement(stmt)
+        return Page(items=rows, total=total, has_more=has_more, count_mode=COUNT_EXACT)
+    
+    # La estimación nunca debe quedar por debajo de lo ya visto
+    total = max(estimate, offset + len(rows) + (1 if has_more else 0))
+    return Page(items=rows, total=total, has_more=has_more, count_mode=COUNT_ESTIMATE)
+
+
+def _estimate_steps(stmt, model, filtered, dialect):
+    """Estimar el número de filas de `stmt`; None si no hay estimación disponible"""
+    if dialect.name != 'postgresql':
+        return None
+    
+    if not filtered:
+        # reltuples vale -1 (o 0) mientras la tabla no se haya analizado
+        reltuples = yield SCALAR, text(
+            'SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:tabla)'
+        ).bindparams(tabla=model.__tablename__)
+        return reltuples if reltuples and reltuples > 0 else None
+    
+    # Estimación del planificador para la consulta filtrada, sin ejecutarla
+    plan = yield EXPLAIN, stmt.order_by(None).compile(dialect=dialect)
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]['Plan']['Plan Rows'])
+    except (LookupError, TypeError, ValueError):
+        return None
+
+
+def _execute_step(session, step):
+    kind, stmt = step
+    if kind == ROWS:
+        return session.execute(stmt).unique().scalars().all()
+    if kind == SCALAR:
+        return session.execute(stmt).scalar()
+    return session.connection().exec_driver_sql('EXPLAIN (FORMAT JSON) ' + stmt.string, stmt.params).scalar()
+
+
+async def _execute_step_async(session, step):
+    kind, stmt = step
+    if kind == ROWS:
+        return (await session.execute(stmt)).unique().scalars().all()
+    if kind == SCALAR:
+        return (await session.execute(stmt)).scalar()
+    connection = await session.connection()
+    return (await connection.exec_driver_sql('EXPLAIN (FORMAT JSON) ' + stmt.string, stmt.params)).scalar()
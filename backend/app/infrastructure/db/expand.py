@@ -0,0 +1,46 @@
+"""
+Relaciones que los endpoints de lectura pueden incluir con `?expand=`.
+
+Cada relación expandida se carga con `selectinload`: una consulta adicional
+`WHERE id IN (...)` con los IDs distintos de la página, así que el número de
+consultas es fijo (1 + relaciones expandidas, más el conteo) sin importar el
+tamaño de la página. Sin `expand` no se toca la relación y no hay cargas
+perezosas por fila.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import selectinload
+
+# Relación expandible de productos -> tabla de la que depende (para el ETag)
+PRODUCTO_EXPANSIONS: Dict[str, str] = {
+    'categoria': 'categorias',
+    'presentacion': 'presentaciones',
+}
+
+
+def parse_expand(expand: Optional[str], allowed: Dict[str, str]) -> Tuple[str, ...]:
+    """Relaciones pedidas en `expand` (separadas por coma), en orden canónico"""
+    if not expand:
+        return ()
+    
+    nombres = {nombre.strip() for nombre in expand.split(',') if nombre.strip()}
+    invalidos = sorted(nombres - allowed.keys())
+    if invalidos:
+        raise ValueError(
+            f"No se puede expandir '{invalidos[0]}'. Valores permitidos: {', '.join(allowed)}"
+        )
+    return tuple(nombre for nombre in allowed if nombre in nombres)
+
+
+def expand_tables(expand: Optional[str], allowed: Dict[str, str]) -> Tuple[str, ...]:
+    """Tablas de las relaciones pedidas; ignora las no válidas (la vista responde 400)"""
+    if not expand:
+        return ()
+    nombres = {nombre.strip() for nombre in expand.split(',')}
+    return tuple(tabla for nombre, tabla in allowed.items() if nombre in nombres)
+
+
+def expand_options(model, expand: Tuple[str, ...]) -> List:
+    """Opciones de carga de la consulta para las relaciones expandidas"""
+    return [selectinload(getattr(model, nombre)) for nombre in expand]
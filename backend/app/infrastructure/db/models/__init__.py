@@ -3,11 +3,15 @@ from .categoria_model import CategoriaModel
 from .presentacion_model import PresentacionModel
 from .producto_model import ProductoModel
 from .usuario_model import UsuarioModel
+from .tabla_version_model import TablaVersionModel
+from .token_revocado_model import TokenRevocadoModel
 
 __all__ = [
     'CategoriaModel',
     'PresentacionModel', 
     'ProductoModel',
-    'UsuarioModel'
+    'UsuarioModel',
+    'TablaVersionModel',
+    'TokenRevocadoModel'
 ]
 
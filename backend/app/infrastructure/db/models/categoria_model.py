@@ -1,5 +1,5 @@
-from ..base import db, BaseModel
-from sqlalchemy import Index, func
+from ..base import db, BaseModel, fulltext_column_ddl
+from sqlalchemy import DDL, Index, event, func
 
 class CategoriaModel(BaseModel):
     __tablename__ = 'categorias'
@@ -10,6 +10,15 @@ class CategoriaModel(BaseModel):
     # Índice case-insensitive para búsquedas
     __table_args__ = (
         Index('ix_categorias_nombre_lower', func.lower(nombre)),
+        # Índice para la paginación por cursor sobre (nombre, id)
+        Index('ix_categorias_nombre_id', 'nombre', 'id'),
+        # Índice de trigramas para búsquedas por subcadena (sólo PostgreSQL)
+        Index(
+            'ix_categorias_nombre_trgm',
+            func.lower(nombre).label('nombre_lower'),
+            postgresql_using='gin',
+            postgresql_ops={'nombre_lower': 'gin_trgm_ops'},
+        ).ddl_if(dialect='postgresql'),
     )
     
     # Relación con productos
@@ -26,3 +35,10 @@ class CategoriaModel(BaseModel):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+
+
+# Columna `search_vector` (tsvector generado y almacenado) para la búsqueda de
+# texto completo. No se mapea en el modelo: sólo existe en PostgreSQL y se
+# consulta desde app/infrastructure/db/search.py.
+for statement in fulltext_column_ddl('categorias', {'nombre': 'A', 'descripcion': 'B'}):
+    event.listen(CategoriaModel.__table__, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
@@ -10,6 +10,15 @@ class PresentacionModel(BaseModel):
     # Índice case-insensitive para búsquedas
     __table_args__ = (
         Index('ix_presentaciones_nombre_lower', func.lower(nombre)),
+        # Índice para la paginación por cursor sobre (nombre, id)
+        Index('ix_presentaciones_nombre_id', 'nombre', 'id'),
+        # Índice de trigramas para búsquedas por subcadena (sólo PostgreSQL)
+        Index(
+            'ix_presentaciones_nombre_trgm',
+            func.lower(nombre).label('nombre_lower'),
+            postgresql_using='gin',
+            postgresql_ops={'nombre_lower': 'gin_trgm_ops'},
+        ).ddl_if(dialect='postgresql'),
     )
     
     # Relación con productos
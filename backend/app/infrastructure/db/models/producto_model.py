@@ -1,6 +1,6 @@
-from ..base import db, BaseModel
+from ..base import db, BaseModel, fulltext_column_ddl
 from decimal import Decimal
-from sqlalchemy import Index, func
+from sqlalchemy import DDL, Index, event, func
 
 class ProductoModel(BaseModel):
     __tablename__ = 'productos'
@@ -13,9 +13,23 @@ class ProductoModel(BaseModel):
     categoria_id = db.Column(db.Integer, db.ForeignKey('categorias.id'), nullable=False)
     presentacion_id = db.Column(db.Integer, db.ForeignKey('presentaciones.id'), nullable=False)
     
-    # Índice case-insensitive para búsquedas
+    # Índice case-insensitive para búsquedas; además garantiza nombres únicos
+    # sin distinguir mayúsculas
     __table_args__ = (
-        Index('ix_productos_nombre_lower', func.lower(nombre)),
+        Index('ix_productos_nombre_lower', func.lower(nombre), unique=True),
+        # Índice para la paginación por cursor sobre (nombre, id)
+        Index('ix_productos_nombre_id', 'nombre', 'id'),
+        # Listados filtrados por categoría o presentación en el orden del
+        # listado; también sirven de índice de cada clave foránea
+        Index('ix_productos_categoria_nombre_id', 'categoria_id', 'nombre', 'id'),
+        Index('ix_productos_presentacion_nombre_id', 'presentacion_id', 'nombre', 'id'),
+        # Índice de trigramas para búsquedas por subcadena (sólo PostgreSQL)
+        Index(
+            'ix_productos_nombre_trgm',
+            func.lower(nombre).label('nombre_lower'),
+            postgresql_using='gin',
+            postgresql_ops={'nombre_lower': 'gin_trgm_ops'},
+        ).ddl_if(dialect='postgresql'),
     )
     
     def __repr__(self):
@@ -34,3 +48,10 @@ class ProductoModel(BaseModel):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+
+
+# Columna `search_vector` (tsvector generado y almacenado) para la búsqueda de
+# texto completo. No se mapea en el modelo: sólo existe en PostgreSQL y se
+# consulta desde app/infrastructure/db/search.py.
+for statement in fulltext_column_ddl('productos', {'nombre': 'A'}):
+    event.listen(ProductoModel.__table__, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
@@ -0,0 +1,91 @@
+from ..base import db
+from sqlalchemy import event, insert, update
+from sqlalchemy.orm import Session
+
+# Tablas con contador de generación: las del catálogo se publican en los ETag
+# de la API y la de tokens revocados sincroniza la lista entre workers
+VERSIONED_TABLES = ('categorias', 'presentaciones', 'productos', 'tokens_revocados')
+
+class TablaVersionModel(db.Model):
+    """Contador de generación por tabla.
+    
+    Cualquier escritura sobre una tabla versionada incrementa su contador en
+    la misma transacción, por lo que la versión sólo cambia cuando cambian
+    los datos visibles de la tabla.
+    """
+    __tablename__ = 'tabla_versiones'
+    
+    tabla = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.BigInteger, default=0, nullable=False)
+    
+    def __repr__(self):
+        return f'<TablaVersion {self.tabla}={self.version}>'
+
+
+@event.listens_for(TablaVersionModel.__table__, 'after_create')
+def _seed_versiones(target, connection, **kw):
+    connection.execute(insert(target), [{'tabla': tabla, 'version': 0} for tabla in VERSIONED_TABLES])
+
+
+def _bump_versions(connection, tablas) -> None:
+    tablas = sorted(set(tablas) & set(VERSIONED_TABLES))
+    if tablas:
+        connection.execute(
+            update(TablaVersionModel.__table__)
+            .where(TablaVersionModel.__table__.c.tabla.in_(tablas))
+            .values(version=TablaVersionModel.__table__.c.version + 1)
+        )
+
+
+# Las tablas escritas se acumulan en `session.info` y su versión se incrementa
+# una sola vez justo antes del COMMIT: la fila de `tabla_versiones` queda
+# bloqueada sólo durante el COMMIT y no desde la primera escritura, así que
+# las escrituras concurrentes sobre la misma tabla no se serializan durante
+# toda la transacción
+_DIRTY_TABLES = 'tablas_versionadas_escritas'
+
+
+def _mark_dirty(session, tablas) -> None:
+    tablas = set(tablas) & set(VERSIONED_TABLES)
+    if tablas:
+        session.info.setdefault(_DIRTY_TABLES, set()).update(tablas)
+
+
+@event.listens_for(Session, 'after_flush')
+def _mark_after_flush(session, flush_context):
+    # En after_flush las colecciones new/dirty/deleted aún reflejan lo escrito
+    tablas = {obj.__tablename__ for obj in session.new}
+    tablas.update(obj.__tablename__ for obj in session.deleted)
+    tablas.update(
+        obj.__tablename__ for obj in session.dirty
+        if session.is_modified(obj, include_collections=False)
+    )
+    _mark_dirty(session, tablas)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _mark_on_bulk_dml(orm_execute_state):
+    # INSERT/UPDATE/DELETE masivos ejecutados con session.execute()
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        tabla = getattr(orm_execute_state.statement.table, 'name', None)
+        _mark_dirty(orm_execute_state.session, [tabla])
+
+
+@event.listens_for(Session, 'before_commit')
+def _bump_before_commit(session):
+    # Un SAVEPOINT (begin_nested) también dispara before_commit: se espera
+    # al COMMIT de la transacción principal
+    if session.in_nested_transaction():
+        return
+    # Un flush pendiente puede agregar tablas: se ejecuta antes de leerlas
+    session.flush()
+    tablas = session.info.pop(_DIRTY_TABLES, None)
+    if tablas:
+        _bump_versions(session.connection(), tablas)
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _clear_dirty(session, transaction):
+    # Tras un ROLLBACK de la transacción principal no queda nada por versionar
+    if transaction.parent is None:
+        session.info.pop(_DIRTY_TABLES, None)
@@ -0,0 +1,19 @@
+from ..base import db
+from datetime import datetime
+
+class TokenRevocadoModel(db.Model):
+    """Token JWT invalidado por un cierre de sesión.
+    
+    La fila sólo es necesaria hasta que el token expira por sí mismo;
+    `expires_at` permite purgar las que ya no pueden usarse.
+    """
+    __tablename__ = 'tokens_revocados'
+    
+    jti = db.Column(db.String(36), primary_key=True)
+    tipo = db.Column(db.String(10), nullable=False)
+    usuario_id = db.Column(db.Integer, db.ForeignKey('usuarios.id'), nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f'<TokenRevocado {self.jti}>'
@@ -1,5 +1,8 @@
 from ..base import db, BaseModel
+from sqlalchemy import CheckConstraint
+from sqlalchemy.orm import validates
 from werkzeug.security import generate_password_hash, check_password_hash
+from app.domain.entities.usuario import normalize_email
 
 class UsuarioModel(BaseModel):
     __tablename__ = 'usuarios'
@@ -9,6 +12,16 @@ class UsuarioModel(BaseModel):
     nombre = db.Column(db.String(100), nullable=False)
     activo = db.Column(db.Boolean, default=True, nullable=False)
     
+    # El email se guarda normalizado para que las búsquedas por igualdad usen
+    # el índice único ix_usuarios_email; la base de datos rechaza lo demás
+    __table_args__ = (
+        CheckConstraint('email = lower(trim(email))', name='ck_usuarios_email_normalizado'),
+    )
+    
+    @validates('email')
+    def _normalize_email(self, key, email):
+        return normalize_email(email) if email else email
+    
     def set_password(self, password):
         self.password_hash = generate_password_hash(password)
     
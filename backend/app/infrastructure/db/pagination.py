@@ -0,0 +1,70 @@
+"""
+Paginación por cursor (keyset) para los repositorios del catálogo.
+
+En lugar de OFFSET/LIMIT, cada página busca directamente a partir del último
+par (nombre, id) visto, por lo que el costo de la página 10.000 es el mismo
+que el de la página 1 siempre que exista un índice sobre (nombre, id).
+"""
+
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import tuple_
+
+from app.infrastructure.db.base import db
+
+
+@dataclass
+class Page:
+    items: List[Any] = field(default_factory=list)
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
+    has_more: Optional[bool] = None
+    count_mode: Optional[str] = None
+
+
+def encode_cursor(nombre: str, item_id: int) -> str:
+    """Codificar la posición (nombre, id) como un cursor opaco"""
+    raw = json.dumps([nombre, item_id], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[str, int]]:
+    """Decodificar un cursor opaco; un cursor vacío indica la primera página"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        nombre, item_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if not isinstance(nombre, str) or not isinstance(item_id, int):
+            raise ValueError
+        return nombre, item_id
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError("El cursor de paginación no es válido")
+
+
+def keyset_statement(stmt, model, after: Optional[str], per_page: int):
+    """Sentencia de la página ordenada por (nombre, id) a partir del cursor `after`"""
+    position = decode_cursor(after)
+    if position:
+        stmt = stmt.filter(tuple_(model.nombre, model.id) > tuple_(*position))
+    
+    # Pedir una fila extra para saber si existe una página siguiente sin COUNT(*)
+    return stmt.order_by(model.nombre, model.id).limit(per_page + 1)
+
+
+def keyset_page(rows: List[Any], per_page: int) -> Tuple[List[Any], Optional[str]]:
+    """Recortar la fila extra de `keyset_statement` y calcular el cursor siguiente"""
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    
+    next_cursor = encode_cursor(rows[-1].nombre, rows[-1].id) if has_more else None
+    return rows, next_cursor
+
+
+def keyset_paginate(stmt, model, after: Optional[str], per_page: int) -> Tuple[List[Any], Optional[str]]:
+    """Obtener una página ordenada por (nombre, id) a partir del cursor `after`"""
+    rows = db.session.scalars(keyset_statement(stmt, model, after, per_page)).all()
+    return keyset_page(rows, per_page)
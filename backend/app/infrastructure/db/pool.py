@@ -0,0 +1,117 @@
+"""
+Pool de conexiones instrumentado.
+
+`InstrumentedQueuePool` es un `QueuePool` de SQLAlchemy que registra cuánto
+espera cada checkout (incluida la apertura de conexiones nuevas), cuántos
+agotan `pool_timeout` y el máximo de conexiones prestadas a la vez. Junto con
+el estado del pool (tamaño, prestadas, overflow) permite dimensionar
+`DB_POOL_SIZE`/`DB_MAX_OVERFLOW` según la cantidad de workers y ver cuándo el
+pool se agota.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+# Límites superiores (ms) de los buckets del histograma de espera
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    """Contadores de checkout de un pool, seguros entre hilos"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.max_checked_out = 0
+        # Un contador por bucket más el de valores por encima del último límite
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+    
+    def observe(self, wait_ms: float, checked_out: int, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+                self.max_checked_out = max(self.max_checked_out, checked_out)
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            self.wait_buckets[bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.checkouts + self.timeouts
+            # Histograma acumulado, como los de Prometheus: checkouts que
+            # esperaron `le` ms o menos
+            histograma = []
+            acumulado = 0
+            for limite, cantidad in zip(WAIT_BUCKETS_MS + ('+Inf',), self.wait_buckets):
+                acumulado += cantidad
+                histograma.append({'le': limite, 'count': acumulado})
+            return {
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'max_checked_out': self.max_checked_out,
+                'wait_mean_ms': round(self.wait_total_ms / total, 3) if total else 0.0,
+                'wait_max_ms': round(self.wait_max_ms, 3),
+                'wait_histogram_ms': histograma
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    
+    def __init__(self, *args, metrics: PoolMetrics = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics or PoolMetrics()
+        self._in_checkout = threading.local()
+    
+    def _do_get(self):
+        # QueuePool._do_get se llama a sí mismo al reintentar; sólo se mide la
+        # llamada externa
+        if getattr(self._in_checkout, 'value', False):
+            return super()._do_get()
+        
+        self._in_checkout.value = True
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.observe((time.perf_counter() - start) * 1000, self.checkedout(), timed_out=True)
+            raise
+        finally:
+            self._in_checkout.value = False
+        self.metrics.observe((time.perf_counter() - start) * 1000, self.checkedout())
+        return record
+    
+    def recreate(self) -> 'InstrumentedQueuePool':
+        # engine.dispose() recrea el pool: conservar las métricas acumuladas
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def pool_status(pool) -> Dict[str, Any]:
+    """Estado actual y métricas acumuladas de un pool de conexiones"""
+    if not isinstance(pool, QueuePool):
+        return {'pool_class': type(pool).__name__}
+    
+    status = {
+        'pool_class': type(pool).__name__,
+        'size': pool.size(),
+        'checked_out': pool.checkedout(),
+        'checked_in': pool.checkedin(),
+        # Negativo mientras no se hayan abierto todas las conexiones del pool
+        'overflow': pool.overflow(),
+        'max_overflow': pool._max_overflow,
+        'timeout_seconds': pool.timeout()
+    }
+    if isinstance(pool, InstrumentedQueuePool):
+        status.update(pool.metrics.snapshot())
+    return status
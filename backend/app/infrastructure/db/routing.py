@@ -0,0 +1,66 @@
+"""
+Enrutamiento de lecturas a la réplica de la base de datos.
+
+Si se configura una réplica (`DB_REPLICA_URL`, bind `replica`), las consultas
+que se ejecutan dentro de `read_only()` (o de un método decorado con
+`@replica_read`) usan la réplica. Todo lo demás va al primario:
+
+- escrituras (flush del ORM e INSERT/UPDATE/DELETE explícitos);
+- cualquier lectura de una sesión que ya escribió, para que una petición lea
+  lo que acaba de escribir aunque la réplica tenga retraso.
+
+Sin réplica configurada todo va al primario y los decoradores no tienen efecto.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+REPLICA_BIND = 'replica'
+
+_read_only: ContextVar[bool] = ContextVar('db_read_only', default=False)
+
+
+@contextmanager
+def read_only():
+    """Ejecutar las consultas del bloque en la réplica (si existe)"""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+def replica_read(method):
+    """Decorador para casos de uso de sólo lectura"""
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        with read_only():
+            return method(*args, **kwargs)
+    return wrapper
+
+
+class RoutingSession(Session):
+    """Sesión de Flask-SQLAlchemy que envía las lecturas de sólo lectura a la réplica"""
+    
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and _read_only.get() and not self._flushing and not self.info.get('wrote'):
+            if clause is None or not getattr(clause, 'is_dml', False):
+                replica = self._db.engines.get(REPLICA_BIND)
+                if replica is not None:
+                    return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _mark_wrote_on_flush(session, flush_context):
+    session.info['wrote'] = True
+
+
+@event.listens_for(RoutingSession, 'do_orm_execute')
+def _mark_wrote_on_dml(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info['wrote'] = True
@@ -0,0 +1,59 @@
+"""
+Búsqueda por subcadena sobre la columna `nombre` de los repositorios.
+
+El filtro se expresa como `lower(nombre) LIKE '%term%'` con el término ya
+normalizado en Python. En PostgreSQL esa expresión coincide con los índices
+GIN `pg_trgm` (`ix_<tabla>_nombre_trgm`), por lo que la búsqueda no recorre
+la tabla completa; los trigramas sólo filtran a partir de 3 caracteres.
+En otros motores el mismo filtro funciona sin índice.
+
+El modo `fulltext` usa la columna generada `search_vector` (configuración
+`es_unaccent`: español sin acentos) con su índice GIN y ordena por relevancia
+con `ts_rank_cd`. Fuera de PostgreSQL se degrada a búsqueda por subcadena
+ordenada por nombre.
+"""
+
+from sqlalchemy import func, literal_column
+
+from app.infrastructure.db.base import db, FULLTEXT_CONFIG
+
+SEARCH_MODE_SUBSTRING = 'substring'
+SEARCH_MODE_FULLTEXT = 'fulltext'
+SEARCH_MODES = (SEARCH_MODE_SUBSTRING, SEARCH_MODE_FULLTEXT)
+
+
+def escape_like(term: str, escape: str = '\\') -> str:
+    """Escapar los comodines de LIKE para buscar el texto literal"""
+    return (term.replace(escape, escape * 2)
+                .replace('%', escape + '%')
+                .replace('_', escape + '_'))
+
+
+def apply_search(query, model, search: str):
+    """Filtrar `query` por subcadena (case-insensitive) sobre `model.nombre`"""
+    if not search or not search.strip():
+        return query
+
+    pattern = f"%{escape_like(search.strip().lower())}%"
+    return query.filter(func.lower(model.nombre).like(pattern, escape='\\'))
+
+
+def validate_search_mode(search_mode: str) -> str:
+    if search_mode not in SEARCH_MODES:
+        raise ValueError(f"Modo de búsqueda no válido. Valores permitidos: {', '.join(SEARCH_MODES)}")
+    return search_mode
+
+
+def apply_fulltext(query, model, search: str):
+    """Filtrar por texto completo y ordenar por relevancia (más relevante primero)"""
+    if not search or not search.strip():
+        return query.order_by(model.nombre)
+
+    if db.engine.dialect.name != 'postgresql':
+        return apply_search(query, model, search).order_by(model.nombre)
+
+    vector = literal_column(f'{model.__tablename__}.search_vector')
+    tsquery = func.websearch_to_tsquery(literal_column(f"'{FULLTEXT_CONFIG}'::regconfig"), search.strip())
+    return (query
+            .filter(vector.op('@@')(tsquery))
+            .order_by(func.ts_rank_cd(vector, tsquery).desc(), model.nombre, model.id))
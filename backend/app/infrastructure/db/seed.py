@@ -0,0 +1,177 @@
+"""
+Carga rápida de un catálogo sintético (`flask seed`).
+
+Los datos son deterministas: con la misma `semilla` y el mismo estado inicial
+de las tablas se generan exactamente las mismas filas. Cada tabla se completa
+hasta el total pedido (sólo se agregan filas, nunca se borran), así que
+volver a ejecutar el comando con un total mayor continúa donde quedó. Los
+nombres sintéticos terminan en un número correlativo; la numeración sigue al
+mayor número existente (no a la cantidad de filas), así que borrar filas
+generadas no produce nombres repetidos.
+
+Los productos se escriben por lotes de `batch_size` filas, con un commit por
+lote:
+  - en PostgreSQL con psycopg 3, mediante `COPY productos (...) FROM STDIN`
+    (sin una sentencia ni parámetros por fila)
+  - en otros motores, con INSERT de varias filas (`insert(...)` con una lista)
+
+COPY no pasa por los eventos de la sesión, por lo que al terminar se
+incrementa la versión de `productos` en `tabla_versiones` (los ETag de los
+listados cambian) y en PostgreSQL se ejecuta ANALYZE para que el planificador
+conozca el nuevo tamaño de la tabla.
+"""
+
+import random
+from datetime import datetime
+from decimal import Decimal
+from itertools import islice
+from typing import Callable, Iterator, List, Optional
+
+from sqlalchemy import Integer, cast, func, insert, select, text
+
+from app.infrastructure.db.base import db
+from app.infrastructure.db.models import CategoriaModel, PresentacionModel, ProductoModel
+from app.infrastructure.db.models.tabla_version_model import _bump_versions
+
+TIPOS = (
+    'Arroz', 'Aceite', 'Leche', 'Café', 'Azúcar', 'Harina', 'Galletas', 'Jabón', 'Detergente', 'Atún',
+    'Pasta', 'Salsa', 'Cereal', 'Yogur', 'Queso', 'Jugo', 'Té', 'Chocolate', 'Avena', 'Mermelada',
+)
+VARIANTES = (
+    'Integral', 'Light', 'Premium', 'Clásico', 'Orgánico', 'Tradicional', 'Familiar', 'Extra', 'Natural',
+    'Económico', 'Sin Azúcar', 'Gourmet',
+)
+
+# Filas generadas con el mismo generador aleatorio
+_BLOQUE = 1000
+
+# Dígitos del número correlativo al final de cada nombre
+_DIGITOS_PRODUCTO = 8
+_DIGITOS_CATALOGO = 5
+
+_COPY_PRODUCTOS = (
+    'COPY productos (nombre, precio, activo, categoria_id, presentacion_id, created_at, updated_at) FROM STDIN'
+)
+
+
+class CatalogSeeder:
+    """Genera y carga categorías, presentaciones y productos sintéticos (requiere app context)"""
+    
+    def __init__(self, semilla: int = 0, batch_size: int = 50_000):
+        self.semilla = semilla
+        self.batch_size = batch_size
+        self.session = db.session
+        bind = self.session.get_bind(mapper=ProductoModel)
+        self.use_copy = bind.dialect.name == 'postgresql' and bind.dialect.driver == 'psycopg'
+    
+    def seed_categorias(self, total: int) -> int:
+        """Completar `categorias` hasta `total` filas. Devuelve cuántas se agregaron"""
+        return self._seed_catalogo(CategoriaModel, 'Categoría', total)
+    
+    def seed_presentaciones(self, total: int) -> int:
+        """Completar `presentaciones` hasta `total` filas. Devuelve cuántas se agregaron"""
+        return self._seed_catalogo(PresentacionModel, 'Presentación', total)
+    
+    def seed_productos(self, total: int, on_batch: Optional[Callable[[int], None]] = None) -> int:
+        """Completar `productos` hasta `total` filas, llamando a `on_batch(filas)` tras cada lote"""
+        actuales = self.count(ProductoModel)
+        if actuales >= total:
+            return 0
+        
+        categoria_ids = self._ids(CategoriaModel)
+        presentacion_ids = self._ids(PresentacionModel)
+        if not categoria_ids or not presentacion_ids:
+            raise ValueError("Se necesitan categorías y presentaciones antes de generar productos")
+        
+        ahora = datetime.utcnow()
+        primero = self._ultimo_numero(ProductoModel, _DIGITOS_PRODUCTO)
+        faltantes = total - actuales
+        filas_generadas = self._productos(primero, primero + faltantes, categoria_ids, presentacion_ids, ahora)
+        for inicio in range(0, faltantes, self.batch_size):
+            filas = list(islice(filas_generadas, min(self.batch_size, faltantes - inicio)))
+            if self.use_copy:
+                self._copy_productos(filas)
+            else:
+                self._insert_productos(filas)
+            self.session.commit()
+            if on_batch:
+                on_batch(len(filas))
+        
+        self._finish_bulk_load()
+        return faltantes
+    
+    def _productos(self, inicio: int, fin: int, categoria_ids: List[int], presentacion_ids: List[int],
+                   ahora: datetime) -> Iterator[tuple]:
+        # Un generador por bloque fijo de filas: el contenido de cada fila
+        # depende sólo de la semilla y de su número, no del tamaño del lote
+        # ni de en cuántas ejecuciones se completó la tabla
+        for bloque in range(inicio // _BLOQUE, (fin - 1) // _BLOQUE + 1):
+            rng = random.Random(f'{self.semilla}:productos:{bloque}')
+            for i in range(bloque * _BLOQUE + 1, (bloque + 1) * _BLOQUE + 1):
+                fila = (
+                    f'{rng.choice(TIPOS)} {rng.choice(VARIANTES)} {i:0{_DIGITOS_PRODUCTO}d}',
+                    Decimal(rng.randint(100, 99_999)) / 100,
+                    rng.random() < 0.95,
+                    rng.choice(categoria_ids),
+                    rng.choice(presentacion_ids),
+                    ahora,
+                    ahora,
+                )
+                if inicio < i <= fin:
+                    yield fila
+    
+    def _seed_catalogo(self, model, prefijo: str, total: int) -> int:
+        actuales = self.count(model)
+        if actuales >= total:
+            return 0
+        
+        primero = self._ultimo_numero(model, _DIGITOS_CATALOGO, prefijo)
+        ultimo = primero + total - actuales
+        for inicio in range(primero, ultimo, self.batch_size):
+            fin = min(inicio + self.batch_size, ultimo)
+            self.session.execute(insert(model), [
+                {'nombre': f'{prefijo} {i:0{_DIGITOS_CATALOGO}d}', 'descripcion': f'{prefijo} sintética número {i}'}
+                for i in range(inicio + 1, fin + 1)
+            ])
+            self.session.commit()
+        return total - actuales
+    
+    def _copy_productos(self, filas: List[tuple]) -> None:
+        # El cursor de psycopg comparte la conexión (y la transacción) de la sesión
+        driver_connection = self.session.connection().connection.driver_connection
+        with driver_connection.cursor() as cursor:
+            with cursor.copy(_COPY_PRODUCTOS) as copy:
+                for fila in filas:
+                    copy.write_row(fila)
+    
+    def _insert_productos(self, filas: List[tuple]) -> None:
+        columnas = ('nombre', 'precio', 'activo', 'categoria_id', 'presentacion_id', 'created_at', 'updated_at')
+        self.session.execute(insert(ProductoModel), [dict(zip(columnas, fila)) for fila in filas])
+    
+    def _finish_bulk_load(self) -> None:
+        if not self.use_copy:
+            return
+        _bump_versions(self.session.connection(), ['productos'])
+        self.session.commit()
+        self.session.execute(text('ANALYZE productos'))
+        self.session.commit()
+    
+    def count(self, model) -> int:
+        """Filas actuales de la tabla de `model`"""
+        return self.session.scalar(select(func.count()).select_from(model))
+    
+    def _ultimo_numero(self, model, digitos: int, prefijo: Optional[str] = None) -> int:
+        """Mayor número correlativo de los nombres generados (0 si no hay ninguno)"""
+        nombre = model.nombre
+        if self.session.get_bind(mapper=model).dialect.name == 'postgresql':
+            generado = nombre.op('~')(f' [0-9]{{{digitos}}}$')
+        else:
+            generado = nombre.op('GLOB')('* ' + '[0-9]' * digitos)
+        condiciones = [generado]
+        if prefijo is not None:
+            condiciones.append(nombre.startswith(f'{prefijo} ', autoescape=True))
+        numero = cast(func.substr(nombre, func.length(nombre) - digitos + 1), Integer)
+        return self.session.scalar(select(func.max(numero)).where(*condiciones)) or 0
+    
+    def _ids(self, model) -> List[int]:
+        return list(self.session.scalars(select(model.id).order_by(model.id)))
@@ -0,0 +1,80 @@
+"""
+`statement_timeout` de PostgreSQL sólo para las consultas de las peticiones web.
+
+El límite (`DB_STATEMENT_TIMEOUT_MS`) evita que una consulta descontrolada
+ocupe un worker indefinidamente, pero no debe alcanzar a las tareas largas
+legítimas: migraciones (`CREATE INDEX CONCURRENTLY`, rellenos de datos),
+`flask seed` y demás comandos. Por eso no se fija al abrir la conexión sino
+al comenzar cada transacción de una sesión:
+
+  - dentro de una petición de Flask (WSGI o vistas ASGI) se envía
+    `SET LOCAL statement_timeout = <ms>`
+  - dentro de un comando de `flask` se envía `SET LOCAL statement_timeout = 0`,
+    que anula también un valor por defecto del rol o de la base de datos
+  - en cualquier otro caso no se envía nada
+
+`SET LOCAL` vale hasta el COMMIT o ROLLBACK, así que la conexión vuelve al
+pool sin el límite. El costo es una sentencia más por transacción de una
+petición. Las vistas con operaciones largas legítimas (exportación en
+streaming, cambios masivos por filtro) se marcan con
+`@without_statement_timeout`. Las migraciones no usan la sesión: `migrations/env.py`
+quita el límite de su conexión. En otros motores no se envía nada.
+"""
+
+from functools import wraps
+
+import click
+from flask import g, has_request_context
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.base import db
+
+
+def _supports_statement_timeout(dialect) -> bool:
+    return dialect.name == 'postgresql'
+
+
+class StatementTimeout:
+    
+    def __init__(self, app=None):
+        self.timeout_ms = 0
+        self._listening = False
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app) -> None:
+        self.timeout_ms = app.config['DB_STATEMENT_TIMEOUT_MS']
+        if not self._listening:
+            event.listen(Session, 'after_begin', self._after_begin)
+            self._listening = True
+    
+    def _after_begin(self, session, transaction, connection) -> None:
+        if not _supports_statement_timeout(connection.dialect):
+            return
+        if has_request_context():
+            if self.timeout_ms <= 0 or g.get('sin_statement_timeout'):
+                return
+            timeout_ms = self.timeout_ms
+        elif click.get_current_context(silent=True) is not None:
+            timeout_ms = 0
+        else:
+            return
+        connection.exec_driver_sql(f'SET LOCAL statement_timeout = {int(timeout_ms)}')
+
+
+def without_statement_timeout(view):
+    """Decorador para vistas con operaciones largas legítimas: sin límite en la petición"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        g.sin_statement_timeout = True
+        # Las consultas previas a la vista (JWT, tokens revocados) pueden haber
+        # abierto ya la transacción con el límite
+        session = db.session()
+        if session.in_transaction() and _supports_statement_timeout(session.get_bind().dialect):
+            session.execute(text('SET LOCAL statement_timeout = 0'))
+        return view(*args, **kwargs)
+    return wrapper
+
+
+statement_timeout = StatementTimeout()
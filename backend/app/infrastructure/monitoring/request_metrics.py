@@ -0,0 +1,282 @@
+"""
+Métricas por petición en formato Prometheus.
+
+`RequestMetrics` registra hooks de Flask que miden cada petición (latencia
+por endpoint, código de respuesta, peticiones en curso) y escucha los eventos
+de cursor de SQLAlchemy para contar las consultas y el tiempo en la base de
+datos de la petición en curso. Cada respuesta lleva un encabezado
+`Server-Timing` (`db` y `app`, visible en las herramientas del navegador) y
+las peticiones que superan `QUERY_BUDGET_PER_REQUEST` consultas se cuentan y
+se registran en el log, lo que delata los patrones N+1.
+
+El estado de la petición vive en una ContextVar, así que funciona igual con
+hilos (WSGI) y con corrutinas (modo ASGI, donde las consultas asíncronas
+disparan los mismos eventos). Los contadores son del proceso: con varios
+workers Prometheus debe consultar cada uno o sumar por instancia.
+
+El costo por petición son unas pocas lecturas del reloj y una actualización
+de diccionarios bajo un lock; `benchmarks/bench_metrics.py` lo mide.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from flask import request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Límites superiores (segundos) de los buckets de latencia
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Límites superiores de los buckets de consultas SQL por petición
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+# Endpoint de las peticiones que no coinciden con ninguna ruta (404, 405)
+UNMATCHED_ENDPOINT = '<sin ruta>'
+
+
+class _RequestStats:
+    """Mediciones de la petición en curso"""
+    
+    __slots__ = ('start', 'queries', 'db_seconds', 'recorded')
+    
+    def __init__(self, start: float):
+        self.start = start
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.recorded = False
+
+
+_current: ContextVar[Optional[_RequestStats]] = ContextVar('request_stats', default=None)
+
+
+class Histogram:
+    """Histograma acumulable al estilo Prometheus (buckets, suma y cantidad)"""
+    
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+    
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        # Un contador por bucket más el de valores por encima del último límite
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+    
+    def cumulative(self) -> List[Tuple[str, int]]:
+        acumulado = 0
+        samples = []
+        for limite, cantidad in zip(self.buckets + (float('inf'),), self.counts):
+            acumulado += cantidad
+            samples.append((_format_value(limite), acumulado))
+        return samples
+
+
+class RequestMetrics:
+    
+    def __init__(self, app=None):
+        self.enabled = True
+        self.query_budget = 0
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        # (método, endpoint, estado) -> peticiones
+        self._requests: Dict[Tuple[str, str, int], int] = {}
+        # (método, endpoint) -> histograma de latencia en segundos
+        self._latency: Dict[Tuple[str, str], Histogram] = {}
+        # endpoint -> histograma de consultas por petición
+        self._queries: Dict[str, Histogram] = {}
+        # endpoint -> segundos en la base de datos
+        self._db_seconds: Dict[str, float] = {}
+        # endpoint -> peticiones por encima del presupuesto de consultas
+        self._over_budget: Dict[str, int] = {}
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app) -> None:
+        self.enabled = app.config['METRICS_ENABLED']
+        self.query_budget = app.config['QUERY_BUDGET_PER_REQUEST']
+        if not self.enabled:
+            return
+        
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+        _listen_engine_events()
+    
+    def _before_request(self) -> None:
+        _current.set(_RequestStats(time.perf_counter()))
+        with self._lock:
+            self.in_flight += 1
+    
+    def _after_request(self, response):
+        stats = _current.get()
+        if stats is None or stats.recorded:
+            return response
+        stats.recorded = True
+        
+        elapsed = time.perf_counter() - stats.start
+        response.headers['Server-Timing'] = (
+            f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.queries} consultas", '
+            f'app;dur={elapsed * 1000:.2f}'
+        )
+        
+        # Un solo acceso al proxy `request` (cada acceso cuesta una búsqueda de contexto)
+        req = request._get_current_object()
+        over_budget = 0 < self.query_budget < stats.queries
+        self.observe(req.method, req.endpoint or UNMATCHED_ENDPOINT, response.status_code, elapsed,
+                     stats.queries, stats.db_seconds, over_budget)
+        
+        if over_budget:
+            logger.warning(
+                "Presupuesto de consultas excedido: %s %s ejecutó %d consultas (límite %d)",
+                req.method, req.path, stats.queries, self.query_budget,
+                extra={'endpoint': req.endpoint, 'queries': stats.queries}
+            )
+        return response
+    
+    def _teardown_request(self, exc) -> None:
+        if _current.get() is None:
+            return
+        _current.set(None)
+        with self._lock:
+            self.in_flight -= 1
+    
+    def observe(self, method: str, endpoint: str, status: int, seconds: float,
+                queries: int, db_seconds: float, over_budget: bool = False) -> None:
+        """Acumular una petición terminada"""
+        with self._lock:
+            key = (method, endpoint, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            
+            latency = self._latency.get((method, endpoint))
+            if latency is None:
+                latency = self._latency[(method, endpoint)] = Histogram(LATENCY_BUCKETS)
+            latency.observe(seconds)
+            
+            histogram = self._queries.get(endpoint)
+            if histogram is None:
+                histogram = self._queries[endpoint] = Histogram(QUERY_BUCKETS)
+            histogram.observe(queries)
+            self._db_seconds[endpoint] = self._db_seconds.get(endpoint, 0.0) + db_seconds
+            
+            if over_budget:
+                self._over_budget[endpoint] = self._over_budget.get(endpoint, 0) + 1
+    
+    def render(self) -> str:
+        """Métricas acumuladas en el formato de texto de Prometheus"""
+        with self._lock:
+            requests = sorted(self._requests.items())
+            latency = sorted((key, _copy(h)) for key, h in self._latency.items())
+            queries = sorted((key, _copy(h)) for key, h in self._queries.items())
+            db_seconds = sorted(self._db_seconds.items())
+            over_budget = sorted(self._over_budget.items())
+            in_flight = self.in_flight
+        
+        lines = []
+        _family(lines, 'http_requests_total', 'counter', 'Peticiones HTTP atendidas')
+        for (method, endpoint, status), total in requests:
+            lines.append(f'http_requests_total{_labels(method=method, endpoint=endpoint, status=status)} {total}')
+        
+        _family(lines, 'http_requests_in_flight', 'gauge', 'Peticiones HTTP en curso')
+        lines.append(f'http_requests_in_flight {in_flight}')
+        
+        _family(lines, 'http_request_duration_seconds', 'histogram', 'Latencia de las peticiones HTTP')
+        for (method, endpoint), histogram in latency:
+            _histogram(lines, 'http_request_duration_seconds', histogram, method=method, endpoint=endpoint)
+        
+        _family(lines, 'http_request_db_queries', 'histogram', 'Consultas SQL por petición')
+        for endpoint, histogram in queries:
+            _histogram(lines, 'http_request_db_queries', histogram, endpoint=endpoint)
+        
+        _family(lines, 'http_request_db_seconds_total', 'counter', 'Tiempo en la base de datos de las peticiones')
+        for endpoint, seconds in db_seconds:
+            lines.append(f'http_request_db_seconds_total{_labels(endpoint=endpoint)} {_format_value(seconds)}')
+        
+        _family(lines, 'http_requests_over_query_budget_total', 'counter',
+                'Peticiones que superaron el presupuesto de consultas SQL')
+        for endpoint, total in over_budget:
+            lines.append(f'http_requests_over_query_budget_total{_labels(endpoint=endpoint)} {total}')
+        return '\n'.join(lines) + '\n'
+
+
+def render_family(name: str, kind: str, help_text: str, samples: List[Tuple[Dict[str, object], float]]) -> str:
+    """Una familia de métricas con etiquetas (p. ej. el estado del pool) en formato Prometheus"""
+    lines = []
+    _family(lines, name, kind, help_text)
+    for labels, value in samples:
+        lines.append(f'{name}{_labels(**labels)} {_format_value(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+def _copy(histogram: Histogram) -> Histogram:
+    copia = Histogram(histogram.buckets)
+    copia.counts = list(histogram.counts)
+    copia.sum = histogram.sum
+    copia.count = histogram.count
+    return copia
+
+
+def _family(lines: List[str], name: str, kind: str, help_text: str) -> None:
+    lines.append(f'# HELP {name} {help_text}')
+    lines.append(f'# TYPE {name} {kind}')
+
+
+def _histogram(lines: List[str], name: str, histogram: Histogram, **labels) -> None:
+    for limite, acumulado in histogram.cumulative():
+        lines.append(f'{name}_bucket{_labels(**labels, le=limite)} {acumulado}')
+    lines.append(f'{name}_sum{_labels(**labels)} {_format_value(histogram.sum)}')
+    lines.append(f'{name}_count{_labels(**labels)} {histogram.count}')
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{nombre}="{_escape(valor)}"' for nombre, valor in labels.items()) + '}'
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+_events_registered = False
+
+
+def _listen_engine_events() -> None:
+    """Medir las consultas de todos los engines (también los asíncronos) una sola vez por proceso"""
+    global _events_registered
+    if _events_registered:
+        return
+    event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+    _events_registered = True
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current.get() is not None:
+        context._metrics_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    start = getattr(context, '_metrics_start', None)
+    if stats is not None and start is not None:
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - start
+
+
+request_metrics = RequestMetrics()
@@ -0,0 +1,247 @@
+"""
+Logs estructurados (un objeto JSON por línea) sin E/S en el hilo de la petición.
+
+`StructuredLogging` instala en el logger raíz un `QueueHandler` que sólo
+prepara el registro y lo encola sin bloquear; un `QueueListener` en un hilo
+aparte lo formatea y lo escribe en stderr. Así una escritura lenta en stdout
+o stderr (un pipe lleno, un recolector de logs atrasado) no frena a los hilos
+de los workers. Si la cola (`LOG_QUEUE_SIZE`) se llena, los registros se
+descartan y se cuentan en `dropped` (expuesto en /api/metrics) en lugar de
+esperar.
+
+Antes de encolar, cada registro pasa por:
+  - el nivel del logger: `LOG_LEVEL` para todos y `LOG_LEVELS` por logger
+    (`app.interface.blueprints.auth_bp=DEBUG,sqlalchemy.engine=INFO`)
+  - el muestreo de DEBUG: con `LOG_DEBUG_SAMPLE_RATE=0.1` se conserva uno de
+    cada diez eventos de depuración; INFO y superiores nunca se muestrean
+  - la redacción: los campos con nombre sensible (`authorization`,
+    `access_token`, `password`, ...) y los tokens Bearer/JWT dentro del
+    mensaje o de la traza se reemplazan por `[REDACTED]`
+
+Los módulos usan `logging.getLogger(__name__)`; los datos adicionales van en
+`extra={...}` y aparecen como campos del JSON. `LOG_FORMAT=text` escribe
+líneas legibles en lugar de JSON (desarrollo), con la misma cola y redacción.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import random
+import re
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+REDACTED = '[REDACTED]'
+
+# Campos (de `extra` o de diccionarios anidados) cuyo valor nunca se escribe
+SENSITIVE_KEYS = frozenset({
+    'authorization', 'access_token', 'refresh_token', 'token', 'password', 'cookie', 'set-cookie',
+})
+
+# Tokens dentro de textos libres: encabezados Bearer, JWT sueltos y pares
+# `clave: valor` de un diccionario formateado (p. ej. un resultado en un mensaje)
+_SECRET_PATTERNS = (
+    (re.compile(r'(Bearer\s+)[^\s\'",]+', re.IGNORECASE), r'\1' + REDACTED),
+    (re.compile(r'eyJ[\w-]+\.[\w-]+\.[\w-]*'), REDACTED),
+    (re.compile(r"""(['"]?(?:access_token|refresh_token|password)['"]?\s*[:=]\s*)(['"]?)[^'"\s,}]+\2""",
+                re.IGNORECASE), r'\1\2' + REDACTED + r'\2'),
+)
+
+# Filtro previo: la mayoría de los mensajes no contiene nada que redactar
+_MAY_CONTAIN_SECRET = re.compile(r'eyJ|bearer|token|password', re.IGNORECASE)
+
+# Atributos propios de LogRecord; el resto vino en `extra`
+_RECORD_ATTRS = frozenset(logging.LogRecord('', 0, '', 0, '', (), None).__dict__) | {'message', 'asctime'}
+
+TEXT_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+
+
+def redact(value):
+    """Copia de `value` sin secretos (textos, diccionarios y secuencias anidadas)"""
+    if isinstance(value, str):
+        if not _MAY_CONTAIN_SECRET.search(value):
+            return value
+        for pattern, replacement in _SECRET_PATTERNS:
+            value = pattern.sub(replacement, value)
+        return value
+    if isinstance(value, dict):
+        return {
+            clave: REDACTED if str(clave).lower() in SENSITIVE_KEYS and valor else redact(valor)
+            for clave, valor in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [redact(valor) for valor in value]
+    return value
+
+
+def parse_levels(value: Optional[str]) -> Dict[str, int]:
+    """`logger=NIVEL,...` -> {logger: nivel}"""
+    levels = {}
+    for item in (value or '').split(','):
+        nombre, _, nivel = item.partition('=')
+        if not nombre.strip():
+            continue
+        level = logging.getLevelName(nivel.strip().upper())
+        if not isinstance(level, int):
+            raise ValueError(f"Nivel de log no válido para '{nombre.strip()}': '{nivel.strip()}'")
+        levels[nombre.strip()] = level
+    return levels
+
+
+class JsonFormatter(logging.Formatter):
+    """Un objeto JSON por registro: ts, level, logger, message, los campos de `extra` y exc"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for clave, valor in record.__dict__.items():
+            if clave not in _RECORD_ATTRS and clave not in data:
+                data[clave] = valor
+        if record.exc_text:
+            data['exc'] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Conservar sólo una fracción `rate` de los registros de nivel DEBUG o inferior"""
+    
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or self.rate >= 1 or random.random() < self.rate
+
+
+class _RedactingQueueHandler(QueueHandler):
+    """Encola una copia del registro ya resuelta y sin secretos, sin bloquear nunca"""
+    
+    def __init__(self, log_queue: queue.Queue, pipeline: 'StructuredLogging'):
+        super().__init__(log_queue)
+        self.pipeline = pipeline
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Se resuelve aquí (y no en el hilo escritor) para que los argumentos
+        # mutables se lean en su estado actual y los secretos no lleguen a la cola
+        prepared = copy.copy(record)
+        for clave in record.__dict__.keys() - _RECORD_ATTRS:
+            valor = record.__dict__[clave]
+            prepared.__dict__[clave] = REDACTED if clave.lower() in SENSITIVE_KEYS and valor else redact(valor)
+        prepared.msg = redact(record.getMessage())
+        prepared.args = None
+        prepared.exc_info = None
+        prepared.stack_info = None
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = logging.Formatter().formatException(record.exc_info)
+        if record.stack_info:
+            exc_text = f'{exc_text}\n{record.stack_info}' if exc_text else record.stack_info
+        prepared.exc_text = redact(exc_text) if exc_text else None
+        return prepared
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.pipeline.listener_pending:
+            self.pipeline.start_pending_listener()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.pipeline.record_dropped()
+
+
+class StructuredLogging:
+    
+    def __init__(self, app=None):
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._queue_size = 0
+        self._output: Optional[logging.Handler] = None
+        self._handler: Optional[_RedactingQueueHandler] = None
+        self._listener: Optional[QueueListener] = None
+        # Tras un fork el hilo escritor se crea con el primer registro del hijo
+        self.listener_pending = False
+        self._hooks_registered = False
+        if app is not None:
+            self.init_app(app)
+    
+    def init_app(self, app) -> None:
+        self.shutdown()
+        
+        self._queue_size = app.config['LOG_QUEUE_SIZE']
+        self._output = logging.StreamHandler(sys.stderr)
+        self._output.setFormatter(
+            logging.Formatter(TEXT_FORMAT) if app.config['LOG_FORMAT'] == 'text' else JsonFormatter()
+        )
+        log_queue = queue.Queue(maxsize=self._queue_size)
+        self._listener = QueueListener(log_queue, self._output)
+        self._listener.start()
+        
+        self._handler = _RedactingQueueHandler(log_queue, self)
+        self._handler.addFilter(SamplingFilter(app.config['LOG_DEBUG_SAMPLE_RATE']))
+        
+        root = logging.getLogger()
+        root.addHandler(self._handler)
+        root.setLevel(app.config['LOG_LEVEL'].upper())
+        for nombre, level in parse_levels(app.config['LOG_LEVELS']).items():
+            logging.getLogger(nombre).setLevel(level)
+        
+        # Flask agrega su propio StreamHandler a `app.logger` si no encuentra
+        # uno; con el del logger raíz instalado sus registros pasan por la cola
+        from flask.logging import default_handler
+        app.logger.removeHandler(default_handler)
+        
+        if not self._hooks_registered:
+            # Vaciar la cola al salir y preparar una cola nueva en los procesos
+            # creados con fork (workers de gunicorn, pool de hash): el hilo
+            # escritor no sobrevive al fork
+            atexit.register(self.shutdown)
+            if hasattr(os, 'register_at_fork'):
+                os.register_at_fork(after_in_child=self._reset_after_fork)
+            self._hooks_registered = True
+    
+    def record_dropped(self) -> None:
+        with self._lock:
+            self.dropped += 1
+    
+    def shutdown(self) -> None:
+        """Escribir los registros pendientes y quitar el handler del logger raíz"""
+        if self._handler is not None:
+            logging.getLogger().removeHandler(self._handler)
+            self._handler = None
+        if self._listener is not None:
+            if not self.listener_pending:
+                self._listener.stop()
+            self._listener = None
+            self.listener_pending = False
+    
+    def start_pending_listener(self) -> None:
+        """Iniciar el hilo escritor de un proceso hijo (primer registro tras el fork)"""
+        with self._lock:
+            if self.listener_pending:
+                self._listener.start()
+                self.listener_pending = False
+    
+    def _reset_after_fork(self) -> None:
+        # El hijo hereda la cola y sus locks en el estado en que estaban al
+        # hacer fork: se reemplazan por otros nuevos. El hilo escritor no se
+        # inicia aquí: los procesos que nunca escriben un log (los del pool
+        # de hash de contraseñas) no deben cargar con un hilo más
+        if self._listener is None:
+            return
+        self._lock = threading.Lock()
+        log_queue = queue.Queue(maxsize=self._queue_size)
+        self._listener = QueueListener(log_queue, self._output)
+        self._handler.queue = log_queue
+        self.listener_pending = True
+
+
+structured_logging = StructuredLogging()
@@ -0,0 +1,137 @@
+"""
+Repositorios de sólo lectura del catálogo para el modo ASGI.
+
+Ejecutan con una `AsyncSession` las mismas sentencias que construyen los
+repositorios síncronos (`list_statement`, `after_statement`,
+`versions_statement`) y convierten las filas con los mismos `_model_to_entity`,
+de modo que filtros, orden, paginación y conteo son idénticos en ambos modos.
+
+Los métodos tienen la misma firma que los de los repositorios síncronos pero
+son corrutinas. Los casos de uso de lectura se reutilizan sin cambios: validan
+los parámetros y devuelven lo que devuelve el repositorio, que aquí es la
+corrutina que espera la vista ASGI.
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.infrastructure.db.async_engine import AsyncDatabase
+from app.infrastructure.db.counting import COUNT_EXACT, paginate_counted_async
+from app.infrastructure.db.expand import expand_options
+from app.infrastructure.db.models.categoria_model import CategoriaModel
+from app.infrastructure.db.models.presentacion_model import PresentacionModel
+from app.infrastructure.db.models.producto_model import ProductoModel
+from app.infrastructure.db.pagination import Page, keyset_page, keyset_statement
+from app.infrastructure.db.search import SEARCH_MODE_SUBSTRING
+from app.infrastructure.repository_impl.categoria_repo import CategoriaRepository
+from app.infrastructure.repository_impl.presentacion_repo import PresentacionRepository
+from app.infrastructure.repository_impl.producto_repo import ProductoRepository
+from app.infrastructure.repository_impl.tabla_version_repo import TablaVersionRepository
+
+
+class AsyncCatalogRepository:
+    """Ejecución asíncrona de las consultas de lectura de un repositorio síncrono"""
+    
+    model = None
+    
+    def __init__(self, database: AsyncDatabase, repository):
+        self.database = database
+        self.repository = repository
+    
+    async def get_by_id(self, item_id: int):
+        async with self.database.read_session() as session:
+            model = await session.get(self.model, item_id)
+            return self._to_entity(model) if model else None
+    
+    async def _paginate(self, stmt, page: int, per_page: int, count_mode: str, filtered: bool,
+                        **options) -> Page:
+        async with self.database.read_session() as session:
+            result = await paginate_counted_async(session, stmt, self.model, page, per_page, count_mode, filtered)
+        
+        result.items = [self._to_entity(model, **options) for model in result.items]
+        return result
+    
+    async def _paginate_after(self, stmt, after: Optional[str], per_page: int, **options) -> Page:
+        async with self.database.read_session() as session:
+            rows = (await session.scalars(keyset_statement(stmt, self.model, after, per_page))).all()
+        
+        models, next_cursor = keyset_page(rows, per_page)
+        return Page(items=[self._to_entity(model, **options) for model in models], next_cursor=next_cursor)
+    
+    def _to_entity(self, model, **options):
+        # `options` son los argumentos extra del `_model_to_entity` síncrono (p. ej. `expand`)
+        return self.repository._model_to_entity(model, **options)
+
+
+class AsyncProductoRepository(AsyncCatalogRepository):
+    
+    model = ProductoModel
+    
+    def __init__(self, database: AsyncDatabase):
+        super().__init__(database, ProductoRepository())
+    
+    async def get_by_id(self, item_id: int, expand: Tuple[str, ...] = ()):
+        async with self.database.read_session() as session:
+            model = await session.get(self.model, item_id, options=expand_options(self.model, expand))
+            return self._to_entity(model, expand=expand) if model else None
+    
+    async def get_all(self, page: int = 1, per_page: int = 10, search: str = None,
+                      categoria_id: int = None, presentacion_id: int = None,
+                      search_mode: str = SEARCH_MODE_SUBSTRING, count_mode: str = COUNT_EXACT,
+                      expand: Tuple[str, ...] = ()) -> Page:
+        return await self._paginate(
+            self.repository.list_statement(search, categoria_id, presentacion_id, search_mode, expand),
+            page, per_page, count_mode, filtered=bool(search or categoria_id or presentacion_id), expand=expand
+        )
+    
+    async def get_all_after(self, after: Optional[str] = None, per_page: int = 10, search: str = None,
+                            categoria_id: int = None, presentacion_id: int = None,
+                            expand: Tuple[str, ...] = ()) -> Page:
+        return await self._paginate_after(
+            self.repository.after_statement(search, categoria_id, presentacion_id, expand), after, per_page,
+            expand=expand
+        )
+
+
+class AsyncCategoriaRepository(AsyncCatalogRepository):
+    
+    model = CategoriaModel
+    
+    def __init__(self, database: AsyncDatabase):
+        super().__init__(database, CategoriaRepository())
+    
+    async def get_all(self, page: int = 1, per_page: int = 10, search: str = None,
+                      search_mode: str = SEARCH_MODE_SUBSTRING, count_mode: str = COUNT_EXACT) -> Page:
+        return await self._paginate(self.repository.list_statement(search, search_mode),
+                                    page, per_page, count_mode, filtered=bool(search))
+    
+    async def get_all_after(self, after: Optional[str] = None, per_page: int = 10, search: str = None) -> Page:
+        return await self._paginate_after(self.repository.after_statement(search), after, per_page)
+
+
+class AsyncPresentacionRepository(AsyncCatalogRepository):
+    
+    model = PresentacionModel
+    
+    def __init__(self, database: AsyncDatabase):
+        super().__init__(database, PresentacionRepository())
+    
+    async def get_all(self, page: int = 1, per_page: int = 10, search: str = None,
+                      count_mode: str = COUNT_EXACT) -> Page:
+        return await self._paginate(self.repository.list_statement(search),
+                                    page, per_page, count_mode, filtered=bool(search))
+    
+    async def get_all_after(self, after: Optional[str] = None, per_page: int = 10, search: str = None) -> Page:
+        return await self._paginate_after(self.repository.after_statement(search), after, per_page)
+
+
+class AsyncTablaVersionRepository:
+    
+    def __init__(self, database: AsyncDatabase):
+        self.database = database
+        self.repository = TablaVersionRepository()
+    
+    async def get_versions(self, tablas: Iterable[str]) -> Dict[str, int]:
+        tablas = list(tablas)
+        async with self.database.read_session() as session:
+            rows = (await session.execute(self.repository.versions_statement(tablas))).all()
+        return self.repository.versions_from_rows(tablas, rows)
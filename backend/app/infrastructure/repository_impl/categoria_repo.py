@@ -1,8 +1,12 @@
-from typing import List, Optional
-from sqlalchemy import func
+from typing import Iterable, List, Optional, Set
+from sqlalchemy import Select, exists, func, select
 from app.domain.entities.categoria import Categoria
 from app.infrastructure.db.models.categoria_model import CategoriaModel
+from app.infrastructure.db.models.producto_model import ProductoModel
 from app.infrastructure.db.base import db
+from app.infrastructure.db.counting import COUNT_EXACT, paginate_counted
+from app.infrastructure.db.pagination import Page, keyset_paginate
+from app.infrastructure.db.search import SEARCH_MODE_FULLTEXT, SEARCH_MODE_SUBSTRING, apply_fulltext, apply_search
 
 class CategoriaRepository:
     
@@ -30,20 +34,32 @@ class CategoriaRepository:
             return self._model_to_entity(categoria_model)
         return None
     
-    def get_all(self, page: int = 1, per_page: int = 10, search: str = None) -> tuple[List[Categoria], int]:
-        query = CategoriaModel.query
+    def get_all(self, page: int = 1, per_page: int = 10, search: str = None,
+               search_mode: str = SEARCH_MODE_SUBSTRING, count_mode: str = COUNT_EXACT) -> Page:
+        result = paginate_counted(self.list_statement(search, search_mode), CategoriaModel, page, per_page, count_mode,
+                                  filtered=bool(search))
         
-        if search:
-            query = query.filter(
-                func.lower(CategoriaModel.nombre).contains(func.lower(search))
-            )
+        result.items = [self._model_to_entity(model) for model in result.items]
+        return result
+    
+    def get_all_after(self, after: Optional[str] = None, per_page: int = 10, search: str = None) -> Page:
+        models, next_cursor = keyset_paginate(self.after_statement(search), CategoriaModel, after, per_page)
         
-        paginated = query.order_by(CategoriaModel.nombre).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
+        categorias = [self._model_to_entity(model) for model in models]
+        return Page(items=categorias, next_cursor=next_cursor)
+    
+    def list_statement(self, search: str = None, search_mode: str = SEARCH_MODE_SUBSTRING) -> Select:
+        """Consulta ordenada del listado paginado (compartida con el modo ASGI)"""
+        stmt = select(CategoriaModel)
         
-        categorias = [self._model_to_entity(model) for model in paginated.items]
-        return categorias, paginated.total
+        # El modo de texto completo ordena por relevancia en lugar de por nombre
+        if search and search_mode == SEARCH_MODE_FULLTEXT:
+            return apply_fulltext(stmt, CategoriaModel, search)
+        return apply_search(stmt, CategoriaModel, search).order_by(CategoriaModel.nombre)
+    
+    def after_statement(self, search: str = None) -> Select:
+        """Consulta sin ordenar del listado por cursor; el orden lo fija keyset_statement"""
+        return apply_search(select(CategoriaModel), CategoriaModel, search)
     
     def update(self, categoria_id: int, categoria: Categoria) -> Optional[Categoria]:
         categoria_model = CategoriaModel.query.get(categoria_id)
@@ -61,8 +77,9 @@ class CategoriaRepository:
         if not categoria_model:
             return False
         
-        # Verificar si tiene productos asociados
-        if categoria_model.productos.count() > 0:
+        # Verificar si tiene productos asociados (EXISTS se detiene en la
+        # primera fila del índice de la clave foránea en lugar de contarlas)
+        if db.session.scalar(select(exists().where(ProductoModel.categoria_id == categoria_id))):
             raise ValueError("No se puede eliminar la categoría porque tiene productos asociados")
         
         db.session.delete(categoria_model)
@@ -77,6 +94,14 @@ class CategoriaRepository:
             query = query.filter(CategoriaModel.id != exclude_id)
         return query.first() is not None
     
+    def get_existing_ids(self, ids: Iterable[int]) -> Set[int]:
+        """Devolver cuáles de los IDs indicados existen, con una sola consulta"""
+        ids = set(ids)
+        if not ids:
+            return set()
+        rows = CategoriaModel.query.with_entities(CategoriaModel.id).filter(CategoriaModel.id.in_(ids)).all()
+        return {row.id for row in rows}
+    
     def _model_to_entity(self, model: CategoriaModel) -> Categoria:
         return Categoria(
             id=model.id,
@@ -1,8 +1,12 @@
-from typing import List, Optional
-from sqlalchemy import func
+from typing import Iterable, List, Optional, Set
+from sqlalchemy import Select, exists, func, select
 from app.domain.entities.presentacion import Presentacion
 from app.infrastructure.db.models.presentacion_model import PresentacionModel
+from app.infrastructure.db.models.producto_model import ProductoModel
 from app.infrastructure.db.base import db
+from app.infrastructure.db.counting import COUNT_EXACT, paginate_counted
+from app.infrastructure.db.pagination import Page, keyset_paginate
+from app.infrastructure.db.search import apply_search
 
 class PresentacionRepository:
     
@@ -30,20 +34,27 @@ class PresentacionRepository:
             return self._model_to_entity(presentacion_model)
         return None
     
-    def get_all(self, page: int = 1, per_page: int = 10, search: str = None) -> tuple[List[Presentacion], int]:
-        query = PresentacionModel.query
+    def get_all(self, page: int = 1, per_page: int = 10, search: str = None,
+               count_mode: str = COUNT_EXACT) -> Page:
+        result = paginate_counted(self.list_statement(search), PresentacionModel, page, per_page, count_mode,
+                                  filtered=bool(search))
         
-        if search:
-            query = query.filter(
-                func.lower(PresentacionModel.nombre).contains(func.lower(search))
-            )
-        
-        paginated = query.order_by(PresentacionModel.nombre).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
+        result.items = [self._model_to_entity(model) for model in result.items]
+        return result
+    
+    def get_all_after(self, after: Optional[str] = None, per_page: int = 10, search: str = None) -> Page:
+        models, next_cursor = keyset_paginate(self.after_statement(search), PresentacionModel, after, per_page)
         
-        presentaciones = [self._model_to_entity(model) for model in paginated.items]
-        return presentaciones, paginated.total
+        presentaciones = [self._model_to_entity(model) for model in models]
+        return Page(items=presentaciones, next_cursor=next_cursor)
+    
+    def list_statement(self, search: str = None) -> Select:
+        """Consulta ordenada del listado paginado (compartida con el modo ASGI)"""
+        return apply_search(select(PresentacionModel), PresentacionModel, search).order_by(PresentacionModel.nombre)
+    
+    def after_statement(self, search: str = None) -> Select:
+        """Consulta sin ordenar del listado por cursor; el orden lo fija keyset_statement"""
+        return apply_search(select(PresentacionModel), PresentacionModel, search)
     
     def update(self, presentacion_id: int, presentacion: Presentacion) -> Optional[Presentacion]:
         presentacion_model = PresentacionModel.query.get(presentacion_id)
@@ -61,8 +72,9 @@ class PresentacionRepository:
         if not presentacion_model:
             return False
         
-        # Verificar si tiene productos asociados
-        if presentacion_model.productos.count() > 0:
+        # Verificar si tiene productos asociados (EXISTS se detiene en la
+        # primera fila del índice de la clave foránea en lugar de contarlas)
+        if db.session.scalar(select(exists().where(ProductoModel.presentacion_id == presentacion_id))):
             raise ValueError("No se puede eliminar la presentación porque tiene productos asociados")
         
         db.session.delete(presentacion_model)
@@ -77,6 +89,14 @@ class PresentacionRepository:
             query = query.filter(PresentacionModel.id != exclude_id)
         return query.first() is not None
     
+    def get_existing_ids(self, ids: Iterable[int]) -> Set[int]:
+        """Devolver cuáles de los IDs indicados existen, con una sola consulta"""
+        ids = set(ids)
+        if not ids:
+            return set()
+        rows = PresentacionModel.query.with_entities(PresentacionModel.id).filter(PresentacionModel.id.in_(ids)).all()
+        return {row.id for row in rows}
+    
     def _model_to_entity(self, model: PresentacionModel) -> Presentacion:
         return Presentacion(
             id=model.id,
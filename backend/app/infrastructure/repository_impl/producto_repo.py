@@ -1,29 +1,74 @@
-from typing import List, Optional
-from sqlalchemy import func
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from sqlalchemy import Select, delete, func, insert, select, update
+from sqlalchemy.exc import DataError, IntegrityError
 from decimal import Decimal
 from app.domain.entities.producto import Producto
 from app.infrastructure.db.models.producto_model import ProductoModel
 from app.infrastructure.db.base import db
+from app.infrastructure.db.counting import COUNT_EXACT, paginate_counted
+from app.infrastructure.db.expand import expand_options
+from app.infrastructure.db.pagination import Page, keyset_paginate
+from app.infrastructure.db.search import SEARCH_MODE_FULLTEXT, SEARCH_MODE_SUBSTRING, apply_fulltext, apply_search
+from app.infrastructure.repository_impl.categoria_repo import CategoriaRepository
+from app.infrastructure.repository_impl.presentacion_repo import PresentacionRepository
+
+# Restricción violada -> campo del mensaje de error. PostgreSQL informa el
+# nombre de la restricción; SQLite sólo el índice o las columnas únicas
+_CONSTRAINT_FIELDS = {
+    'ix_productos_nombre': 'nombre',
+    'ix_productos_nombre_lower': 'nombre',
+    'productos.nombre': 'nombre',
+    'productos_categoria_id_fkey': 'categoria',
+    'productos_presentacion_id_fkey': 'presentacion',
+}
+
+_SQLITE_UNIQUE = re.compile(r"UNIQUE constraint failed: (?:index '(?P<index>[^']+)'|(?P<columns>.+))")
+
+
+def _violated_constraint(error: IntegrityError) -> Optional[str]:
+    diag = getattr(error.orig, 'diag', None)
+    name = getattr(diag, 'constraint_name', None)
+    if name:
+        return name
+    match = _SQLITE_UNIQUE.fullmatch(str(error.orig))
+    if match:
+        return match.group('index') or match.group('columns')
+    return None
+
 
 class ProductoRepository:
     
+    def __init__(self):
+        self.categoria_repo = CategoriaRepository()
+        self.presentacion_repo = PresentacionRepository()
+    
     def create(self, producto: Producto) -> Producto:
-        producto_model = ProductoModel(
-            nombre=producto.nombre,
-            precio=producto.precio,
-            categoria_id=producto.categoria_id,
-            presentacion_id=producto.presentacion_id,
-            activo=producto.activo
-        )
-        db.session.add(producto_model)
-        db.session.commit()
+        """Insertar el producto con una sola sentencia INSERT ... RETURNING.
+        
+        La existencia de la categoría y la presentación y la unicidad del
+        nombre las garantizan las restricciones de la base de datos.
+        """
+        stmt = insert(ProductoModel).values(**self._entity_to_row(producto)).returning(ProductoModel)
+        try:
+            producto_model = db.session.scalar(stmt)
+            creado = self._model_to_entity(producto_model)
+            db.session.commit()
+        except IntegrityError as e:
+            db.session.rollback()
+            message = self._integrity_error_message(
+                e, producto, f"Ya existe un producto con el nombre '{producto.nombre}'"
+            )
+            if message is None:
+                raise
+            raise ValueError(message)
         
-        return self._model_to_entity(producto_model)
+        return creado
     
-    def get_by_id(self, producto_id: int) -> Optional[Producto]:
-        producto_model = ProductoModel.query.get(producto_id)
+    def get_by_id(self, producto_id: int, expand: Tuple[str, ...] = ()) -> Optional[Producto]:
+        producto_model = db.session.get(ProductoModel, producto_id, options=expand_options(ProductoModel, expand))
         if producto_model:
-            return self._model_to_entity(producto_model)
+            return self._model_to_entity(producto_model, expand)
         return None
     
     def get_by_nombre(self, nombre: str) -> Optional[Producto]:
@@ -35,13 +80,70 @@ class ProductoRepository:
         return None
     
     def get_all(self, page: int = 1, per_page: int = 10, search: str = None, 
-               categoria_id: int = None, presentacion_id: int = None) -> tuple[List[Producto], int]:
-        query = ProductoModel.query
+               categoria_id: int = None, presentacion_id: int = None,
+               search_mode: str = SEARCH_MODE_SUBSTRING, count_mode: str = COUNT_EXACT,
+               expand: Tuple[str, ...] = ()) -> Page:
+        result = paginate_counted(
+            self.list_statement(search, categoria_id, presentacion_id, search_mode, expand),
+            ProductoModel, page, per_page, count_mode,
+            filtered=bool(search or categoria_id or presentacion_id)
+        )
+        
+        result.items = [self._model_to_entity(model, expand) for model in result.items]
+        return result
+    
+    def get_all_after(self, after: Optional[str] = None, per_page: int = 10, search: str = None,
+                      categoria_id: int = None, presentacion_id: int = None,
+                      expand: Tuple[str, ...] = ()) -> Page:
+        models, next_cursor = keyset_paginate(
+            self.after_statement(search, categoria_id, presentacion_id, expand), ProductoModel, after, per_page
+        )
+        
+        productos = [self._model_to_entity(model, expand) for model in models]
+        return Page(items=productos, next_cursor=next_cursor)
+    
+    def list_statement(self, search: str = None, categoria_id: int = None, presentacion_id: int = None,
+                       search_mode: str = SEARCH_MODE_SUBSTRING, expand: Tuple[str, ...] = ()) -> Select:
+        """Consulta ordenada del listado paginado (compartida con el modo ASGI)"""
+        stmt = self._filter(self._select(expand), categoria_id, presentacion_id)
+        
+        # El modo de texto completo ordena por relevancia en lugar de por nombre
+        if search and search_mode == SEARCH_MODE_FULLTEXT:
+            return apply_fulltext(stmt, ProductoModel, search)
+        return apply_search(stmt, ProductoModel, search).order_by(ProductoModel.nombre)
+    
+    def after_statement(self, search: str = None, categoria_id: int = None,
+                        presentacion_id: int = None, expand: Tuple[str, ...] = ()) -> Select:
+        """Consulta sin ordenar del listado por cursor; el orden lo fija keyset_statement"""
+        return apply_search(self._filter(self._select(expand), categoria_id, presentacion_id),
+                            ProductoModel, search)
+    
+    def _select(self, expand: Tuple[str, ...]) -> Select:
+        # Las relaciones expandidas se cargan en una consulta por relación
+        # para toda la página (ver app/infrastructure/db/expand.py)
+        return select(ProductoModel).options(*expand_options(ProductoModel, expand))
+    
+    def _filter(self, stmt, categoria_id: int, presentacion_id: int):
+        if categoria_id:
+            stmt = stmt.filter(ProductoModel.categoria_id == categoria_id)
+        
+        if presentacion_id:
+            stmt = stmt.filter(ProductoModel.presentacion_id == presentacion_id)
+        return stmt
+    
+    def iter_all(self, search: str = None, categoria_id: int = None, presentacion_id: int = None,
+                 batch_size: int = 1000) -> Iterator[Producto]:
+        """Recorrer todos los productos ordenados por ID con un cursor del servidor.
+        
+        `yield_per` trae las filas de `batch_size` en `batch_size` (en
+        PostgreSQL activa `stream_results`), por lo que la memoria no depende
+        del tamaño del catálogo. Se seleccionan columnas en lugar de entidades
+        ORM para no poblar el identity map de la sesión.
+        """
+        query = ProductoModel.query.with_entities(*ProductoModel.__table__.c)
         
         if search:
-            query = query.filter(
-                func.lower(ProductoModel.nombre).contains(func.lower(search))
-            )
+            query = apply_search(query, ProductoModel, search)
         
         if categoria_id:
             query = query.filter(ProductoModel.categoria_id == categoria_id)
@@ -49,26 +151,30 @@ class ProductoRepository:
         if presentacion_id:
             query = query.filter(ProductoModel.presentacion_id == presentacion_id)
         
-        paginated = query.order_by(ProductoModel.nombre).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
-        
-        productos = [self._model_to_entity(model) for model in paginated.items]
-        return productos, paginated.total
+        for row in query.order_by(ProductoModel.id).yield_per(batch_size):
+            yield self._model_to_entity(row)
     
     def update(self, producto_id: int, producto: Producto) -> Optional[Producto]:
-        producto_model = ProductoModel.query.get(producto_id)
-        if not producto_model:
-            return None
-        
-        producto_model.nombre = producto.nombre
-        producto_model.precio = producto.precio
-        producto_model.categoria_id = producto.categoria_id
-        producto_model.presentacion_id = producto.presentacion_id
-        producto_model.activo = producto.activo
-        db.session.commit()
+        """Actualizar el producto con una sola sentencia UPDATE ... RETURNING"""
+        stmt = (update(ProductoModel)
+                .where(ProductoModel.id == producto_id)
+                .values(**self._entity_to_row(producto))
+                .returning(ProductoModel)
+                .execution_options(synchronize_session=False))
+        try:
+            producto_model = db.session.scalar(stmt)
+            actualizado = self._model_to_entity(producto_model) if producto_model else None
+            db.session.commit()
+        except IntegrityError as e:
+            db.session.rollback()
+            message = self._integrity_error_message(
+                e, producto, f"Ya existe otro producto con el nombre '{producto.nombre}'"
+            )
+            if message is None:
+                raise
+            raise ValueError(message)
         
-        return self._model_to_entity(producto_model)
+        return actualizado
     
     def delete(self, producto_id: int) -> bool:
         producto_model = ProductoModel.query.get(producto_id)
@@ -87,7 +193,115 @@ class ProductoRepository:
             query = query.filter(ProductoModel.id != exclude_id)
         return query.first() is not None
     
-    def _model_to_entity(self, model: ProductoModel) -> Producto:
+    def get_existing_nombres(self, nombres: Iterable[str]) -> Set[str]:
+        """Devolver (en minúsculas) cuáles de los nombres ya existen, con una sola consulta"""
+        nombres = {nombre.lower() for nombre in nombres}
+        if not nombres:
+            return set()
+        rows = ProductoModel.query.with_entities(func.lower(ProductoModel.nombre).label('nombre')).filter(
+            func.lower(ProductoModel.nombre).in_(nombres)
+        ).all()
+        return {row.nombre for row in rows}
+    
+    def bulk_create(self, productos: List[Producto]) -> List[Tuple[int, str]]:
+        """Insertar un lote con INSERT multi-fila en una transacción.
+        
+        Devuelve (posición en el lote, mensaje) de las filas rechazadas.
+        """
+        if not productos:
+            return []
+        
+        rows = [self._entity_to_row(producto) for producto in productos]
+        
+        try:
+            db.session.execute(insert(ProductoModel), rows)
+            db.session.commit()
+            return []
+        except (IntegrityError, DataError):
+            db.session.rollback()
+        
+        # Alguna fila chocó con datos escritos en paralelo: reintentar fila por fila
+        failures = []
+        for index, (producto, row) in enumerate(zip(productos, rows)):
+            try:
+                with db.session.begin_nested():
+                    db.session.execute(insert(ProductoModel), [row])
+            except IntegrityError as e:
+                message = self._integrity_error_message(
+                    e, producto, f"Ya existe un producto con el nombre '{producto.nombre}'"
+                )
+                if message is None:
+                    db.session.rollback()
+                    raise
+                failures.append((index, message))
+            except DataError:
+                failures.append((index, f"No se pudo insertar el producto '{producto.nombre}': datos fuera de rango"))
+        db.session.commit()
+        return failures
+    
+    def bulk_update(self, changes: Dict[str, Any], ids: List[int] = None, categoria_id: int = None,
+                    presentacion_id: int = None) -> Tuple[int, List[int]]:
+        """Actualizar en una sola sentencia los productos seleccionados.
+        
+        Devuelve el número de filas afectadas y los IDs solicitados que no existen.
+        """
+        stmt = self._bulk_where(update(ProductoModel).values(**changes), ids, categoria_id, presentacion_id)
+        return self._execute_bulk(stmt, ids)
+    
+    def bulk_delete(self, ids: List[int] = None, categoria_id: int = None,
+                    presentacion_id: int = None) -> Tuple[int, List[int]]:
+        """Eliminar en una sola sentencia los productos seleccionados"""
+        stmt = self._bulk_where(delete(ProductoModel), ids, categoria_id, presentacion_id)
+        return self._execute_bulk(stmt, ids)
+    
+    def _bulk_where(self, stmt, ids: List[int], categoria_id: int, presentacion_id: int):
+        if ids:
+            stmt = stmt.where(ProductoModel.id.in_(ids))
+        if categoria_id:
+            stmt = stmt.where(ProductoModel.categoria_id == categoria_id)
+        if presentacion_id:
+            stmt = stmt.where(ProductoModel.presentacion_id == presentacion_id)
+        return stmt.execution_options(synchronize_session=False)
+    
+    def _execute_bulk(self, stmt, ids: List[int]) -> Tuple[int, List[int]]:
+        if ids:
+            # Con una lista de IDs se usa RETURNING para saber cuáles no existían
+            affected = set(db.session.scalars(stmt.returning(ProductoModel.id)).all())
+            db.session.commit()
+            return len(affected), sorted(set(ids) - affected)
+        
+        result = db.session.execute(stmt)
+        db.session.commit()
+        return result.rowcount, []
+    
+    def _entity_to_row(self, producto: Producto) -> Dict[str, Any]:
+        return {
+            'nombre': producto.nombre,
+            'precio': producto.precio,
+            'categoria_id': producto.categoria_id,
+            'presentacion_id': producto.presentacion_id,
+            'activo': producto.activo
+        }
+    
+    def _integrity_error_message(self, error: IntegrityError, producto: Producto,
+                                 nombre_message: str) -> Optional[str]:
+        """Traducir la restricción violada al mismo mensaje que daban las validaciones previas.
+        
+        Devuelve None si la restricción no es una de las conocidas: el llamador
+        debe propagar el error en lugar de adivinar la causa.
+        """
+        campo = _CONSTRAINT_FIELDS.get(_violated_constraint(error))
+        if campo == 'categoria':
+            return f"No existe una categoría con ID {producto.categoria_id}"
+        if campo == 'presentacion':
+            return f"No existe una presentación con ID {producto.presentacion_id}"
+        if campo == 'nombre':
+            return nombre_message
+        return None
+    
+    def _model_to_entity(self, model: ProductoModel, expand: Tuple[str, ...] = ()) -> Producto:
+        # Las relaciones sólo se leen si se expandieron: de lo contrario cada
+        # fila dispararía una carga perezosa
         return Producto(
             id=model.id,
             nombre=model.nombre,
@@ -96,6 +310,9 @@ class ProductoRepository:
             presentacion_id=model.presentacion_id,
             activo=model.activo,
             created_at=model.created_at,
-            updated_at=model.updated_at
+            updated_at=model.updated_at,
+            categoria=self.categoria_repo._model_to_entity(model.categoria) if 'categoria' in expand else None,
+            presentacion=(self.presentacion_repo._model_to_entity(model.presentacion)
+                          if 'presentacion' in expand else None)
         )
 
@@ -0,0 +1,22 @@
+from typing import Dict, Iterable, List
+from sqlalchemy import Select, select
+from app.infrastructure.db.base import db
+from app.infrastructure.db.models.tabla_version_model import TablaVersionModel
+
+class TablaVersionRepository:
+    
+    def get_versions(self, tablas: Iterable[str]) -> Dict[str, int]:
+        """Versión actual de cada tabla, con una sola consulta por clave primaria"""
+        tablas = list(tablas)
+        rows = db.session.execute(self.versions_statement(tablas)).all()
+        return self.versions_from_rows(tablas, rows)
+    
+    def versions_statement(self, tablas: List[str]) -> Select:
+        return select(TablaVersionModel.tabla, TablaVersionModel.version).where(
+            TablaVersionModel.tabla.in_(tablas)
+        )
+    
+    def versions_from_rows(self, tablas: List[str], rows) -> Dict[str, int]:
+        # Las tablas sin fila todavía no tuvieron escrituras
+        versions = {row.tabla: row.version for row in rows}
+        return {tabla: versions.get(tabla, 0) for tabla in tablas}
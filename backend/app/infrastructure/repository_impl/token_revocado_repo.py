@@ -0,0 +1,30 @@
+from datetime import datetime, timezone
+from typing import Dict, Iterable
+from app.infrastructure.db.models.token_revocado_model import TokenRevocadoModel
+from app.infrastructure.db.base import db
+
+class TokenRevocadoRepository:
+    
+    def add_all(self, tokens: Iterable[Dict]) -> None:
+        """Registrar tokens revocados (claims decodificados del JWT)"""
+        # Las filas de tokens ya expirados no aportan nada: se purgan aquí,
+        # que es el único punto de escritura de la tabla
+        TokenRevocadoModel.query.filter(
+            TokenRevocadoModel.expires_at < datetime.utcnow()
+        ).delete(synchronize_session=False)
+        
+        for token in tokens:
+            db.session.merge(TokenRevocadoModel(
+                jti=token['jti'],
+                tipo=token['type'],
+                usuario_id=int(token['sub']),
+                expires_at=datetime.fromtimestamp(token['exp'], timezone.utc).replace(tzinfo=None)
+            ))
+        db.session.commit()
+    
+    def get_active(self) -> Dict[str, float]:
+        """`jti` -> expiración (timestamp) de los tokens revocados que aún no expiran"""
+        rows = TokenRevocadoModel.query.with_entities(
+            TokenRevocadoModel.jti, TokenRevocadoModel.expires_at
+        ).filter(TokenRevocadoModel.expires_at >= datetime.utcnow()).all()
+        return {row.jti: row.expires_at.replace(tzinfo=timezone.utc).timestamp() for row in rows}
@@ -1,8 +1,9 @@
 from typing import Optional
-from sqlalchemy import func
-from app.domain.entities.usuario import Usuario
+from sqlalchemy import select
+from app.domain.entities.usuario import Usuario, normalize_email
 from app.infrastructure.db.models.usuario_model import UsuarioModel
 from app.infrastructure.db.base import db
+from app.infrastructure.auth.user_status_cache import user_status_cache
 
 class UsuarioRepository:
     
@@ -26,15 +27,21 @@ class UsuarioRepository:
     
     def get_by_email(self, email: str) -> Optional[Usuario]:
         usuario_model = UsuarioModel.query.filter(
-            func.lower(UsuarioModel.email) == func.lower(email)
+            UsuarioModel.email == normalize_email(email)
         ).first()
         if usuario_model:
             return self._model_to_entity(usuario_model)
         return None
     
+    def get_activo(self, usuario_id: int) -> Optional[bool]:
+        """Sólo el estado del usuario (None si no existe), para la verificación por petición"""
+        return db.session.scalar(
+            select(UsuarioModel.activo).where(UsuarioModel.id == usuario_id)
+        )
+    
     def exists_by_email(self, email: str, exclude_id: int = None) -> bool:
         query = UsuarioModel.query.filter(
-            func.lower(UsuarioModel.email) == func.lower(email)
+            UsuarioModel.email == normalize_email(email)
         )
         if exclude_id:
             query = query.filter(UsuarioModel.id != exclude_id)
@@ -45,6 +52,7 @@ class UsuarioRepository:
         if not usuario_model:
             return None
         
+        activo_anterior = usuario_model.activo
         usuario_model.email = usuario.email
         usuario_model.nombre = usuario.nombre
         usuario_model.activo = usuario.activo
@@ -52,8 +60,18 @@ class UsuarioRepository:
             usuario_model.password_hash = usuario.password_hash
         db.session.commit()
         
+        # Un usuario desactivado debe perder el acceso sin esperar al TTL de la caché
+        if activo_anterior != usuario.activo:
+            user_status_cache.invalidate(usuario_id)
+        
         return self._model_to_entity(usuario_model)
     
+    def update_password_hash(self, usuario_id: int, password_hash: str) -> None:
+        UsuarioModel.query.filter(UsuarioModel.id == usuario_id).update(
+            {UsuarioModel.password_hash: password_hash}, synchronize_session=False
+        )
+        db.session.commit()
+    
     def _model_to_entity(self, model: UsuarioModel) -> Usuario:
         return Usuario(
             id=model.id,
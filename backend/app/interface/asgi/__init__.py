@@ -0,0 +1,13 @@
+# ASGI layer - async read endpoints
+from config import Config
+
+
+def create_asgi_app(config_class=Config):
+    """Aplicación ASGI: lecturas del catálogo asíncronas, el resto con la aplicación Flask"""
+    from app import create_app
+    from app.infrastructure.db.async_engine import async_db
+    from app.interface.asgi.application import AsgiApplication
+    
+    flask_app = create_app(config_class)
+    async_db.init_app(flask_app)
+    return AsgiApplication(flask_app, async_db)
@@ -0,0 +1,185 @@
+"""
+Aplicación ASGI para servir las lecturas del catálogo con SQLAlchemy asíncrono.
+
+En modo WSGI cada petición ocupa un hilo mientras espera a PostgreSQL, así
+que la concurrencia está limitada por hilos, procesos y conexiones. En modo
+ASGI las vistas GET del catálogo (`ASYNC_VIEWS`) son corrutinas: mientras una
+espera a la base de datos el mismo proceso atiende otras, con un pool de
+conexiones asíncrono por worker.
+
+Cada petición se enruta con el mapa de URLs de la aplicación Flask. Las vistas
+asíncronas se ejecutan dentro de un contexto de petición de Flask y la
+respuesta pasa por `finalize_request` y los manejadores de error, de modo que
+encabezados (CORS, ETag), códigos y cuerpos coinciden con el modo WSGI. Las
+demás peticiones (escrituras, autenticación, importación/exportación,
+métricas) las atiende la aplicación Flask en un hilo del executor, igual que
+un adaptador WSGI.
+
+    uvicorn asgi:app --workers 4
+"""
+
+import asyncio
+import contextvars
+import io
+import sys
+from typing import Optional
+
+from werkzeug.exceptions import HTTPException
+
+from app.infrastructure.db.async_engine import AsyncDatabase
+from app.interface.asgi.views import ASYNC_VIEWS
+
+
+def build_environ(scope, body: bytes = b'') -> dict:
+    """Entorno WSGI equivalente a un scope HTTP de ASGI"""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client')
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0] if client else '',
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope.get('headers', []):
+        name = name.decode('latin-1')
+        if name == 'content-type':
+            key = 'CONTENT_TYPE'
+        elif name == 'content-length':
+            key = 'CONTENT_LENGTH'
+        else:
+            key = 'HTTP_' + name.upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if key in environ:
+            value = environ[key] + (';' if key == 'HTTP_COOKIE' else ',') + value
+        environ[key] = value
+    return environ
+
+
+async def read_body(receive) -> bytes:
+    body = bytearray()
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            break
+        body += message.get('body', b'')
+        if not message.get('more_body', False):
+            break
+    return bytes(body)
+
+
+def _asgi_headers(headers):
+    return [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers]
+
+
+class AsgiApplication:
+    
+    def __init__(self, flask_app, database: AsyncDatabase):
+        self.flask_app = flask_app
+        self.database = database
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            raise RuntimeError(f"Tipo de conexión ASGI no soportado: {scope['type']}")
+        
+        environ = build_environ(scope)
+        match = self._match(environ)
+        if match is None:
+            await self._call_wsgi(environ, receive, send)
+        else:
+            view, view_args = match
+            await self._call_view(environ, view, view_args, send)
+    
+    def _match(self, environ) -> Optional[tuple]:
+        """Vista asíncrona y argumentos de la URL, o None si la atiende Flask"""
+        if environ['REQUEST_METHOD'] != 'GET':
+            return None
+        try:
+            rule, view_args = self.flask_app.url_map.bind_to_environ(environ).match(return_rule=True)
+        except HTTPException:
+            # 404, 405 y redirecciones los responde Flask
+            return None
+        view = ASYNC_VIEWS.get(rule.endpoint)
+        return (view, view_args) if view else None
+    
+    async def _call_view(self, environ, view, view_args, send) -> None:
+        # Mismo flujo que Flask.full_dispatch_request, con la vista esperada
+        app = self.flask_app
+        with app.request_context(environ):
+            try:
+                try:
+                    rv = app.preprocess_request()
+                    if rv is None:
+                        rv = await view(**view_args)
+                except Exception as e:
+                    rv = app.handle_user_exception(e)
+                response = app.finalize_request(rv)
+            except Exception as e:
+                response = app.handle_exception(e)
+            
+            app_iter, status, headers = response.get_wsgi_response(environ)
+            body = b''.join(app_iter)
+        
+        await send({'type': 'http.response.start', 'status': response.status_code,
+                    'headers': _asgi_headers(headers)})
+        await send({'type': 'http.response.body', 'body': body})
+    
+    async def _call_wsgi(self, environ, receive, send) -> None:
+        """Atender la petición con la aplicación Flask en el executor del event loop"""
+        # El cuerpo ya está completo en memoria: sin Content-Length (p. ej. con
+        # chunked) werkzeug debe leerlo hasta el final
+        environ['wsgi.input'] = io.BytesIO(await read_body(receive))
+        environ['wsgi.input_terminated'] = True
+        
+        # Todas las llamadas se ejecutan en el mismo contexto, para que las
+        # respuestas con stream_with_context conserven el contexto de Flask
+        # entre un fragmento y el siguiente
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        
+        def run(function, *args):
+            return loop.run_in_executor(None, context.run, function, *args)
+        
+        started = {}
+        
+        def start_response(status, headers, exc_info=None):
+            started['status'] = int(status.split(' ', 1)[0])
+            started['headers'] = headers
+        
+        app_iter = await run(self.flask_app, environ, start_response)
+        try:
+            iterator = iter(app_iter)
+            chunk = await run(next, iterator, None)
+            await send({'type': 'http.response.start', 'status': started['status'],
+                        'headers': _asgi_headers(started['headers'])})
+            while chunk is not None:
+                if chunk:
+                    await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+                chunk = await run(next, iterator, None)
+            await send({'type': 'http.response.body', 'body': b''})
+        finally:
+            if hasattr(app_iter, 'close'):
+                await run(app_iter.close)
+    
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.database.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
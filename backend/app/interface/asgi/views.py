@@ -0,0 +1,298 @@
+"""
+Vistas asíncronas de lectura del catálogo (modo ASGI).
+
+Son las vistas GET de los blueprints de productos, categorías y
+presentaciones escritas como corrutinas: leen los mismos parámetros, usan los
+mismos casos de uso (con los repositorios asíncronos) y los mismos
+serializadores, por lo que la respuesta es idéntica byte a byte. Se ejecutan
+dentro del contexto de petición de Flask, así que `request`, `jsonify` y los
+manejadores de error de la aplicación funcionan igual que en modo WSGI.
+
+`ASYNC_VIEWS` asocia cada endpoint de Flask con su vista asíncrona; el resto de
+los endpoints los atiende la aplicación WSGI.
+"""
+
+import asyncio
+from functools import wraps
+
+from flask import current_app, jsonify, request
+from flask_jwt_extended import verify_jwt_in_request
+
+from app import health_status
+from app.application.use_cases.categoria.get_categoria import GetCategoriaUseCase
+from app.application.use_cases.categoria.list_categorias import ListCategoriasUseCase
+from app.application.use_cases.presentacion.get_presentacion import GetPresentacionUseCase
+from app.application.use_cases.presentacion.list_presentaciones import ListPresentacionesUseCase
+from app.application.use_cases.producto.get_producto import GetProductoUseCase
+from app.application.use_cases.producto.list_productos import ListProductosUseCase
+from app.infrastructure.db.async_engine import async_db
+from app.infrastructure.db.expand import PRODUCTO_EXPANSIONS
+from app.infrastructure.repository_impl.async_catalog_repo import (
+    AsyncCategoriaRepository, AsyncPresentacionRepository, AsyncProductoRepository, AsyncTablaVersionRepository
+)
+from app.interface.http.etag import compute_etag, request_tables, set_cache_headers
+from app.interface.http.serializers import (
+    serialize_categoria, serialize_cursor_page, serialize_many, serialize_page, serialize_presentacion,
+    serialize_producto
+)
+
+# Instanciar repositorios y casos de uso
+producto_repo = AsyncProductoRepository(async_db)
+categoria_repo = AsyncCategoriaRepository(async_db)
+presentacion_repo = AsyncPresentacionRepository(async_db)
+tabla_version_repo = AsyncTablaVersionRepository(async_db)
+
+list_productos_use_case = ListProductosUseCase(producto_repo)
+get_producto_use_case = GetProductoUseCase(producto_repo)
+list_categorias_use_case = ListCategoriasUseCase(categoria_repo)
+get_categoria_use_case = GetCategoriaUseCase(categoria_repo)
+list_presentaciones_use_case = ListPresentacionesUseCase(presentacion_repo)
+get_presentacion_use_case = GetPresentacionUseCase(presentacion_repo)
+
+
+def jwt_required_async(view):
+    """Equivalente de `jwt_required()` para las vistas asíncronas.
+    
+    La validación es la de Flask-JWT-Extended con los callbacks de la
+    aplicación (tokens revocados, usuarios desactivados). Esos callbacks
+    consultan la base de datos síncrona cuando vence su caché, por eso se
+    ejecuta en un hilo en lugar de bloquear el event loop.
+    """
+    @wraps(view)
+    async def wrapper(*args, **kwargs):
+        await asyncio.to_thread(verify_jwt_in_request)
+        return await view(*args, **kwargs)
+    return wrapper
+
+
+def conditional_get_async(*tablas: str, expand=None):
+    """Equivalente de `conditional_get` con la versión de las tablas leída de forma asíncrona"""
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(*args, **kwargs):
+            # Versión antes que los datos y de la misma fuente (réplica, si existe)
+            versions = await tabla_version_repo.get_versions(request_tables(tablas, expand))
+            etag = compute_etag(versions, request.full_path)
+            
+            if request.if_none_match.contains(etag):
+                response = current_app.response_class(status=304)
+            else:
+                response = current_app.make_response(await view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            
+            return set_cache_headers(response, etag)
+        return wrapper
+    return decorator
+
+
+def _error_response(e: Exception):
+    if isinstance(e, ValueError):
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    return jsonify({
+        'success': False,
+        'message': 'Error interno del servidor'
+    }), 500
+
+
+async def health_check():
+    return health_status(current_app)
+
+
+@jwt_required_async
+@conditional_get_async('productos', expand=PRODUCTO_EXPANSIONS)
+async def list_productos():
+    try:
+        # Obtener parámetros de query
+        page = request.args.get('page', 1, type=int)
+        size = request.args.get('size', 10, type=int)
+        search = request.args.get('q', None, type=str)
+        categoria_id = request.args.get('categoria_id', None, type=int)
+        presentacion_id = request.args.get('presentacion_id', None, type=int)
+        after = request.args.get('after', None, type=str)
+        search_mode = request.args.get('search_mode', 'substring', type=str)
+        count_mode = request.args.get('count', 'exact', type=str)
+        expand = request.args.get('expand', None, type=str)
+        
+        # Ejecutar caso de uso (con `after` se usa paginación por cursor)
+        if after is not None:
+            result = await list_productos_use_case.execute_after(
+                after=after,
+                per_page=size,
+                search=search,
+                categoria_id=categoria_id,
+                presentacion_id=presentacion_id,
+                search_mode=search_mode,
+                expand=expand
+            )
+            productos_dict = serialize_many(serialize_producto, result.items)
+            return jsonify({
+                'success': True,
+                'data': serialize_cursor_page(productos_dict, result, size)
+            }), 200
+        
+        result = await list_productos_use_case.execute(
+            page=page,
+            per_page=size,
+            search=search,
+            categoria_id=categoria_id,
+            presentacion_id=presentacion_id,
+            search_mode=search_mode,
+            count_mode=count_mode,
+            expand=expand
+        )
+        productos_dict = serialize_many(serialize_producto, result.items)
+        return jsonify({
+            'success': True,
+            'data': serialize_page(productos_dict, result, page, size)
+        }), 200
+    
+    except Exception as e:
+        return _error_response(e)
+
+
+@jwt_required_async
+@conditional_get_async('productos', expand=PRODUCTO_EXPANSIONS)
+async def get_producto(producto_id):
+    try:
+        producto = await get_producto_use_case.execute(producto_id, request.args.get('expand', None, type=str))
+        
+        if not producto:
+            return jsonify({
+                'success': False,
+                'message': 'Producto no encontrado'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'data': serialize_producto(producto)
+        }), 200
+    
+    except Exception as e:
+        return _error_response(e)
+
+
+@jwt_required_async
+@conditional_get_async('categorias')
+async def list_categorias():
+    try:
+        # Obtener parámetros de query
+        page = request.args.get('page', 1, type=int)
+        size = request.args.get('size', 10, type=int)
+        search = request.args.get('q', None, type=str)
+        after = request.args.get('after', None, type=str)
+        search_mode = request.args.get('search_mode', 'substring', type=str)
+        count_mode = request.args.get('count', 'exact', type=str)
+        
+        # Ejecutar caso de uso (con `after` se usa paginación por cursor)
+        if after is not None:
+            result = await list_categorias_use_case.execute_after(
+                after=after, per_page=size, search=search, search_mode=search_mode
+            )
+            categorias_dict = serialize_many(serialize_categoria, result.items)
+            return jsonify({
+                'success': True,
+                'data': serialize_cursor_page(categorias_dict, result, size)
+            }), 200
+        
+        result = await list_categorias_use_case.execute(
+            page=page, per_page=size, search=search, search_mode=search_mode, count_mode=count_mode
+        )
+        categorias_dict = serialize_many(serialize_categoria, result.items)
+        return jsonify({
+            'success': True,
+            'data': serialize_page(categorias_dict, result, page, size)
+        }), 200
+    
+    except Exception as e:
+        return _error_response(e)
+
+
+@jwt_required_async
+@conditional_get_async('categorias')
+async def get_categoria(categoria_id):
+    try:
+        categoria = await get_categoria_use_case.execute(categoria_id)
+        
+        if not categoria:
+            return jsonify({
+                'success': False,
+                'message': 'Categoría no encontrada'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'data': serialize_categoria(categoria)
+        }), 200
+    
+    except Exception as e:
+        return _error_response(e)
+
+
+@jwt_required_async
+@conditional_get_async('presentaciones')
+async def list_presentaciones():
+    try:
+        # Obtener parámetros de query
+        page = request.args.get('page', 1, type=int)
+        size = request.args.get('size', 10, type=int)
+        search = request.args.get('q', None, type=str)
+        after = request.args.get('after', None, type=str)
+        count_mode = request.args.get('count', 'exact', type=str)
+        
+        # Ejecutar caso de uso (con `after` se usa paginación por cursor)
+        if after is not None:
+            result = await list_presentaciones_use_case.execute_after(after=after, per_page=size, search=search)
+            presentaciones_dict = serialize_many(serialize_presentacion, result.items)
+            return jsonify({
+                'success': True,
+                'data': serialize_cursor_page(presentaciones_dict, result, size)
+            }), 200
+        
+        result = await list_presentaciones_use_case.execute(
+            page=page, per_page=size, search=search, count_mode=count_mode
+        )
+        presentaciones_dict = serialize_many(serialize_presentacion, result.items)
+        return jsonify({
+            'success': True,
+            'data': serialize_page(presentaciones_dict, result, page, size)
+        }), 200
+    
+    except Exception as e:
+        return _error_response(e)
+
+
+@jwt_required_async
+@conditional_get_async('presentaciones')
+async def get_presentacion(presentacion_id):
+    try:
+        presentacion = await get_presentacion_use_case.execute(presentacion_id)
+        
+        if not presentacion:
+            return jsonify({
+                'success': False,
+                'message': 'Presentación no encontrada'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'data': serialize_presentacion(presentacion)
+        }), 200
+    
+    except Exception as e:
+        return _error_response(e)
+
+
+# Endpoint de Flask -> vista asíncrona que lo reemplaza en modo ASGI
+ASYNC_VIEWS = {
+    'health_check': health_check,
+    'producto.list_productos': list_productos,
+    'producto.get_producto': get_producto,
+    'categoria.list_categorias': list_categorias,
+    'categoria.get_categoria': get_categoria,
+    'presentacion.list_presentaciones': list_presentaciones,
+    'presentacion.get_presentacion': get_presentacion,
+}
@@ -1,20 +1,29 @@
+import logging
+
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required
+from flask_jwt_extended import get_jwt, jwt_required
 from marshmallow import ValidationError
 
 from app.application.use_cases.auth.register_user import RegisterUserUseCase
 from app.application.use_cases.auth.login_user import LoginUserUseCase
 from app.application.use_cases.auth.refresh_token import RefreshTokenUseCase
+from app.application.use_cases.auth.logout_user import LogoutUserUseCase
 from app.infrastructure.repository_impl.usuario_repo import UsuarioRepository
-from app.interface.http.dtos import RegisterUserDTO, LoginUserDTO, validate_json
+from app.infrastructure.auth.password_hasher import PasswordHasherBusy, password_hasher
+from app.infrastructure.auth.token_blocklist import token_blocklist
+from app.infrastructure.auth.rate_limiter import RateLimitExceeded, login_rate_limiter
+from app.domain.entities.usuario import normalize_email
+from app.interface.http.dtos import RegisterUserDTO, LoginUserDTO, LogoutUserDTO, validate_json
 
 auth_bp = Blueprint('auth', __name__)
+logger = logging.getLogger(__name__)
 
 # Instanciar repositorios y casos de uso
 usuario_repo = UsuarioRepository()
-register_use_case = RegisterUserUseCase(usuario_repo)
-login_use_case = LoginUserUseCase(usuario_repo)
+register_use_case = RegisterUserUseCase(usuario_repo, password_hasher)
+login_use_case = LoginUserUseCase(usuario_repo, password_hasher)
 refresh_use_case = RefreshTokenUseCase()
+logout_use_case = LogoutUserUseCase(token_blocklist)
 
 @auth_bp.route('/register', methods=['POST'])
 def register():
@@ -40,6 +49,12 @@ def register():
             'success': False,
             'message': str(e)
         }), 400
+    except PasswordHasherBusy as e:
+        # Pool de hash saturado: rechazar rápido para no bloquear al worker
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 503, {'Retry-After': str(e.retry_after)}
     except Exception as e:
         return jsonify({
             'success': False,
@@ -49,6 +64,14 @@ def register():
 @auth_bp.route('/login', methods=['POST'])
 def login():
     try:
+        # Limitar los intentos antes de validar, consultar la base o verificar el hash
+        json_data = request.get_json(silent=True)
+        email = json_data.get('email') if isinstance(json_data, dict) else None
+        login_rate_limiter.check(
+            ip=request.remote_addr,
+            email=normalize_email(email) if isinstance(email, str) else None
+        )
+        
         # Validar datos de entrada
         data = validate_json(LoginUserDTO, request.get_json())
         
@@ -64,8 +87,7 @@ def login():
                 'message': 'Credenciales inválidas'
             }), 401
         
-
-        print(f"🔍 Login exitoso - Tokens generados: {result}")
+        logger.info("Login exitoso", extra={'usuario_id': result['user']['id']})
         return jsonify({
             'success': True,
             'message': 'Inicio de sesión exitoso',
@@ -77,10 +99,19 @@ def login():
             'success': False,
             'message': str(e)
         }), 400
+    except RateLimitExceeded as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 429, {'Retry-After': str(e.retry_after)}
+    except PasswordHasherBusy as e:
+        # Pool de hash saturado: rechazar rápido para no bloquear al worker
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 503, {'Retry-After': str(e.retry_after)}
     except Exception as e:
-        print(f"❌ Error en login: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error en login")
         return jsonify({
             'success': False,
             'message': f'Error interno del servidor: {str(e)}'
@@ -90,15 +121,11 @@ def login():
 @jwt_required(refresh=True)
 def refresh():
     try:
-        # Log para debugging
-        auth_header = request.headers.get('Authorization')
-        print(f"🔍 Refresh endpoint - Authorization header: {auth_header}")
+        logger.debug("Renovación de token", extra={'authorization': request.headers.get('Authorization')})
         
         # Ejecutar caso de uso
         result = refresh_use_case.execute()
         
-        print(f"🔍 Refresh exitoso - Nuevo token generado: {result}")
-        
         return jsonify({
             'success': True,
             'message': 'Token renovado exitosamente',
@@ -106,7 +133,37 @@ def refresh():
         }), 200
         
     except Exception as e:
-        print(f"🔍 Refresh error: {e}")
+        logger.exception("Error al renovar el token")
+        return jsonify({
+            'success': False,
+            'message': 'Error interno del servidor'
+        }), 500
+
+@auth_bp.route('/logout', methods=['POST'])
+@jwt_required(verify_type=False)
+def logout():
+    try:
+        # Se revoca el token del header (access o refresh) y, si se envía,
+        # también el refresh token del cuerpo (opcional)
+        json_data = request.get_json(silent=True)
+        data = validate_json(LogoutUserDTO, {} if json_data is None else json_data)
+        
+        logout_use_case.execute(
+            current_token=get_jwt(),
+            refresh_token=data.get('refresh_token')
+        )
+        
+        return jsonify({
+            'success': True,
+            'message': 'Sesión cerrada exitosamente'
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    except Exception as e:
         return jsonify({
             'success': False,
             'message': 'Error interno del servidor'
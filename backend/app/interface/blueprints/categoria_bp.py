@@ -1,3 +1,5 @@
+import logging
+
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required
 
@@ -8,8 +10,11 @@ from app.application.use_cases.categoria.update_categoria import UpdateCategoria
 from app.application.use_cases.categoria.delete_categoria import DeleteCategoriaUseCase
 from app.infrastructure.repository_impl.categoria_repo import CategoriaRepository
 from app.interface.http.dtos import CreateCategoriaDTO, UpdateCategoriaDTO, validate_json
+from app.interface.http.etag import conditional_get
+from app.interface.http.serializers import serialize_many, serialize_cursor_page, serialize_page, serialize_categoria
 
 categoria_bp = Blueprint('categoria', __name__)
+logger = logging.getLogger(__name__)
 
 # Instanciar repositorio y casos de uso
 categoria_repo = CategoriaRepository()
@@ -21,41 +26,50 @@ delete_use_case = DeleteCategoriaUseCase(categoria_repo)
 
 @categoria_bp.route('', methods=['GET'])
 @jwt_required()
+@conditional_get('categorias')
 def list_categorias():
     try:
-        # Log para debugging
-        auth_header = request.headers.get('Authorization')
-        print(f"🔍 List categorias - Authorization header: {auth_header}")
+        # Evento de depuración (muestreado; el encabezado se redacta)
+        logger.debug("Listado de categorías", extra={'authorization': request.headers.get('Authorization')})
         
         # Obtener parámetros de query
         page = request.args.get('page', 1, type=int)
         size = request.args.get('size', 10, type=int)
         search = request.args.get('q', None, type=str)
-        
-        # Ejecutar caso de uso
-        categorias, total = list_use_case.execute(page=page, per_page=size, search=search)
+        after = request.args.get('after', None, type=str)
+        search_mode = request.args.get('search_mode', 'substring', type=str)
+        count_mode = request.args.get('count', 'exact', type=str)
+        
+        # Ejecutar caso de uso (con `after` se usa paginación por cursor)
+        if after is not None:
+            result = list_use_case.execute_after(
+                after=after, per_page=size, search=search, search_mode=search_mode
+            )
+        else:
+            result = list_use_case.execute(
+                page=page, per_page=size, search=search, search_mode=search_mode, count_mode=count_mode
+            )
+        categorias = result.items
         
         # Convertir entidades a diccionarios
-        categorias_dict = []
-        for categoria in categorias:
-            categorias_dict.append({
-                'id': categoria.id,
-                'nombre': categoria.nombre,
-                'descripcion': categoria.descripcion,
-                'created_at': categoria.created_at.isoformat() if categoria.created_at else None,
-                'updated_at': categoria.updated_at.isoformat() if categoria.updated_at else None
-            })
+        categorias_dict = serialize_many(serialize_categoria, categorias)
+        
+        if after is not None:
+            return jsonify({
+                'success': True,
+                'data': serialize_cursor_page(categorias_dict, result, size)
+            }), 200
         
         return jsonify({
             'success': True,
-            'data': {
-                'items': categorias_dict,
-                'total': total,
-                'page': page,
-                'size': size
-            }
+            'data': serialize_page(categorias_dict, result, page, size)
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
@@ -66,9 +80,7 @@ def list_categorias():
 @jwt_required()
 def create_categoria():
     try:
-        # Log para debugging
-        auth_header = request.headers.get('Authorization')
-        print(f"🔍 Create categoria - Authorization header: {auth_header}")
+        logger.debug("Creación de categoría", extra={'authorization': request.headers.get('Authorization')})
         
         # Validar datos de entrada
         data = validate_json(CreateCategoriaDTO, request.get_json())
@@ -82,13 +94,7 @@ def create_categoria():
         return jsonify({
             'success': True,
             'message': 'Categoría creada exitosamente',
-            'data': {
-                'id': categoria.id,
-                'nombre': categoria.nombre,
-                'descripcion': categoria.descripcion,
-                'created_at': categoria.created_at.isoformat() if categoria.created_at else None,
-                'updated_at': categoria.updated_at.isoformat() if categoria.updated_at else None
-            }
+            'data': serialize_categoria(categoria)
         }), 201
         
     except ValueError as e:
@@ -104,6 +110,7 @@ def create_categoria():
 
 @categoria_bp.route('/<int:categoria_id>', methods=['GET'])
 @jwt_required()
+@conditional_get('categorias')
 def get_categoria(categoria_id):
     try:
         # Ejecutar caso de uso
@@ -117,13 +124,7 @@ def get_categoria(categoria_id):
         
         return jsonify({
             'success': True,
-            'data': {
-                'id': categoria.id,
-                'nombre': categoria.nombre,
-                'descripcion': categoria.descripcion,
-                'created_at': categoria.created_at.isoformat() if categoria.created_at else None,
-                'updated_at': categoria.updated_at.isoformat() if categoria.updated_at else None
-            }
+            'data': serialize_categoria(categoria)
         }), 200
         
     except ValueError as e:
@@ -169,13 +170,7 @@ def update_categoria(categoria_id):
         return jsonify({
             'success': True,
             'message': 'Categoría actualizada exitosamente',
-            'data': {
-                'id': categoria.id,
-                'nombre': categoria.nombre,
-                'descripcion': categoria.descripcion,
-                'created_at': categoria.created_at.isoformat() if categoria.created_at else None,
-                'updated_at': categoria.updated_at.isoformat() if categoria.updated_at else None
-            }
+            'data': serialize_categoria(categoria)
         }), 200
         
     except ValueError as e:
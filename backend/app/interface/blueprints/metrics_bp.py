@@ -0,0 +1,71 @@
+import hmac
+
+from flask import Blueprint, Response, current_app, jsonify, request
+from flask_jwt_extended import jwt_required, verify_jwt_in_request
+
+from app.infrastructure.auth.user_status_cache import user_status_cache
+from app.infrastructure.db.base import db
+from app.infrastructure.db.pool import pool_status
+from app.infrastructure.monitoring.request_metrics import render_family, request_metrics
+from app.infrastructure.monitoring.structured_logging import structured_logging
+
+metrics_bp = Blueprint('metrics', __name__)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Estado del pool exportado a Prometheus: clave de pool_status -> (métrica, tipo, descripción)
+POOL_METRICS = {
+    'size': ('db_pool_size', 'gauge', 'Conexiones permanentes del pool'),
+    'checked_out': ('db_pool_checked_out', 'gauge', 'Conexiones prestadas'),
+    'overflow': ('db_pool_overflow', 'gauge', 'Conexiones de overflow abiertas'),
+    'checkouts': ('db_pool_checkouts_total', 'counter', 'Checkouts de conexiones'),
+    'timeouts': ('db_pool_timeouts_total', 'counter', 'Checkouts que agotaron pool_timeout'),
+}
+
+def _metrics_token_ok() -> bool:
+    token = current_app.config.get('METRICS_TOKEN')
+    if not token:
+        return False
+    enviado = request.headers.get('Authorization', '').removeprefix('Bearer ')
+    return hmac.compare_digest(enviado.encode('utf-8'), token.encode('utf-8'))
+
+@metrics_bp.route('', methods=['GET'])
+def prometheus_metrics():
+    # Acceso restringido salvo METRICS_PUBLIC: los scrapers (que no usan JWT)
+    # envían METRICS_TOKEN; los demás clientes, un JWT como en /cache y /pool
+    if not current_app.config['METRICS_PUBLIC'] and not _metrics_token_ok():
+        verify_jwt_in_request()
+    
+    pools = {bind or 'default': pool_status(engine.pool) for bind, engine in db.engines.items()}
+    partes = [request_metrics.render()]
+    for clave, (nombre, tipo, descripcion) in POOL_METRICS.items():
+        partes.append(render_family(nombre, tipo, descripcion, [
+            ({'bind': bind}, status[clave]) for bind, status in pools.items() if clave in status
+        ]))
+    partes.append(render_family('log_records_dropped_total', 'counter',
+                                'Registros de log descartados con la cola de escritura llena',
+                                [({}, structured_logging.dropped)]))
+    return Response(''.join(partes), content_type=PROMETHEUS_CONTENT_TYPE)
+
+@metrics_bp.route('/cache', methods=['GET'])
+@jwt_required()
+def cache_metrics():
+    # Métricas del proceso que atiende la petición (cada worker tiene su caché)
+    return jsonify({
+        'success': True,
+        'data': {
+            'user_status': user_status_cache.stats()
+        }
+    }), 200
+
+@metrics_bp.route('/pool', methods=['GET'])
+@jwt_required()
+def pool_metrics():
+    # Un pool por engine (bind) en cada worker; los valores son de este proceso
+    return jsonify({
+        'success': True,
+        'data': {
+            bind or 'default': pool_status(engine.pool)
+            for bind, engine in db.engines.items()
+        }
+    }), 200
@@ -8,6 +8,8 @@ from app.application.use_cases.presentacion.update_presentacion import UpdatePre
 from app.application.use_cases.presentacion.delete_presentacion import DeletePresentacionUseCase
 from app.infrastructure.repository_impl.presentacion_repo import PresentacionRepository
 from app.interface.http.dtos import CreatePresentacionDTO, UpdatePresentacionDTO, validate_json
+from app.interface.http.etag import conditional_get
+from app.interface.http.serializers import serialize_many, serialize_cursor_page, serialize_page, serialize_presentacion
 
 presentacion_bp = Blueprint('presentacion', __name__)
 
@@ -21,37 +23,42 @@ delete_use_case = DeletePresentacionUseCase(presentacion_repo)
 
 @presentacion_bp.route('', methods=['GET'])
 @jwt_required()
+@conditional_get('presentaciones')
 def list_presentaciones():
     try:
         # Obtener parámetros de query
         page = request.args.get('page', 1, type=int)
         size = request.args.get('size', 10, type=int)
         search = request.args.get('q', None, type=str)
+        after = request.args.get('after', None, type=str)
+        count_mode = request.args.get('count', 'exact', type=str)
         
-        # Ejecutar caso de uso
-        presentaciones, total = list_use_case.execute(page=page, per_page=size, search=search)
+        # Ejecutar caso de uso (con `after` se usa paginación por cursor)
+        if after is not None:
+            result = list_use_case.execute_after(after=after, per_page=size, search=search)
+        else:
+            result = list_use_case.execute(page=page, per_page=size, search=search, count_mode=count_mode)
+        presentaciones = result.items
         
         # Convertir entidades a diccionarios
-        presentaciones_dict = []
-        for presentacion in presentaciones:
-            presentaciones_dict.append({
-                'id': presentacion.id,
-                'nombre': presentacion.nombre,
-                'descripcion': presentacion.descripcion,
-                'created_at': presentacion.created_at.isoformat() if presentacion.created_at else None,
-                'updated_at': presentacion.updated_at.isoformat() if presentacion.updated_at else None
-            })
+        presentaciones_dict = serialize_many(serialize_presentacion, presentaciones)
+        
+        if after is not None:
+            return jsonify({
+                'success': True,
+                'data': serialize_cursor_page(presentaciones_dict, result, size)
+            }), 200
         
         return jsonify({
             'success': True,
-            'data': {
-                'items': presentaciones_dict,
-                'total': total,
-                'page': page,
-                'size': size
-            }
+            'data': serialize_page(presentaciones_dict, result, page, size)
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
@@ -74,13 +81,7 @@ def create_presentacion():
         return jsonify({
             'success': True,
             'message': 'Presentación creada exitosamente',
-            'data': {
-                'id': presentacion.id,
-                'nombre': presentacion.nombre,
-                'descripcion': presentacion.descripcion,
-                'created_at': presentacion.created_at.isoformat() if presentacion.created_at else None,
-                'updated_at': presentacion.updated_at.isoformat() if presentacion.updated_at else None
-            }
+            'data': serialize_presentacion(presentacion)
         }), 201
         
     except ValueError as e:
@@ -96,6 +97,7 @@ def create_presentacion():
 
 @presentacion_bp.route('/<int:presentacion_id>', methods=['GET'])
 @jwt_required()
+@conditional_get('presentaciones')
 def get_presentacion(presentacion_id):
     try:
         # Ejecutar caso de uso
@@ -109,13 +111,7 @@ def get_presentacion(presentacion_id):
         
         return jsonify({
             'success': True,
-            'data': {
-                'id': presentacion.id,
-                'nombre': presentacion.nombre,
-                'descripcion': presentacion.descripcion,
-                'created_at': presentacion.created_at.isoformat() if presentacion.created_at else None,
-                'updated_at': presentacion.updated_at.isoformat() if presentacion.updated_at else None
-            }
+            'data': serialize_presentacion(presentacion)
         }), 200
         
     except ValueError as e:
@@ -161,13 +157,7 @@ def update_presentacion(presentacion_id):
         return jsonify({
             'success': True,
             'message': 'Presentación actualizada exitosamente',
-            'data': {
-                'id': presentacion.id,
-                'nombre': presentacion.nombre,
-                'descripcion': presentacion.descripcion,
-                'created_at': presentacion.created_at.isoformat() if presentacion.created_at else None,
-                'updated_at': presentacion.updated_at.isoformat() if presentacion.updated_at else None
-            }
+            'data': serialize_presentacion(presentacion)
         }), 200
         
     except ValueError as e:
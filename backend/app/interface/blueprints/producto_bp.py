@@ -1,4 +1,5 @@
-from flask import Blueprint, request, jsonify
+from itertools import chain
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
 from flask_jwt_extended import jwt_required
 
 from app.application.use_cases.producto.create_producto import CreateProductoUseCase
@@ -6,10 +7,22 @@ from app.application.use_cases.producto.list_productos import ListProductosUseCa
 from app.application.use_cases.producto.get_producto import GetProductoUseCase
 from app.application.use_cases.producto.update_producto import UpdateProductoUseCase
 from app.application.use_cases.producto.delete_producto import DeleteProductoUseCase
+from app.application.use_cases.producto.import_productos import ImportProductosUseCase
+from app.application.use_cases.producto.export_productos import ExportProductosUseCase
+from app.application.use_cases.producto.bulk_update_productos import BulkUpdateProductosUseCase
+from app.application.use_cases.producto.bulk_delete_productos import BulkDeleteProductosUseCase
 from app.infrastructure.repository_impl.producto_repo import ProductoRepository
 from app.infrastructure.repository_impl.categoria_repo import CategoriaRepository
 from app.infrastructure.repository_impl.presentacion_repo import PresentacionRepository
-from app.interface.http.dtos import CreateProductoDTO, UpdateProductoDTO, validate_json
+from app.interface.http.dtos import (
+    CreateProductoDTO, UpdateProductoDTO, BulkUpdateProductosDTO, BulkDeleteProductosDTO, validate_json
+)
+from app.interface.http.importers import detect_import_format, iter_import_rows
+from app.interface.http.exporters import EXPORT_MIMETYPES, iter_export, validate_export_format
+from app.infrastructure.db.expand import PRODUCTO_EXPANSIONS
+from app.infrastructure.db.statement_timeout import without_statement_timeout
+from app.interface.http.etag import conditional_get
+from app.interface.http.serializers import serialize_many, serialize_cursor_page, serialize_page, serialize_producto
 
 producto_bp = Blueprint('producto', __name__)
 
@@ -18,14 +31,19 @@ producto_repo = ProductoRepository()
 categoria_repo = CategoriaRepository()
 presentacion_repo = PresentacionRepository()
 
-create_use_case = CreateProductoUseCase(producto_repo, categoria_repo, presentacion_repo)
+create_use_case = CreateProductoUseCase(producto_repo)
 list_use_case = ListProductosUseCase(producto_repo)
 get_use_case = GetProductoUseCase(producto_repo)
-update_use_case = UpdateProductoUseCase(producto_repo, categoria_repo, presentacion_repo)
+update_use_case = UpdateProductoUseCase(producto_repo)
 delete_use_case = DeleteProductoUseCase(producto_repo)
+import_use_case = ImportProductosUseCase(producto_repo, categoria_repo, presentacion_repo)
+export_use_case = ExportProductosUseCase(producto_repo)
+bulk_update_use_case = BulkUpdateProductosUseCase(producto_repo)
+bulk_delete_use_case = BulkDeleteProductosUseCase(producto_repo)
 
 @producto_bp.route('', methods=['GET'])
 @jwt_required()
+@conditional_get('productos', expand=PRODUCTO_EXPANSIONS)
 def list_productos():
     try:
         # Obtener parámetros de query
@@ -34,40 +52,55 @@ def list_productos():
         search = request.args.get('q', None, type=str)
         categoria_id = request.args.get('categoria_id', None, type=int)
         presentacion_id = request.args.get('presentacion_id', None, type=int)
+        after = request.args.get('after', None, type=str)
+        search_mode = request.args.get('search_mode', 'substring', type=str)
+        count_mode = request.args.get('count', 'exact', type=str)
+        # Relaciones a incluir en cada producto (p. ej. `categoria,presentacion`)
+        expand = request.args.get('expand', None, type=str)
         
-        # Ejecutar caso de uso
-        productos, total = list_use_case.execute(
-            page=page, 
-            per_page=size, 
-            search=search,
-            categoria_id=categoria_id,
-            presentacion_id=presentacion_id
-        )
+        # Ejecutar caso de uso (con `after` se usa paginación por cursor)
+        if after is not None:
+            result = list_use_case.execute_after(
+                after=after,
+                per_page=size,
+                search=search,
+                categoria_id=categoria_id,
+                presentacion_id=presentacion_id,
+                search_mode=search_mode,
+                expand=expand
+            )
+        else:
+            result = list_use_case.execute(
+                page=page, 
+                per_page=size, 
+                search=search,
+                categoria_id=categoria_id,
+                presentacion_id=presentacion_id,
+                search_mode=search_mode,
+                count_mode=count_mode,
+                expand=expand
+            )
+        productos = result.items
         
         # Convertir entidades a diccionarios
-        productos_dict = []
-        for producto in productos:
-            productos_dict.append({
-                'id': producto.id,
-                'nombre': producto.nombre,
-                'precio': float(producto.precio),
-                'categoria_id': producto.categoria_id,
-                'presentacion_id': producto.presentacion_id,
-                'activo': producto.activo,
-                'created_at': producto.created_at.isoformat() if producto.created_at else None,
-                'updated_at': producto.updated_at.isoformat() if producto.updated_at else None
-            })
+        productos_dict = serialize_many(serialize_producto, productos)
+        
+        if after is not None:
+            return jsonify({
+                'success': True,
+                'data': serialize_cursor_page(productos_dict, result, size)
+            }), 200
         
         return jsonify({
             'success': True,
-            'data': {
-                'items': productos_dict,
-                'total': total,
-                'page': page,
-                'size': size
-            }
+            'data': serialize_page(productos_dict, result, page, size)
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
@@ -93,16 +126,7 @@ def create_producto():
         return jsonify({
             'success': True,
             'message': 'Producto creado exitosamente',
-            'data': {
-                'id': producto.id,
-                'nombre': producto.nombre,
-                'precio': float(producto.precio),
-                'categoria_id': producto.categoria_id,
-                'presentacion_id': producto.presentacion_id,
-                'activo': producto.activo,
-                'created_at': producto.created_at.isoformat() if producto.created_at else None,
-                'updated_at': producto.updated_at.isoformat() if producto.updated_at else None
-            }
+            'data': serialize_producto(producto)
         }), 201
         
     except ValueError as e:
@@ -116,12 +140,165 @@ def create_producto():
             'message': 'Error interno del servidor'
         }), 500
 
+@producto_bp.route('/import', methods=['POST'])
+@jwt_required()
+def import_productos():
+    """
+    Importa productos masivamente desde un archivo CSV o NDJSON.
+    
+    El cuerpo se procesa en streaming y por lotes; la respuesta incluye el
+    número de filas importadas y los errores de cada fila rechazada.
+    """
+    try:
+        formato = detect_import_format(request.args.get('format'), request.mimetype)
+        
+        # Ejecutar caso de uso leyendo el cuerpo de la petición como stream
+        report = import_use_case.execute(
+            iter_import_rows(request.stream, formato),
+            batch_size=current_app.config['IMPORT_BATCH_SIZE'],
+            max_errors=current_app.config['IMPORT_MAX_ERRORS']
+        )
+        
+        return jsonify({
+            'success': True,
+            'message': 'Importación finalizada',
+            'data': report
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Error interno del servidor'
+        }), 500
+
+@producto_bp.route('/export', methods=['GET'])
+@jwt_required()
+@without_statement_timeout
+def export_productos():
+    """
+    Exporta el catálogo completo de productos en NDJSON o CSV.
+    
+    Las filas se leen con un cursor del servidor y se envían en una respuesta
+    chunked a medida que llegan, comprimidas con gzip si el cliente lo acepta.
+    Admite los mismos filtros que el listado (q, categoria_id, presentacion_id).
+    """
+    try:
+        formato = validate_export_format(request.args.get('format'))
+        gzip = request.accept_encodings['gzip'] > 0
+        
+        # Ejecutar caso de uso (las filas se consumen al enviar la respuesta)
+        productos = export_use_case.execute(
+            search=request.args.get('q', None, type=str),
+            categoria_id=request.args.get('categoria_id', None, type=int),
+            presentacion_id=request.args.get('presentacion_id', None, type=int),
+            batch_size=current_app.config['EXPORT_BATCH_SIZE']
+        )
+        chunks = iter_export(productos, formato, gzip=gzip)
+        
+        # Obtener el primer bloque aquí para que un error de base de datos
+        # todavía pueda responderse como JSON antes de enviar los encabezados
+        first = next(chunks, b'')
+        
+        response = Response(
+            stream_with_context(chain([first], chunks)),
+            mimetype=EXPORT_MIMETYPES[formato]
+        )
+        response.headers['Content-Disposition'] = f'attachment; filename=productos.{formato}'
+        response.headers['Vary'] = 'Accept-Encoding'
+        if gzip:
+            response.headers['Content-Encoding'] = 'gzip'
+        return response
+        
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Error interno del servidor'
+        }), 500
+
+@producto_bp.route('/bulk', methods=['PATCH'])
+@jwt_required()
+@without_statement_timeout
+def bulk_update_productos():
+    try:
+        # Validar datos de entrada
+        data = validate_json(BulkUpdateProductosDTO, request.get_json())
+        changes = data['changes']
+        
+        # Ejecutar caso de uso
+        result = bulk_update_use_case.execute(
+            ids=data.get('ids'),
+            categoria_id=data.get('categoria_id'),
+            presentacion_id=data.get('presentacion_id'),
+            precio=changes.get('precio'),
+            activo=changes.get('activo')
+        )
+        
+        return jsonify({
+            'success': True,
+            'message': f"{result['affected']} productos actualizados",
+            'data': result
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Error interno del servidor'
+        }), 500
+
+@producto_bp.route('/bulk', methods=['DELETE'])
+@jwt_required()
+@without_statement_timeout
+def bulk_delete_productos():
+    try:
+        # Validar datos de entrada
+        data = validate_json(BulkDeleteProductosDTO, request.get_json())
+        
+        # Ejecutar caso de uso
+        result = bulk_delete_use_case.execute(
+            ids=data.get('ids'),
+            categoria_id=data.get('categoria_id'),
+            presentacion_id=data.get('presentacion_id')
+        )
+        
+        return jsonify({
+            'success': True,
+            'message': f"{result['affected']} productos eliminados",
+            'data': result
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Error interno del servidor'
+        }), 500
+
 @producto_bp.route('/<int:producto_id>', methods=['GET'])
 @jwt_required()
+@conditional_get('productos', expand=PRODUCTO_EXPANSIONS)
 def get_producto(producto_id):
     try:
         # Ejecutar caso de uso
-        producto = get_use_case.execute(producto_id)
+        producto = get_use_case.execute(producto_id, request.args.get('expand', None, type=str))
         
         if not producto:
             return jsonify({
@@ -131,16 +308,7 @@ def get_producto(producto_id):
         
         return jsonify({
             'success': True,
-            'data': {
-                'id': producto.id,
-                'nombre': producto.nombre,
-                'precio': float(producto.precio),
-                'categoria_id': producto.categoria_id,
-                'presentacion_id': producto.presentacion_id,
-                'activo': producto.activo,
-                'created_at': producto.created_at.isoformat() if producto.created_at else None,
-                'updated_at': producto.updated_at.isoformat() if producto.updated_at else None
-            }
+            'data': serialize_producto(producto)
         }), 200
         
     except ValueError as e:
@@ -180,16 +348,7 @@ def update_producto(producto_id):
         return jsonify({
             'success': True,
             'message': 'Producto actualizado exitosamente',
-            'data': {
-                'id': producto.id,
-                'nombre': producto.nombre,
-                'precio': float(producto.precio),
-                'categoria_id': producto.categoria_id,
-                'presentacion_id': producto.presentacion_id,
-                'activo': producto.activo,
-                'created_at': producto.created_at.isoformat() if producto.created_at else None,
-                'updated_at': producto.updated_at.isoformat() if producto.updated_at else None
-            }
+            'data': serialize_producto(producto)
         }), 200
         
     except ValueError as e:
@@ -12,6 +12,9 @@ class LoginUserDTO(Schema):
     email = fields.Email(required=True, error_messages={"required": "El email es requerido"})
     password = fields.Str(required=True, error_messages={"required": "La contraseña es requerida"})
 
+class LogoutUserDTO(Schema):
+    refresh_token = fields.Str(missing=None)
+
 # DTOs para Categoría
 class CreateCategoriaDTO(Schema):
     nombre = fields.Str(required=True, validate=validate.Length(min=1, max=100),
@@ -57,6 +60,23 @@ class UpdateProductoDTO(Schema):
                                 error_messages={"required": "La presentación es requerida"})
     activo = fields.Bool(missing=True)
 
+# DTOs para operaciones masivas de Producto
+class BulkProductoChangesDTO(Schema):
+    precio = fields.Decimal(validate=validate.Range(min=0.01, max=99999999.99))
+    activo = fields.Bool()
+
+class BulkUpdateProductosDTO(Schema):
+    ids = fields.List(fields.Int(validate=validate.Range(min=1)), validate=validate.Length(min=1, max=1000))
+    categoria_id = fields.Int(validate=validate.Range(min=1))
+    presentacion_id = fields.Int(validate=validate.Range(min=1))
+    changes = fields.Nested(BulkProductoChangesDTO, required=True,
+                            error_messages={"required": "Los cambios a aplicar son requeridos"})
+
+class BulkDeleteProductosDTO(Schema):
+    ids = fields.List(fields.Int(validate=validate.Range(min=1)), validate=validate.Length(min=1, max=1000))
+    categoria_id = fields.Int(validate=validate.Range(min=1))
+    presentacion_id = fields.Int(validate=validate.Range(min=1))
+
 # Función helper para validar datos
 def validate_json(schema_class, json_data):
     schema = schema_class()
@@ -0,0 +1,74 @@
+"""
+GET condicionales (ETag / If-None-Match) para los endpoints de lectura.
+
+El ETag se deriva de la versión de las tablas de las que depende la
+respuesta (`tabla_versiones`) y de la URL completa, de modo que se calcula
+con una consulta por clave primaria y sin ejecutar la consulta del listado.
+Si el cliente ya tiene esa versión se responde `304 Not Modified` sin
+llamar a la vista. Con `?expand=` la respuesta depende también de las tablas
+de las relaciones incluidas, que se suman a las del endpoint.
+"""
+
+import hashlib
+from functools import wraps
+from typing import Dict, Optional, Tuple
+
+from flask import current_app, make_response, request
+
+from app.infrastructure.db.expand import expand_tables
+from app.infrastructure.db.routing import read_only
+from app.infrastructure.repository_impl.tabla_version_repo import TablaVersionRepository
+
+tabla_version_repo = TablaVersionRepository()
+
+# Los datos requieren autenticación: sólo la caché del navegador puede
+# guardarlos y siempre debe revalidar con If-None-Match
+CACHE_CONTROL = 'private, no-cache'
+
+
+def compute_etag(versions: dict, full_path: str) -> str:
+    firma = ';'.join(f'{tabla}:{version}' for tabla, version in sorted(versions.items()))
+    return hashlib.sha1(f'{firma}|{full_path}'.encode('utf-8')).hexdigest()
+
+
+def request_tables(tablas: Tuple[str, ...], expand: Optional[Dict[str, str]]) -> Tuple[str, ...]:
+    """Tablas de las que depende la respuesta, incluidas las relaciones expandidas"""
+    if not expand:
+        return tablas
+    return tablas + expand_tables(request.args.get('expand'), expand)
+
+
+def set_cache_headers(response, etag: str):
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = CACHE_CONTROL
+    return response
+
+
+def conditional_get(*tablas: str, expand: Optional[Dict[str, str]] = None):
+    """Responder 304 si el ETag de `tablas` coincide con If-None-Match.
+
+    `expand` asocia cada relación expandible del endpoint con su tabla.
+    Debe aplicarse debajo de `jwt_required()` para no responder a clientes
+    sin autenticar.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            # Leer la versión antes que los datos: si una escritura ocurre en
+            # medio, el ETag queda desactualizado y el cliente vuelve a pedir.
+            # Se lee de la misma fuente que los datos (la réplica, si existe)
+            # para no publicar una versión que la réplica todavía no tiene
+            with read_only():
+                etag = compute_etag(tabla_version_repo.get_versions(request_tables(tablas, expand)),
+                                    request.full_path)
+
+            if request.if_none_match.contains(etag):
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            return set_cache_headers(response, etag)
+        return wrapper
+    return decorator
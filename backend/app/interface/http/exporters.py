@@ -0,0 +1,99 @@
+"""
+Escritura en streaming de la exportación del catálogo (NDJSON y CSV).
+
+Las filas se codifican a medida que llegan del cursor del servidor y se
+agrupan en bloques de ~64 KiB para la respuesta chunked; opcionalmente se
+comprimen con gzip sobre la marcha. Ni el catálogo ni el archivo completo
+se mantienen en memoria.
+"""
+
+import csv
+import io
+import json
+import zlib
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from app.domain.entities.producto import Producto
+from app.interface.http.serializers import serialize_producto
+
+EXPORT_FORMATS = ('ndjson', 'csv')
+EXPORT_COLUMNS = (
+    'id', 'nombre', 'precio', 'categoria_id', 'presentacion_id', 'activo', 'created_at', 'updated_at'
+)
+EXPORT_MIMETYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+CHUNK_SIZE = 64 * 1024
+
+
+def validate_export_format(format_param: Optional[str]) -> str:
+    formato = (format_param or 'ndjson').lower()
+    if formato not in EXPORT_FORMATS:
+        raise ValueError(f"Formato de exportación no válido. Valores permitidos: {', '.join(EXPORT_FORMATS)}")
+    return formato
+
+
+def _producto_to_row(producto: Producto) -> Dict[str, Any]:
+    return {
+        'id': producto.id,
+        'nombre': producto.nombre,
+        'precio': producto.precio,
+        'categoria_id': producto.categoria_id,
+        'presentacion_id': producto.presentacion_id,
+        'activo': producto.activo,
+        'created_at': producto.created_at.isoformat() if producto.created_at else None,
+        'updated_at': producto.updated_at.isoformat() if producto.updated_at else None
+    }
+
+
+def iter_ndjson_lines(productos: Iterable[Producto]) -> Iterator[str]:
+    for producto in productos:
+        yield json.dumps(serialize_producto(producto), ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def iter_csv_lines(productos: Iterable[Producto]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, lineterminator='\n')
+    writer.writeheader()
+    for producto in productos:
+        writer.writerow(_producto_to_row(producto))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Un catálogo vacío todavía produce la fila de encabezados
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def iter_chunks(lines: Iterable[str], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Agrupar las líneas en bloques de UTF-8 de al menos `chunk_size` bytes"""
+    pending = []
+    size = 0
+    for line in lines:
+        data = line.encode('utf-8')
+        pending.append(data)
+        size += len(data)
+        if size >= chunk_size:
+            yield b''.join(pending)
+            pending = []
+            size = 0
+    if pending:
+        yield b''.join(pending)
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Comprimir los bloques en formato gzip (wbits=31) a medida que se producen"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def iter_export(productos: Iterable[Producto], formato: str, gzip: bool = False) -> Iterator[bytes]:
+    lines = iter_csv_lines(productos) if formato == 'csv' else iter_ndjson_lines(productos)
+    chunks = iter_chunks(lines)
+    return gzip_chunks(chunks) if gzip else chunks
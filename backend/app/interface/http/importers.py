@@ -0,0 +1,78 @@
+"""
+Lectura en streaming de archivos de importación (CSV y NDJSON).
+
+Los archivos se leen por bloques directamente del cuerpo de la petición, sin
+cargarlos completos en memoria. Cada fila se entrega como una tupla
+(número de fila, datos, error de lectura) para que el caso de uso pueda
+reportar errores por fila sin detener la importación.
+"""
+
+import codecs
+import csv
+import json
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+IMPORT_CSV_COLUMNS = ('nombre', 'precio', 'categoria_id', 'presentacion_id')
+
+_MIMETYPES = {
+    'text/csv': 'csv',
+    'application/csv': 'csv',
+    'application/x-ndjson': 'ndjson',
+    'application/ndjson': 'ndjson',
+    'application/jsonlines': 'ndjson',
+}
+
+Row = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def detect_import_format(format_param: Optional[str], mimetype: Optional[str]) -> str:
+    """Determinar el formato a partir de `?format=` o del Content-Type"""
+    formato = (format_param or _MIMETYPES.get(mimetype or '', '')).lower()
+    if formato not in IMPORT_FORMATS:
+        raise ValueError(f"Formato de importación no válido. Valores permitidos: {', '.join(IMPORT_FORMATS)}")
+    return formato
+
+
+def iter_lines(stream, chunk_size: int = 64 * 1024) -> Iterator[str]:
+    """Decodificar el stream como UTF-8 (con o sin BOM) y entregarlo línea a línea"""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')(errors='replace')
+    pending = ''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        # La última parte puede ser una línea incompleta hasta el próximo bloque
+        *lines, pending = (pending + decoder.decode(chunk)).split('\n')
+        for line in lines:
+            yield line + '\n'
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending
+
+
+def iter_csv_rows(stream) -> Iterator[Row]:
+    reader = csv.DictReader(iter_lines(stream))
+    columnas = reader.fieldnames or []
+    faltantes = [columna for columna in IMPORT_CSV_COLUMNS if columna not in columnas]
+    if faltantes:
+        raise ValueError(f"Faltan columnas en el CSV: {', '.join(faltantes)}")
+
+    for datos in reader:
+        yield reader.line_num, datos, None
+
+
+def iter_ndjson_rows(stream) -> Iterator[Row]:
+    for fila, linea in enumerate(iter_lines(stream), start=1):
+        if not linea.strip():
+            continue
+        try:
+            yield fila, json.loads(linea), None
+        except ValueError:
+            yield fila, None, "La línea no contiene un JSON válido"
+
+
+def iter_import_rows(stream, formato: str) -> Iterator[Row]:
+    if formato == 'csv':
+        return iter_csv_rows(stream)
+    return iter_ndjson_rows(stream)
@@ -0,0 +1,150 @@
+"""
+Serialización de entidades a JSON compartida por todos los blueprints.
+
+Cada entidad tiene un codificador que arma el diccionario de la respuesta
+leyendo cada atributo una sola vez. La salida es la misma que construían a
+mano los blueprints; la mayor parte del costo de una página está en la
+codificación a JSON, que es lo que acelera el proveedor orjson.
+
+`OrjsonProvider` es un proveedor JSON de Flask opcional (`JSON_PROVIDER=orjson`)
+que produce exactamente los mismos bytes que el proveedor por defecto
+(claves ordenadas, salida compacta y caracteres no ASCII escapados como
+`\\uXXXX`), pero serializa en C. Requiere el paquete `orjson`.
+"""
+
+import logging
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Dict, Iterable, List
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from app.domain.entities.categoria import Categoria
+from app.domain.entities.presentacion import Presentacion
+from app.domain.entities.producto import Producto
+
+logger = logging.getLogger(__name__)
+
+def serialize_producto(producto: Producto) -> Dict[str, Any]:
+    created_at = producto.created_at
+    updated_at = producto.updated_at
+    data = {
+        'id': producto.id,
+        'nombre': producto.nombre,
+        'precio': float(producto.precio),
+        'categoria_id': producto.categoria_id,
+        'presentacion_id': producto.presentacion_id,
+        'activo': producto.activo,
+        'created_at': created_at.isoformat() if created_at else None,
+        'updated_at': updated_at.isoformat() if updated_at else None
+    }
+    # Relaciones incluidas sólo si se pidieron con `?expand=`
+    if producto.categoria is not None:
+        data['categoria'] = _serialize_catalogo(producto.categoria)
+    if producto.presentacion is not None:
+        data['presentacion'] = _serialize_catalogo(producto.presentacion)
+    return data
+
+
+def _serialize_catalogo(entidad) -> Dict[str, Any]:
+    created_at = entidad.created_at
+    updated_at = entidad.updated_at
+    return {
+        'id': entidad.id,
+        'nombre': entidad.nombre,
+        'descripcion': entidad.descripcion,
+        'created_at': created_at.isoformat() if created_at else None,
+        'updated_at': updated_at.isoformat() if updated_at else None
+    }
+
+
+def serialize_categoria(categoria: Categoria) -> Dict[str, Any]:
+    return _serialize_catalogo(categoria)
+
+
+def serialize_presentacion(presentacion: Presentacion) -> Dict[str, Any]:
+    return _serialize_catalogo(presentacion)
+
+
+def serialize_many(serializer: Callable[[Any], Dict[str, Any]], entidades: Iterable[Any]) -> List[Dict[str, Any]]:
+    return [serializer(entidad) for entidad in entidades]
+
+
+def serialize_page(items: List[Dict[str, Any]], result, page: int, size: int) -> Dict[str, Any]:
+    """Datos de una página numerada (respuesta de los listados)"""
+    return {
+        'items': items,
+        'total': result.total,
+        'page': page,
+        'size': size,
+        'has_more': result.has_more,
+        'count_mode': result.count_mode
+    }
+
+
+def serialize_cursor_page(items: List[Dict[str, Any]], result, size: int) -> Dict[str, Any]:
+    """Datos de una página por cursor (listados con `after`)"""
+    return {
+        'items': items,
+        'size': size,
+        'next_cursor': result.next_cursor
+    }
+
+
+_ASCII_BYTES = bytes(range(128))
+
+
+def _escape_non_ascii(data: bytes) -> bytes:
+    """Escapar como `\\uXXXX` los caracteres no ASCII de un JSON en UTF-8.
+    
+    Fuera de las cadenas JSON no puede haber caracteres no ASCII, así que
+    basta con reemplazar cada carácter distinto (en un catálogo en español son
+    pocos: acentos, ñ, ¿, ¡) por el mismo escape que usa json.dumps.
+    """
+    for caracter in set(data.translate(None, _ASCII_BYTES).decode('utf-8')):
+        data = data.replace(caracter.encode('utf-8'), encode_basestring_ascii(caracter)[1:-1].encode('ascii'))
+    return data
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Proveedor JSON de Flask respaldado por orjson con salida idéntica a la por defecto"""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # Sólo la forma compacta que pide `response()` es equivalente. Sin
+        # argumentos json.dumps separa con espacios, y `compact=False` (o el
+        # modo debug) pide indentación: todo eso usa json estándar
+        if kwargs != {'separators': (',', ':')}:
+            return super().dumps(obj, **kwargs)
+        
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            data = orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            # Claves no str, enteros de más de 64 bits, etc.
+            return super().dumps(obj, **kwargs)
+        
+        if self.ensure_ascii and not data.isascii():
+            data = _escape_non_ascii(data)
+        return data.decode('utf-8')
+    
+    def loads(self, s, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+def configure_json_provider(app) -> None:
+    """Activar el proveedor JSON configurado en `JSON_PROVIDER` (default u orjson)"""
+    provider = app.config.get('JSON_PROVIDER', 'default')
+    if provider != 'orjson':
+        return
+    if orjson is None:
+        logger.warning("JSON_PROVIDER=orjson pero el paquete orjson no está instalado; se usa el proveedor por defecto")
+        return
+    app.json = OrjsonProvider(app)
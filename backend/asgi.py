@@ -0,0 +1,15 @@
+import os
+from app.interface.asgi import create_asgi_app
+
+# Modo ASGI opcional: `uvicorn asgi:app --workers 4` (requiere greenlet y un
+# servidor ASGI). Las lecturas del catálogo usan SQLAlchemy asíncrono; el resto
+# de la API la atiende la misma aplicación Flask que wsgi.py
+app = create_asgi_app()
+
+if __name__ == '__main__':
+    import uvicorn
+    
+    host = os.environ.get('FLASK_HOST', '127.0.0.1')
+    port = int(os.environ.get('FLASK_PORT', 5000))
+    
+    uvicorn.run('asgi:app', host=host, port=port)
@@ -0,0 +1,172 @@
+"""
+Lecturas concurrentes del catálogo: modo WSGI (hilos) frente a modo ASGI (async).
+
+    python -m benchmarks.bench_asgi --productos 100000 --concurrencia 8,32,128
+    python -m benchmarks.bench_asgi --modos asgi --workers 2
+
+Levanta cada modo en un proceso aparte con el mismo número de workers:
+WSGI con gunicorn (`--threads` hilos por worker; si gunicorn no está
+instalado, el servidor de desarrollo de werkzeug con un hilo por petición) y
+ASGI con uvicorn. Luego abre --concurrencia conexiones keep-alive que piden
+en bucle listados, búsquedas y detalles de productos durante --duracion
+segundos, y reporta peticiones por segundo y latencias p50/p95/p99.
+
+En modo WSGI la concurrencia útil está acotada por los hilos y el pool de
+conexiones; en modo ASGI las peticiones que esperan a PostgreSQL no ocupan
+un hilo, por lo que el rendimiento debe seguir creciendo con la concurrencia
+hasta saturar la CPU o el pool asíncrono (`DB_POOL_SIZE + DB_MAX_OVERFLOW`).
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import Counter
+from importlib.util import find_spec
+
+from benchmarks.common import create_bench_app, seed_productos
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _server_command(modo: str, host: str, port: int, workers: int, threads: int):
+    if modo == 'asgi':
+        return [sys.executable, '-m', 'uvicorn', 'asgi:app', '--host', host, '--port', str(port),
+                '--workers', str(workers), '--no-access-log', '--log-level', 'warning']
+    if find_spec('gunicorn'):
+        return [sys.executable, '-m', 'gunicorn', 'wsgi:app', '--bind', f'{host}:{port}',
+                '--workers', str(workers), '--threads', str(threads), '--log-level', 'warning']
+    print("⚠️  gunicorn no está instalado; WSGI usa el servidor de desarrollo de werkzeug (1 proceso)")
+    return [sys.executable, '-c',
+            'from werkzeug.serving import run_simple; from wsgi import app; '
+            f'run_simple({host!r}, {port}, app, threaded=True)']
+
+
+def _esperar_servidor(url: str, timeout: float = 30.0) -> None:
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"El servidor no respondió en {url}")
+
+
+async def _cliente(host, port, paths, headers, indice, stop_at, samples, estados):
+    """Una conexión keep-alive que envía peticiones de a una"""
+    reader = writer = None
+    i = indice
+    while time.perf_counter() < stop_at:
+        if writer is None:
+            reader, writer = await asyncio.open_connection(host, port)
+        path = paths[i % len(paths)]
+        i += 1
+
+        start = time.perf_counter()
+        writer.write(f'GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\n{headers}\r\n'.encode('latin-1'))
+        status = int((await reader.readline()).split()[1])
+        length, close = 0, False
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            nombre, _, valor = line.decode('latin-1').partition(':')
+            nombre = nombre.strip().lower()
+            if nombre == 'content-length':
+                length = int(valor)
+            elif nombre == 'connection' and valor.strip().lower() == 'close':
+                close = True
+        await reader.readexactly(length)
+        samples.append((time.perf_counter() - start) * 1000)
+        estados[status] += 1
+
+        if close:
+            writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def _carga(host, port, paths, token, concurrencia, duracion):
+    headers = f'Authorization: Bearer {token}\r\n'
+    samples, estados = [], Counter()
+    stop_at = time.perf_counter() + duracion
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _cliente(host, port, paths, headers, i, stop_at, samples, estados) for i in range(concurrencia)
+    ))
+    return samples, estados, time.perf_counter() - start
+
+
+def _percentil(samples, p):
+    return samples[min(len(samples) - 1, int(len(samples) * p))] if samples else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--productos', type=int, default=100_000)
+    parser.add_argument('--modos', default='wsgi,asgi')
+    parser.add_argument('--concurrencia', default='8,32,128', help='conexiones simultáneas, separadas por coma')
+    parser.add_argument('--duracion', type=float, default=10.0, help='segundos por medición')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--threads', type=int, default=8, help='hilos por worker en modo WSGI')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5055)
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    with app.app_context():
+        from app.infrastructure.auth.password_hasher import password_hasher
+        from app.infrastructure.db.base import db
+        from app.infrastructure.db.models import ProductoModel, UsuarioModel
+
+        seed_productos(args.productos)
+        usuario = UsuarioModel.query.filter_by(email='bench-asgi@benchmark.local').first()
+        if not usuario:
+            usuario = UsuarioModel(email='bench-asgi@benchmark.local', nombre='Benchmark',
+                                   password_hash=password_hasher.hash('benchmark123'))
+            db.session.add(usuario)
+            db.session.commit()
+        ids = [row.id for row in ProductoModel.query.with_entities(ProductoModel.id).limit(100)]
+        password_hasher.shutdown()
+
+    token = app.test_client().post('/api/auth/login', json={
+        'email': 'bench-asgi@benchmark.local', 'password': 'benchmark123'
+    }).get_json()['data']['access_token']
+
+    paths = ['/api/productos?size=20', '/api/productos?size=20&page=50', '/api/productos?q=bench%200001&size=20',
+             '/api/productos?after=&size=50', '/api/categorias', '/api/presentaciones']
+    paths += [f'/api/productos/{producto_id}' for producto_id in ids[:10]]
+
+    filas = []
+    for modo in args.modos.split(','):
+        server = subprocess.Popen(_server_command(modo, args.host, args.port, args.workers, args.threads),
+                                  cwd=BACKEND_DIR, env=dict(os.environ))
+        try:
+            _esperar_servidor(f'http://{args.host}:{args.port}/api/health')
+            # Calentamiento: conexiones del pool, cachés de autenticación
+            asyncio.run(_carga(args.host, args.port, paths, token, 4, 1.0))
+            for concurrencia in (int(c) for c in args.concurrencia.split(',')):
+                samples, estados, elapsed = asyncio.run(
+                    _carga(args.host, args.port, paths, token, concurrencia, args.duracion)
+                )
+                samples.sort()
+                filas.append((modo, concurrencia, len(samples) / elapsed, statistics.median(samples) if samples else 0.0,
+                              _percentil(samples, 0.95), _percentil(samples, 0.99), dict(sorted(estados.items()))))
+                print(f"{modo} c={concurrencia}: {filas[-1][2]:,.0f} req/s")
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+    print(f"\n{'modo':<8}{'conexiones':>12}{'req/s':>10}{'p50 (ms)':>10}{'p95 (ms)':>10}{'p99 (ms)':>10}  respuestas")
+    for modo, concurrencia, rps, p50, p95, p99, estados in filas:
+        print(f"{modo:<8}{concurrencia:>12}{rps:>10,.0f}{p50:>10.2f}{p95:>10.2f}{p99:>10.2f}  {estados}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Rendimiento y memoria de la exportación del catálogo (GET /api/productos/export).
+
+    python -m benchmarks.bench_export --productos 1000000 --format ndjson --gzip
+
+Recorre el mismo caso de uso y codificador que el endpoint y descarta los
+bloques producidos. El pico de memoria (tracemalloc) debe mantenerse
+constante al aumentar --productos.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.common import create_bench_app, seed_productos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--productos', type=int, default=1_000_000)
+    parser.add_argument('--format', choices=('ndjson', 'csv'), default='ndjson')
+    parser.add_argument('--gzip', action='store_true')
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    with app.app_context():
+        from app.application.use_cases.producto.export_productos import ExportProductosUseCase
+        from app.infrastructure.repository_impl.producto_repo import ProductoRepository
+        from app.interface.http.exporters import iter_export
+
+        seed_productos(args.productos)
+        use_case = ExportProductosUseCase(ProductoRepository())
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        filas = 0
+        enviados = 0
+
+        def contar(productos):
+            nonlocal filas
+            for producto in productos:
+                filas += 1
+                yield producto
+
+        for chunk in iter_export(contar(use_case.execute(batch_size=args.batch_size)), args.format, gzip=args.gzip):
+            enviados += len(chunk)
+
+        elapsed = time.perf_counter() - start
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"\nExportadas {filas:,} filas ({enviados / 1024 / 1024:,.1f} MiB) en {elapsed:.2f} s "
+          f"({filas / elapsed:,.0f} filas/s), pico de memoria {pico / 1024 / 1024:,.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
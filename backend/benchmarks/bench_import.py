@@ -0,0 +1,75 @@
+"""
+Rendimiento de la importación masiva de productos (filas por segundo).
+
+    python -m benchmarks.bench_import --filas 100000 --batch-size 1000
+
+Genera un CSV sintético en memoria por bloques y lo pasa por el mismo
+lector en streaming y caso de uso que usa POST /api/productos/import.
+El objetivo es superar las 10.000 filas/s contra un PostgreSQL local.
+"""
+
+import argparse
+import io
+import time
+import uuid
+
+from benchmarks.common import create_bench_app
+
+
+class SyntheticCSV(io.RawIOBase):
+    """Stream de sólo lectura que genera el CSV a medida que se consume"""
+
+    def __init__(self, filas: int, categoria_id: int, presentacion_id: int):
+        prefijo = uuid.uuid4().hex[:8]
+        self._lineas = (
+            f'Importado {prefijo} {i:08d},{(i % 5000) + 1}.99,{categoria_id},{presentacion_id},si\n'.encode()
+            for i in range(filas)
+        )
+        self._buffer = b'nombre,precio,categoria_id,presentacion_id,activo\n'
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        while len(self._buffer) < size:
+            linea = next(self._lineas, None)
+            if linea is None:
+                break
+            self._buffer += linea
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--filas', type=int, default=100_000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    with app.app_context():
+        from app.application.use_cases.producto.import_productos import ImportProductosUseCase
+        from app.infrastructure.db.models import CategoriaModel, PresentacionModel
+        from app.infrastructure.repository_impl.categoria_repo import CategoriaRepository
+        from app.infrastructure.repository_impl.presentacion_repo import PresentacionRepository
+        from app.infrastructure.repository_impl.producto_repo import ProductoRepository
+        from app.interface.http.importers import iter_csv_rows
+        from benchmarks.common import seed_productos
+
+        seed_productos(1)
+        categoria = CategoriaModel.query.filter_by(nombre='Benchmark').first()
+        presentacion = PresentacionModel.query.filter_by(nombre='Benchmark').first()
+
+        use_case = ImportProductosUseCase(ProductoRepository(), CategoriaRepository(), PresentacionRepository())
+        stream = SyntheticCSV(args.filas, categoria.id, presentacion.id)
+
+        start = time.perf_counter()
+        report = use_case.execute(iter_csv_rows(stream), batch_size=args.batch_size)
+        elapsed = time.perf_counter() - start
+
+    print(f"\nImportadas {report['imported']:,} de {report['processed']:,} filas "
+          f"en {elapsed:.2f} s ({report['processed'] / elapsed:,.0f} filas/s)")
+
+
+if __name__ == '__main__':
+    main()
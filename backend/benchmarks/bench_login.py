@@ -0,0 +1,114 @@
+"""
+Inicios de sesión concurrentes y latencia del catálogo durante la ráfaga.
+
+    python -m benchmarks.bench_login --usuarios 50 --hilos 16
+    PASSWORD_HASH_WORKERS=0 python -m benchmarks.bench_login   # hash en el hilo
+
+Lanza --hilos clientes que inician sesión en bucle mientras otro hilo mide
+GET /api/productos. Con el hash en el pool de procesos la latencia del
+catálogo debe mantenerse cerca de la medida en reposo; las respuestas 503
+indican que la cola (`PASSWORD_HASH_MAX_QUEUE`) se llenó.
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from collections import Counter
+
+from benchmarks.common import create_bench_app, seed_productos
+
+PASSWORD = 'benchmark123'
+
+
+def _percentiles(samples):
+    samples = sorted(samples)
+    if not samples:
+        return 0.0, 0.0
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+def _medir_catalogo(client, headers, stop, samples):
+    while not stop.is_set():
+        start = time.perf_counter()
+        client.get('/api/productos?per_page=20', headers=headers)
+        samples.append((time.perf_counter() - start) * 1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--usuarios', type=int, default=50)
+    parser.add_argument('--hilos', type=int, default=16)
+    parser.add_argument('--duracion', type=float, default=10.0, help='segundos de la ráfaga')
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    with app.app_context():
+        from app.infrastructure.auth.password_hasher import password_hasher
+        from app.infrastructure.db.base import db
+        from app.infrastructure.db.models import UsuarioModel
+
+        seed_productos(1000)
+        emails = [f'bench{i:04d}@benchmark.local' for i in range(args.usuarios)]
+        existentes = {u.email for u in UsuarioModel.query.filter(UsuarioModel.email.in_(emails))}
+        password_hash = password_hasher.hash(PASSWORD)
+        db.session.add_all(
+            UsuarioModel(email=email, password_hash=password_hash, nombre='Benchmark')
+            for email in emails if email not in existentes
+        )
+        db.session.commit()
+        print(f"Hash: {password_hasher.method}, workers={password_hasher.workers}, "
+              f"cola={password_hasher.max_queue}")
+
+    client = app.test_client()
+    token = client.post('/api/auth/login', json={'email': emails[0], 'password': PASSWORD}).get_json()
+    headers = {'Authorization': f"Bearer {token['data']['access_token']}"}
+
+    # Latencia del catálogo en reposo
+    reposo = []
+    stop = threading.Event()
+    lector = threading.Thread(target=_medir_catalogo, args=(client, headers, stop, reposo))
+    lector.start()
+    time.sleep(min(2.0, args.duracion))
+    stop.set()
+    lector.join()
+
+    # Ráfaga de inicios de sesión
+    estados = Counter()
+    lock = threading.Lock()
+    durante = []
+    stop = threading.Event()
+
+    def login(indice):
+        cliente = app.test_client()
+        i = indice
+        while not stop.is_set():
+            response = cliente.post('/api/auth/login', json={'email': emails[i % len(emails)], 'password': PASSWORD})
+            with lock:
+                estados[response.status_code] += 1
+            i += args.hilos
+
+    hilos = [threading.Thread(target=login, args=(i,)) for i in range(args.hilos)]
+    lector = threading.Thread(target=_medir_catalogo, args=(client, headers, stop, durante))
+    start = time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    lector.start()
+    time.sleep(args.duracion)
+    stop.set()
+    for hilo in hilos + [lector]:
+        hilo.join()
+    elapsed = time.perf_counter() - start
+
+    ok = estados.get(200, 0)
+    print(f"\nInicios de sesión: {ok / elapsed:,.1f}/s correctos, respuestas {dict(sorted(estados.items()))}")
+    print(f"{'catálogo':<24}{'p50 (ms)':>12}{'p95 (ms)':>12}{'peticiones':>12}")
+    for nombre, samples in (('en reposo', reposo), ('durante la ráfaga', durante)):
+        p50, p95 = _percentiles(samples)
+        print(f"{nombre:<24}{p50:>12.2f}{p95:>12.2f}{len(samples):>12}")
+
+    password_hasher.shutdown()
+
+
+if __name__ == '__main__':
+    main()
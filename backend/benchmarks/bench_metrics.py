@@ -0,0 +1,100 @@
+"""
+Costo por petición de la instrumentación de métricas (`METRICS_ENABLED`).
+
+    python -m benchmarks.bench_metrics --peticiones 20000 --max-us 50
+
+Mide por separado los hooks de `RequestMetrics` (before/after/teardown,
+incluido el encabezado Server-Timing) dentro de un contexto de petición, el
+costo de los eventos de cursor por consulta SQL y la diferencia de extremo a
+extremo en /api/health entre una aplicación con métricas y otra sin ellas
+(con el cliente de pruebas de Flask, alternando bloques para repartir el
+ruido). Termina con código 1 si los hooks superan --max-us por petición.
+"""
+
+import argparse
+import sys
+import time
+
+from sqlalchemy import text
+
+from config import Config
+
+
+def _por_iteracion_us(fn, iteraciones: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iteraciones):
+        fn()
+    return (time.perf_counter() - start) / iteraciones * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--peticiones', type=int, default=20_000)
+    parser.add_argument('--consultas', type=int, default=5_000)
+    parser.add_argument('--bloques', type=int, default=5, help='bloques alternados con y sin métricas')
+    parser.add_argument('--max-us', type=float, default=50.0, help='presupuesto de los hooks por petición')
+    args = parser.parse_args()
+    
+    from app import create_app
+    from app.infrastructure.db.base import db
+    from app.infrastructure.monitoring.request_metrics import request_metrics
+    
+    class SinMetricas(Config):
+        METRICS_ENABLED = False
+    
+    sin_metricas = create_app(SinMetricas)
+    # La última en inicializarse es la que configura el singleton `request_metrics`
+    con_metricas = create_app(Config)
+    
+    # Hooks aislados
+    with con_metricas.test_request_context('/api/health'):
+        response = con_metricas.response_class('{}')
+        
+        def hooks():
+            request_metrics._before_request()
+            request_metrics._after_request(response)
+            request_metrics._teardown_request(None)
+        
+        hooks_us = min(_por_iteracion_us(hooks, args.peticiones) for _ in range(3))
+    
+    # Eventos de cursor: la misma consulta dentro y fuera de una petición medida
+    with con_metricas.test_request_context('/api/health'):
+        def consulta():
+            db.session.execute(text('SELECT 1'))
+        
+        consulta()
+        sin_medir, medida = [], []
+        for _ in range(args.bloques):
+            sin_medir.append(_por_iteracion_us(consulta, args.consultas))
+            request_metrics._before_request()
+            medida.append(_por_iteracion_us(consulta, args.consultas))
+            request_metrics._teardown_request(None)
+        db.session.remove()
+        sin_medir_us, medida_us = min(sin_medir), min(medida)
+    
+    # Extremo a extremo
+    clientes = {'con métricas': con_metricas.test_client(), 'sin métricas': sin_metricas.test_client()}
+    tiempos = {nombre: [] for nombre in clientes}
+    por_bloque = max(1, args.peticiones // args.bloques)
+    for cliente in clientes.values():
+        _por_iteracion_us(lambda: cliente.get('/api/health'), 500)
+    for _ in range(args.bloques):
+        for nombre, cliente in clientes.items():
+            tiempos[nombre].append(_por_iteracion_us(lambda: cliente.get('/api/health'), por_bloque))
+    
+    con_us = min(tiempos['con métricas'])
+    sin_us = min(tiempos['sin métricas'])
+    print(f"\n{'caso':<40}{'us':>10}")
+    print(f"{'hooks por petición':<40}{hooks_us:>10.1f}")
+    print(f"{'eventos de cursor por consulta':<40}{medida_us - sin_medir_us:>10.1f}")
+    print(f"{'GET /api/health sin métricas':<40}{sin_us:>10.1f}")
+    print(f"{'GET /api/health con métricas':<40}{con_us:>10.1f}")
+    print(f"{'diferencia':<40}{con_us - sin_us:>10.1f}")
+    
+    if hooks_us > args.max_us:
+        print(f"\n❌ Los hooks cuestan {hooks_us:.1f} us por petición (presupuesto {args.max_us:.0f} us)")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Latencia de la página 1 frente a una página profunda: OFFSET/LIMIT contra cursor.
+
+    python -m benchmarks.bench_pagination --productos 1000000 --size 100 --page 10000
+
+Con paginación por cursor la latencia de la página profunda debe mantenerse
+prácticamente igual a la de la primera página.
+"""
+
+import argparse
+
+from benchmarks.common import create_bench_app, measure, print_table, seed_productos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--productos', type=int, default=1_000_000)
+    parser.add_argument('--size', type=int, default=100)
+    parser.add_argument('--page', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    with app.app_context():
+        from app.infrastructure.db.models import ProductoModel
+        from app.infrastructure.db.pagination import encode_cursor
+        from app.infrastructure.repository_impl.producto_repo import ProductoRepository
+
+        seed_productos(max(args.productos, args.page * args.size))
+        repo = ProductoRepository()
+
+        # Cursor equivalente al inicio de la página profunda (fuera de la medición)
+        previo = (ProductoModel.query
+                  .order_by(ProductoModel.nombre, ProductoModel.id)
+                  .offset((args.page - 1) * args.size - 1)
+                  .first())
+        cursor_profundo = encode_cursor(previo.nombre, previo.id)
+
+        resultados = {
+            'offset página 1': measure(
+                lambda: repo.get_all(page=1, per_page=args.size), args.repeat),
+            f'offset página {args.page}': measure(
+                lambda: repo.get_all(page=args.page, per_page=args.size), args.repeat),
+            'cursor página 1': measure(
+                lambda: repo.get_all_after(after='', per_page=args.size), args.repeat),
+            f'cursor página {args.page}': measure(
+                lambda: repo.get_all_after(after=cursor_profundo, per_page=args.size), args.repeat),
+        }
+
+    print_table(f'Paginación de productos ({args.size} por página)', resultados)
+
+
+if __name__ == '__main__':
+    main()
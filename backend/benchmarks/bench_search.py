@@ -0,0 +1,45 @@
+"""
+Latencia de la búsqueda `?q=` por subcadena a distintos tamaños de catálogo.
+
+    python -m benchmarks.bench_search --tamanos 100000 1000000
+
+Con los índices de trigramas (migración c7d91e3a4f20) la latencia de los
+términos selectivos debe crecer muy poco entre 100k y 1M productos.
+"""
+
+import argparse
+
+from benchmarks.common import create_bench_app, measure, print_table, seed_productos
+
+TERMINOS = {
+    'selectivo (1 fila)': '00012345',
+    'medio (~0.1%)': 'bench 00012',
+    'sin coincidencias': 'no-existe',
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--size', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    with app.app_context():
+        from app.infrastructure.repository_impl.producto_repo import ProductoRepository
+
+        repo = ProductoRepository()
+        for tamano in sorted(args.tamanos):
+            seed_productos(tamano)
+            resultados = {
+                nombre: measure(
+                    lambda termino=termino: repo.get_all(page=1, per_page=args.size, search=termino),
+                    args.repeat)
+                for nombre, termino in TERMINOS.items()
+            }
+            print_table(f'Búsqueda por subcadena con {tamano:,} productos', resultados)
+
+
+if __name__ == '__main__':
+    main()
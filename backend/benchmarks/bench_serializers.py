@@ -0,0 +1,86 @@
+"""
+Tiempo de serialización de una página de productos, antes y después de la
+capa compartida de serializadores.
+
+    python -m benchmarks.bench_serializers --entidades 1000
+
+Compara el diccionario armado a mano (como lo hacían los blueprints) con
+`serialize_producto`, y el proveedor JSON por defecto con `OrjsonProvider`.
+No requiere base de datos. También verifica que todas las variantes produzcan
+exactamente los mismos bytes.
+"""
+
+import argparse
+from datetime import datetime
+from decimal import Decimal
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from benchmarks.common import measure, print_table
+
+
+def _producto_a_mano(producto):
+    return {
+        'id': producto.id,
+        'nombre': producto.nombre,
+        'precio': float(producto.precio),
+        'categoria_id': producto.categoria_id,
+        'presentacion_id': producto.presentacion_id,
+        'activo': producto.activo,
+        'created_at': producto.created_at.isoformat() if producto.created_at else None,
+        'updated_at': producto.updated_at.isoformat() if producto.updated_at else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--entidades', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    from app.domain.entities.producto import Producto
+    from app.interface.http.serializers import OrjsonProvider, orjson, serialize_many, serialize_producto
+
+    ahora = datetime(2025, 9, 20, 12, 30, 45, 123456)
+    productos = [
+        Producto(id=i, nombre=f'Jugo de maracuyá {i:05d}', precio=Decimal('12.50') + i,
+                 categoria_id=(i % 10) + 1, presentacion_id=(i % 4) + 1, activo=bool(i % 3),
+                 created_at=ahora, updated_at=ahora)
+        for i in range(1, args.entidades + 1)
+    ]
+
+    app = Flask(__name__)
+    estandar = DefaultJSONProvider(app)
+
+    def cuerpo(items):
+        return {'success': True, 'data': {'items': items, 'total': len(items), 'page': 1, 'size': len(items)}}
+
+    def antes():
+        return estandar.dumps(cuerpo([_producto_a_mano(p) for p in productos]), separators=(',', ':'))
+
+    def despues():
+        return estandar.dumps(cuerpo(serialize_many(serialize_producto, productos)), separators=(',', ':'))
+
+    casos = {
+        'dict a mano + json': antes,
+        'serialize_producto + json': despues,
+    }
+    if orjson is not None:
+        rapido = OrjsonProvider(app)
+
+        def con_orjson():
+            return rapido.dumps(cuerpo(serialize_many(serialize_producto, productos)), separators=(',', ':'))
+
+        casos['serialize_producto + orjson'] = con_orjson
+
+    referencia = antes()
+    for nombre, fn in casos.items():
+        assert fn() == referencia, f"La salida de '{nombre}' difiere de la original"
+
+    print_table(f'Serialización de {args.entidades:,} productos',
+                {nombre: measure(fn, args.repeat) for nombre, fn in casos.items()})
+
+
+if __name__ == '__main__':
+    main()
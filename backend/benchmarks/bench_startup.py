@@ -0,0 +1,106 @@
+"""
+Tiempo de arranque en frío de un worker: import de la aplicación y create_app().
+
+    python -m benchmarks.bench_startup --max-import-ms 1200 --max-create-app-ms 250
+
+Cada medición se hace en un proceso nuevo con `python -X importtime`, como
+al arrancar un worker de gunicorn. Termina con código 1 si la mediana supera
+el presupuesto o si create_app() carga módulos que sólo necesitan los
+comandos de línea de comandos (alembic, Flask-Migrate), para detectar
+regresiones en CI. No requiere base de datos: create_app() no debe conectarse.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+# Módulos que no deben cargarse al crear la aplicación
+FORBIDDEN_MODULES = ('alembic', 'flask_migrate')
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+create_app()
+created = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'create_app_ms': (created - imported) * 1000,
+    'forbidden': [m for m in %r if m in sys.modules],
+}))
+"""
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$')
+
+
+def run_probe():
+    env = dict(os.environ)
+    env.setdefault('JWT_SECRET_KEY', 'benchmark')
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', PROBE % (FORBIDDEN_MODULES,)],
+        cwd=backend_dir, env=env, capture_output=True, text=True, check=True
+    )
+    medicion = json.loads(result.stdout.strip().splitlines()[-1])
+
+    # Tiempo propio (sin submódulos) de cada módulo, en microsegundos
+    propios = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            propios[match.group(4)] = int(match.group(1))
+    return medicion, propios
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--max-import-ms', type=float, default=1200.0)
+    parser.add_argument('--max-create-app-ms', type=float, default=250.0)
+    parser.add_argument('--top', type=int, default=10, help='módulos más lentos a mostrar')
+    args = parser.parse_args()
+
+    # El primer proceso compila los .pyc; no se cuenta
+    run_probe()
+
+    mediciones = []
+    propios = {}
+    forbidden = set()
+    for _ in range(args.repeat):
+        medicion, propios = run_probe()
+        mediciones.append(medicion)
+        forbidden.update(medicion['forbidden'])
+
+    import_ms = statistics.median(m['import_ms'] for m in mediciones)
+    create_app_ms = statistics.median(m['create_app_ms'] for m in mediciones)
+
+    print(f"\n{'etapa':<24}{'mediana (ms)':>14}{'presupuesto (ms)':>18}")
+    print(f"{'import app':<24}{import_ms:>14.1f}{args.max_import_ms:>18.1f}")
+    print(f"{'create_app()':<24}{create_app_ms:>14.1f}{args.max_create_app_ms:>18.1f}")
+
+    print(f"\nMódulos con más tiempo de import propio (última ejecución):")
+    for nombre, micros in sorted(propios.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {nombre:<48}{micros / 1000:>8.1f} ms")
+
+    errores = []
+    if import_ms > args.max_import_ms:
+        errores.append(f"el import de la aplicación tarda {import_ms:.1f} ms (presupuesto {args.max_import_ms:.1f} ms)")
+    if create_app_ms > args.max_create_app_ms:
+        errores.append(f"create_app() tarda {create_app_ms:.1f} ms (presupuesto {args.max_create_app_ms:.1f} ms)")
+    if forbidden:
+        errores.append(f"create_app() carga módulos sólo necesarios en la CLI: {', '.join(sorted(forbidden))}")
+
+    if errores:
+        for error in errores:
+            print(f"\n❌ {error}")
+        sys.exit(1)
+    print("\n✅ Arranque dentro del presupuesto")
+
+
+if __name__ == '__main__':
+    main()
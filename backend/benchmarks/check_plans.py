@@ -0,0 +1,188 @@
+"""
+Verificación de los planes de ejecución de las consultas de los repositorios.
+
+    python -m benchmarks.check_plans --productos 200000 --min-filas 10000
+
+Completa el catálogo con `CatalogSeeder` (los planes sólo son representativos
+con volúmenes realistas y estadísticas actualizadas), ejecuta los métodos de
+lectura de los repositorios registrando cada SELECT que emiten y envía cada
+una de nuevo con `EXPLAIN (FORMAT JSON)`. Termina con código 1 si algún plan
+recorre secuencialmente (`Seq Scan`) una tabla con al menos --min-filas filas
+estimadas; en las tablas pequeñas el recorrido secuencial es lo correcto.
+
+Sólo PostgreSQL: el planificador de otros motores no dice nada de producción.
+"""
+
+import argparse
+import json
+import sys
+from itertools import islice
+
+from sqlalchemy import event, text
+
+from benchmarks.common import create_bench_app
+
+
+def _seq_scans(plan):
+    """Tablas recorridas con Seq Scan en el árbol `plan`"""
+    if plan.get('Node Type') == 'Seq Scan':
+        yield plan['Relation Name']
+    for hijo in plan.get('Plans', ()):
+        yield from _seq_scans(hijo)
+
+
+def _primeros(iterador, n):
+    # Cerrar el generador libera el cursor del servidor de iter_all
+    filas = list(islice(iterador, n))
+    iterador.close()
+    return filas
+
+
+def _rechazado(fn):
+    # Los borrados de entidades con productos deben fallar tras la verificación
+    try:
+        fn()
+    except ValueError:
+        return
+    raise AssertionError('Se esperaba que el borrado fuera rechazado')
+
+
+def verificar_planes(productos_total, categorias_total, presentaciones_total, min_filas):
+    """
+    Completar el catálogo y explicar las consultas de lectura de los repositorios.
+
+    Requiere un app context sobre PostgreSQL. Devuelve `(grandes, resultados)`:
+    las tablas con al menos `min_filas` filas estimadas y, por caso, el número
+    de consultas emitidas y las `(statement, tablas)` con Seq Scan en ellas.
+    """
+    from app.infrastructure.db.base import db
+    from app.infrastructure.db.counting import COUNT_ESTIMATE
+    from app.infrastructure.db.models import ProductoModel
+    from app.infrastructure.db.pagination import encode_cursor
+    from app.infrastructure.db.search import SEARCH_MODE_FULLTEXT
+    from app.infrastructure.db.seed import CatalogSeeder
+    from app.infrastructure.repository_impl.categoria_repo import CategoriaRepository
+    from app.infrastructure.repository_impl.presentacion_repo import PresentacionRepository
+    from app.infrastructure.repository_impl.producto_repo import ProductoRepository
+
+    seeder = CatalogSeeder()
+    seeder.seed_categorias(categorias_total)
+    seeder.seed_presentaciones(presentaciones_total)
+    seeder.seed_productos(productos_total)
+    for tabla in ('categorias', 'presentaciones', 'productos'):
+        db.session.execute(text(f'ANALYZE {tabla}'))
+    db.session.commit()
+
+    grandes = {
+        tabla for tabla, filas in db.session.execute(
+            text("SELECT relname, reltuples FROM pg_class WHERE relkind = 'r' AND relnamespace = "
+                 "'public'::regnamespace")
+        )
+        if filas >= min_filas
+    }
+
+    # Un producto del medio de la tabla como muestra de los filtros
+    muestra = ProductoModel.query.order_by(ProductoModel.id).offset(productos_total // 2).first()
+    categoria, presentacion = muestra.categoria_id, muestra.presentacion_id
+    muestra_id, muestra_nombre = muestra.id, muestra.nombre
+    sufijo = muestra_nombre.split()[-1]
+    cursor = encode_cursor(muestra_nombre, muestra_id)
+
+    productos = ProductoRepository()
+    categorias = CategoriaRepository()
+    presentaciones = PresentacionRepository()
+    casos = {
+        'listado página 1': lambda: productos.get_all(page=1, per_page=20, count_mode=COUNT_ESTIMATE),
+        'listado página 50': lambda: productos.get_all(page=50, per_page=20, count_mode=COUNT_ESTIMATE),
+        'listado expandido': lambda: productos.get_all(
+            per_page=20, count_mode=COUNT_ESTIMATE, expand=('categoria', 'presentacion')),
+        'listado por categoría': lambda: productos.get_all(categoria_id=categoria),
+        'listado por presentación': lambda: productos.get_all(presentacion_id=presentacion),
+        'listado por categoría y presentación': lambda: productos.get_all(
+            categoria_id=categoria, presentacion_id=presentacion),
+        'búsqueda por subcadena': lambda: productos.get_all(search=sufijo),
+        'búsqueda de texto completo': lambda: productos.get_all(
+            search=sufijo, search_mode=SEARCH_MODE_FULLTEXT),
+        'cursor página 1': lambda: productos.get_all_after(after='', per_page=20),
+        'cursor por categoría': lambda: productos.get_all_after(
+            after=cursor, per_page=20, categoria_id=categoria),
+        'cursor por presentación': lambda: productos.get_all_after(
+            after=cursor, per_page=20, presentacion_id=presentacion),
+        'detalle': lambda: productos.get_by_id(muestra_id, expand=('categoria', 'presentacion')),
+        'por nombre': lambda: productos.get_by_nombre(muestra_nombre.upper()),
+        'nombre existente': lambda: productos.exists_by_nombre(muestra_nombre, exclude_id=muestra_id),
+        'nombres existentes': lambda: productos.get_existing_nombres([muestra_nombre, 'No existe']),
+        'exportación por categoría': lambda: _primeros(productos.iter_all(categoria_id=categoria), 10),
+        'borrar categoría con productos': lambda: _rechazado(lambda: categorias.delete(categoria)),
+        'borrar presentación con productos': lambda: _rechazado(lambda: presentaciones.delete(presentacion)),
+    }
+
+    consultas = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+            consultas.append((statement, parameters))
+
+    resultados = {}
+    for nombre, fn in casos.items():
+        consultas.clear()
+        event.listen(db.engine, 'before_cursor_execute', registrar)
+        try:
+            fn()
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', registrar)
+        db.session.rollback()
+
+        fallas = []
+        for statement, parameters in consultas:
+            plan = db.session.connection().exec_driver_sql(
+                'EXPLAIN (FORMAT JSON) ' + statement, parameters
+            ).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            tablas = sorted(set(_seq_scans(plan[0]['Plan'])) & grandes)
+            if tablas:
+                fallas.append((statement, tablas))
+        resultados[nombre] = (len(consultas), fallas)
+    db.session.rollback()
+
+    return grandes, resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--productos', type=int, default=200_000)
+    parser.add_argument('--categorias', type=int, default=2_000)
+    parser.add_argument('--presentaciones', type=int, default=300)
+    parser.add_argument('--min-filas', type=int, default=10_000,
+                        help='tablas con al menos estas filas no pueden recorrerse secuencialmente')
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    with app.app_context():
+        from app.infrastructure.db.base import db
+
+        if db.engine.dialect.name != 'postgresql':
+            print('❌ La verificación de planes requiere PostgreSQL')
+            sys.exit(2)
+
+        grandes, resultados = verificar_planes(
+            args.productos, args.categorias, args.presentaciones, args.min_filas
+        )
+
+    print(f"\nPlanes de ejecución (tablas grandes: {', '.join(sorted(grandes)) or 'ninguna'})")
+    print(f"{'caso':<40}{'consultas':>10}  resultado")
+    for nombre, (total, fallas) in resultados.items():
+        estado = 'Seq Scan en ' + ', '.join(sorted({t for _, tablas in fallas for t in tablas})) if fallas else 'ok'
+        print(f"{nombre:<40}{total:>10}  {estado}")
+
+    fallidos = {nombre: fallas for nombre, (_, fallas) in resultados.items() if fallas}
+    if fallidos:
+        for nombre, fallas in fallidos.items():
+            for statement, tablas in fallas:
+                print(f"\n❌ {nombre}: Seq Scan en {', '.join(tablas)}\n{statement}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
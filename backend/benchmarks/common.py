@@ -0,0 +1,92 @@
+"""
+Utilidades compartidas por los benchmarks del backend.
+
+Los benchmarks se ejecutan contra la base de datos configurada en `.env`
+(nunca contra producción) desde el directorio `backend/`:
+
+    python -m benchmarks.bench_pagination --productos 1000000
+"""
+
+import statistics
+import time
+from decimal import Decimal
+from typing import Callable, Dict
+
+from sqlalchemy import func, insert, select
+
+
+def create_bench_app(config_class=None):
+    """Crear la aplicación Flask con la configuración del entorno (o `config_class`)"""
+    from app import create_app
+    from app.infrastructure.db.base import db
+
+    app = create_app(config_class) if config_class else create_app()
+    with app.app_context():
+        # Sólo el primario: una réplica recibe el esquema por replicación
+        db.create_all(bind_key=None)
+    return app
+
+
+def seed_productos(total: int, batch_size: int = 5000) -> int:
+    """Asegurar que existan al menos `total` productos (requiere app context)"""
+    from app.infrastructure.db.base import db
+    from app.infrastructure.db.models import CategoriaModel, PresentacionModel, ProductoModel
+
+    actuales = db.session.scalar(select(func.count()).select_from(ProductoModel))
+    if actuales >= total:
+        return actuales
+
+    categoria = CategoriaModel.query.filter_by(nombre='Benchmark').first()
+    if not categoria:
+        categoria = CategoriaModel(nombre='Benchmark', descripcion='Datos de benchmark')
+        db.session.add(categoria)
+    presentacion = PresentacionModel.query.filter_by(nombre='Benchmark').first()
+    if not presentacion:
+        presentacion = PresentacionModel(nombre='Benchmark', descripcion='Datos de benchmark')
+        db.session.add(presentacion)
+    db.session.commit()
+
+    for inicio in range(actuales, total, batch_size):
+        fin = min(inicio + batch_size, total)
+        db.session.execute(insert(ProductoModel), [
+            {
+                'nombre': f'Producto bench {i:08d}',
+                'precio': Decimal('9.99'),
+                'activo': True,
+                'categoria_id': categoria.id,
+                'presentacion_id': presentacion.id,
+            }
+            for i in range(inicio, fin)
+        ])
+        db.session.commit()
+    return total
+
+
+def measure(fn: Callable[[], object], repeat: int = 20, warmup: int = 3) -> Dict[str, float]:
+    """Ejecutar `fn` varias veces y devolver la latencia en milisegundos"""
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    mean = statistics.fmean(samples)
+    return {
+        'p50_ms': statistics.median(samples),
+        'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        'p99_ms': samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        'mean_ms': mean,
+        # Operaciones por segundo de un solo cliente (secuencial)
+        'ops_s': 1000 / mean if mean else 0.0,
+    }
+
+
+def print_table(title: str, rows: Dict[str, Dict[str, float]]) -> None:
+    print(f"\n{title}")
+    print(f"{'caso':<32}{'p50 (ms)':>12}{'p95 (ms)':>12}{'media (ms)':>12}")
+    for name, stats in rows.items():
+        print(f"{name:<32}{stats['p50_ms']:>12.2f}{stats['p95_ms']:>12.2f}{stats['mean_ms']:>12.2f}")
@@ -0,0 +1,310 @@
+"""
+Suite de rendimiento reproducible con curvas por tamaño del catálogo.
+
+    python -m benchmarks.suite --tamanos 10000,100000,1000000
+    python -m benchmarks.suite --tamanos 10000 --repeat 50 --salida resultados.json
+    python -m benchmarks.suite --comparar base.json nuevo.json --umbral 1.25
+
+Para cada tamaño (en orden creciente: la base sólo crece) completa los
+productos con `seed_productos` y mide con el cliente de pruebas de Flask
+las operaciones de la API (listado, página profunda, cursor, búsquedas,
+detalle, alta, modificación, login y renovación del token), y por separado
+los métodos del repositorio y la serialización de una página. De cada caso
+registra p50/p95/p99, media y operaciones por segundo de un cliente.
+
+Los resultados se guardan en JSON junto con el commit, la versión de Python y
+el motor de base de datos, para comparar dos ejecuciones con `--comparar`:
+la tabla muestra la razón nuevo/base del p50 de cada caso y termina con
+código 1 si alguno supera `--umbral`. Las regresiones que dependen del
+tamaño (OFFSET, LIKE sin índice, COUNT exacto) aparecen como una razón que
+crece con el tamaño en la curva de cada caso.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import sqlalchemy
+
+from benchmarks.common import create_bench_app, measure, seed_productos
+from config import Config
+
+PASSWORD = 'benchmark123'
+EMAIL = 'bench-suite@benchmark.local'
+SIZE = 20
+
+
+class SuiteConfig(Config):
+    # Sin límite de intentos: el caso de login lo repite decenas de veces
+    LOGIN_RATE_LIMIT_PER_EMAIL = 0
+    LOGIN_RATE_LIMIT_PER_IP = 0
+    # Los logs de cada login no deben sumar a la latencia medida
+    LOG_LEVEL = 'WARNING'
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'desconocido'
+
+
+def _check(response, status: int = 200):
+    if response.status_code != status:
+        raise RuntimeError(f"Respuesta {response.status_code} inesperada: {response.get_data(as_text=True)[:200]}")
+    return response
+
+
+def _preparar_usuario():
+    """Crear el usuario del benchmark si no existe (requiere app context)"""
+    from app.infrastructure.auth.password_hasher import password_hasher
+    from app.infrastructure.db.base import db
+    from app.infrastructure.db.models import UsuarioModel
+    
+    if not UsuarioModel.query.filter_by(email=EMAIL).first():
+        db.session.add(UsuarioModel(email=EMAIL, nombre='Benchmark', password_hash=password_hasher.hash(PASSWORD)))
+        db.session.commit()
+
+
+def _casos_http(app, tamano: int, rng: random.Random):
+    """Operaciones de la API a través del cliente de pruebas"""
+    from app.infrastructure.db.models import CategoriaModel, PresentacionModel, ProductoModel
+    
+    client = app.test_client()
+    tokens = _check(client.post('/api/auth/login', json={'email': EMAIL, 'password': PASSWORD})).get_json()['data']
+    headers = {'Authorization': f"Bearer {tokens['access_token']}"}
+    refresh_headers = {'Authorization': f"Bearer {tokens['refresh_token']}"}
+    
+    with app.app_context():
+        categoria_id = CategoriaModel.query.filter_by(nombre='Benchmark').first().id
+        presentacion_id = PresentacionModel.query.filter_by(nombre='Benchmark').first().id
+        ids = [row.id for row in ProductoModel.query.with_entities(ProductoModel.id)
+               .order_by(ProductoModel.id).limit(1000)]
+        # La modificación conserva el nombre y sólo alterna el precio
+        objetivo = ids[len(ids) // 2]
+        nombre_objetivo = ProductoModel.query.get(objetivo).nombre
+    pagina_media = max(1, tamano // SIZE // 2)
+    creados = []
+    contador = iter(range(10 ** 9))
+    
+    def get(url):
+        return lambda: _check(client.get(url, headers=headers))
+    
+    def crear():
+        response = _check(client.post('/api/productos', headers=headers, json={
+            'nombre': f'Producto suite {tamano} {next(contador):06d}', 'precio': 10.5,
+            'categoria_id': categoria_id, 'presentacion_id': presentacion_id
+        }), 201)
+        creados.append(response.get_json()['data']['id'])
+    
+    def modificar():
+        _check(client.put(f'/api/productos/{objetivo}', headers=headers, json={
+            'nombre': nombre_objetivo, 'precio': rng.choice((9.99, 12.5)),
+            'categoria_id': categoria_id, 'presentacion_id': presentacion_id
+        }))
+    
+    casos = {
+        'listado página 1': get(f'/api/productos?size={SIZE}'),
+        'listado página media': get(f'/api/productos?size={SIZE}&page={pagina_media}'),
+        'listado conteo estimado': get(f'/api/productos?size={SIZE}&page={pagina_media}&count=estimate'),
+        'listado por cursor': get(f'/api/productos?size={SIZE}&after='),
+        'listado expandido': get(f'/api/productos?size={SIZE}&expand=categoria,presentacion'),
+        'búsqueda selectiva': get(f'/api/productos?size={SIZE}&q=bench%200000123'),
+        'búsqueda amplia': get(f'/api/productos?size={SIZE}&q=bench'),
+        'búsqueda texto completo': get(f'/api/productos?size={SIZE}&q=bench&search_mode=fulltext'),
+        'detalle': lambda: _check(client.get(f'/api/productos/{rng.choice(ids)}', headers=headers)),
+        'alta': crear,
+        'modificación': modificar,
+        'login': lambda: _check(client.post('/api/auth/login', json={'email': EMAIL, 'password': PASSWORD})),
+        'renovación del token': lambda: _check(client.post('/api/auth/refresh', headers=refresh_headers)),
+    }
+    return casos, creados
+
+
+def _casos_repositorio(tamano: int, rng: random.Random):
+    """Métodos del repositorio sin la capa HTTP (requiere app context)"""
+    from app.infrastructure.db.models import ProductoModel
+    from app.infrastructure.repository_impl.producto_repo import ProductoRepository
+    
+    repo = ProductoRepository()
+    ids = [row.id for row in ProductoModel.query.with_entities(ProductoModel.id).order_by(ProductoModel.id).limit(1000)]
+    pagina_media = max(1, tamano // SIZE // 2)
+    return {
+        'get_all página 1': lambda: repo.get_all(page=1, per_page=SIZE),
+        'get_all página media': lambda: repo.get_all(page=pagina_media, per_page=SIZE),
+        'get_all sin conteo': lambda: repo.get_all(page=pagina_media, per_page=SIZE, count_mode='none'),
+        'get_all_after': lambda: repo.get_all_after(after='', per_page=SIZE),
+        'get_all búsqueda': lambda: repo.get_all(per_page=SIZE, search='bench 0000123'),
+        'get_by_id': lambda: repo.get_by_id(rng.choice(ids)),
+    }
+
+
+def _casos_serializacion():
+    """Serialización de una página de 100 productos (sin base de datos)"""
+    from flask import json as flask_json
+    
+    from app.domain.entities.categoria import Categoria
+    from app.domain.entities.presentacion import Presentacion
+    from app.domain.entities.producto import Producto
+    from app.interface.http.serializers import serialize_many, serialize_producto
+    
+    ahora = datetime(2025, 9, 20, 12, 30, 45)
+    categoria = Categoria(id=1, nombre='Bebidas', descripcion='Bebidas frías', created_at=ahora, updated_at=ahora)
+    presentacion = Presentacion(id=1, nombre='Botella 500 ml', descripcion=None, created_at=ahora, updated_at=ahora)
+    productos = [
+        Producto(id=i, nombre=f'Jugo de maracuyá {i:05d}', precio=Decimal('12.50'), categoria_id=1,
+                 presentacion_id=1, created_at=ahora, updated_at=ahora)
+        for i in range(100)
+    ]
+    expandidos = [
+        Producto(id=p.id, nombre=p.nombre, precio=p.precio, categoria_id=1, presentacion_id=1, created_at=ahora,
+                 updated_at=ahora, categoria=categoria, presentacion=presentacion)
+        for p in productos
+    ]
+    # Los mismos argumentos que usa `jsonify` para la respuesta compacta
+    compacto = {'separators': (',', ':')}
+    return {
+        'página de 100': lambda: flask_json.dumps(serialize_many(serialize_producto, productos), **compacto),
+        'página de 100 expandida': lambda: flask_json.dumps(
+            serialize_many(serialize_producto, expandidos), **compacto),
+    }
+
+
+def _medir(casos, repeat: int):
+    resultados = {}
+    for nombre, fn in casos.items():
+        resultados[nombre] = measure(fn, repeat)
+        print(f"  {nombre:<28}p50 {resultados[nombre]['p50_ms']:>9.2f} ms   "
+              f"p99 {resultados[nombre]['p99_ms']:>9.2f} ms   {resultados[nombre]['ops_s']:>9.1f} op/s")
+    return resultados
+
+
+def _limpiar(app, ids):
+    """Borrar los productos creados por el caso de alta para no alterar el tamaño"""
+    from app.infrastructure.db.base import db
+    from app.infrastructure.db.models import ProductoModel
+    
+    with app.app_context():
+        for inicio in range(0, len(ids), 1000):
+            ProductoModel.query.filter(ProductoModel.id.in_(ids[inicio:inicio + 1000])).delete(
+                synchronize_session=False)
+        db.session.commit()
+
+
+def _imprimir_curvas(resultados) -> None:
+    tamanos = list(resultados)
+    for grupo in ('http', 'repositorio', 'serializacion'):
+        print(f"\n{grupo}: p50 (ms) por tamaño")
+        print(f"{'caso':<28}" + ''.join(f"{int(t):>12,}" for t in tamanos))
+        for caso in resultados[tamanos[0]][grupo]:
+            print(f"{caso:<28}" + ''.join(f"{resultados[t][grupo][caso]['p50_ms']:>12.2f}" for t in tamanos))
+
+
+def ejecutar(args, config_class=SuiteConfig) -> None:
+    app = create_bench_app(config_class)
+    rng = random.Random(args.semilla)
+    resultados = {}
+    
+    from app.infrastructure.auth.password_hasher import password_hasher
+    from app.infrastructure.db.base import db
+    
+    with app.app_context():
+        dialecto = db.engine.dialect.name
+        _preparar_usuario()
+    
+    for tamano in sorted(int(t) for t in args.tamanos.split(',')):
+        with app.app_context():
+            print(f"\n== {tamano:,} productos (cargando datos...)")
+            # Los datos sólo se agregan: una base más grande falsearía la curva
+            actuales = seed_productos(tamano)
+            if actuales > tamano:
+                sys.exit(f"La base ya tiene {actuales:,} productos, más que el tamaño {tamano:,}; "
+                         "use una base vacía o tamaños mayores")
+        
+        print("API")
+        casos, creados = _casos_http(app, tamano, rng)
+        http = _medir(casos, args.repeat)
+        _limpiar(app, creados)
+        
+        print("Repositorio")
+        with app.app_context():
+            repositorio = _medir(_casos_repositorio(tamano, rng), args.repeat)
+        
+        print("Serialización")
+        with app.app_context():
+            serializacion = _medir(_casos_serializacion(), args.repeat)
+        
+        resultados[str(tamano)] = {'http': http, 'repositorio': repositorio, 'serializacion': serializacion}
+    
+    password_hasher.shutdown()
+    _imprimir_curvas(resultados)
+    
+    salida = args.salida or os.path.join(
+        'benchmarks', 'results', f"{datetime.now():%Y%m%d-%H%M%S}-{_commit()}.json")
+    os.makedirs(os.path.dirname(salida) or '.', exist_ok=True)
+    with open(salida, 'w', encoding='utf-8') as archivo:
+        json.dump({
+            'meta': {
+                'commit': _commit(),
+                'fecha': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'sqlalchemy': sqlalchemy.__version__,
+                'base_de_datos': dialecto,
+                'repeat': args.repeat,
+                'semilla': args.semilla,
+            },
+            'resultados': resultados,
+        }, archivo, ensure_ascii=False, indent=2)
+    print(f"\nResultados en {salida}")
+
+
+def comparar(base_path: str, nuevo_path: str, umbral: float) -> bool:
+    """Tabla nuevo/base del p50 de cada caso; devuelve False si hay regresiones"""
+    with open(base_path, encoding='utf-8') as archivo:
+        base = json.load(archivo)
+    with open(nuevo_path, encoding='utf-8') as archivo:
+        nuevo = json.load(archivo)
+    
+    print(f"base {base['meta']['commit']} ({base['meta']['base_de_datos']})  ->  "
+          f"nuevo {nuevo['meta']['commit']} ({nuevo['meta']['base_de_datos']})")
+    print(f"\n{'tamaño':>10}  {'grupo':<14}{'caso':<28}{'base p50':>10}{'nuevo p50':>11}{'razón':>8}")
+    regresiones = 0
+    for tamano, grupos in nuevo['resultados'].items():
+        for grupo, casos in grupos.items():
+            for caso, stats in casos.items():
+                anterior = base['resultados'].get(tamano, {}).get(grupo, {}).get(caso)
+                if anterior is None:
+                    continue
+                razon = stats['p50_ms'] / anterior['p50_ms'] if anterior['p50_ms'] else float('inf')
+                marca = '  ⚠️' if razon > umbral else ''
+                regresiones += razon > umbral
+                print(f"{int(tamano):>10,}  {grupo:<14}{caso:<28}{anterior['p50_ms']:>10.2f}"
+                      f"{stats['p50_ms']:>11.2f}{razon:>8.2f}{marca}")
+    print(f"\n{regresiones} casos más lentos que {umbral:.2f}x la base")
+    return regresiones == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tamanos', default='10000,100000,1000000', help='productos, separados por coma')
+    parser.add_argument('--repeat', type=int, default=30, help='mediciones por caso')
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--salida', help='archivo JSON de resultados (por defecto benchmarks/results/)')
+    parser.add_argument('--comparar', nargs=2, metavar=('BASE', 'NUEVO'), help='comparar dos resultados')
+    parser.add_argument('--umbral', type=float, default=1.25, help='razón p50 nuevo/base considerada regresión')
+    args = parser.parse_args()
+    
+    if args.comparar:
+        sys.exit(0 if comparar(*args.comparar, args.umbral) else 1)
+    ejecutar(args)
+
+
+if __name__ == '__main__':
+    main()
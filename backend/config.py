@@ -11,6 +11,11 @@ class Config:
     
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
+    # Segundos máximos que tarda un worker en ver un token revocado en otro
+    TOKEN_BLOCKLIST_SYNC_INTERVAL = float(os.environ.get('TOKEN_BLOCKLIST_SYNC_INTERVAL', 5))
+    # Caché del estado de los usuarios consultado en cada petición autenticada
+    USER_STATUS_CACHE_SIZE = int(os.environ.get('USER_STATUS_CACHE_SIZE', 10000))
+    USER_STATUS_CACHE_TTL = float(os.environ.get('USER_STATUS_CACHE_TTL', 30))
     
     DB_HOST = os.environ.get('DB_HOST', 'localhost')
     DB_PORT = os.environ.get('DB_PORT', '5432')
@@ -19,10 +24,30 @@ class Config:
     DB_PASSWORD = os.environ.get('DB_PASSWORD', '372004')
     
     SQLALCHEMY_DATABASE_URI = f"postgresql+psycopg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    # Réplica de lectura opcional (URL de SQLAlchemy completa); los listados y
+    # consultas por id del catálogo se leen de ella
+    DB_REPLICA_URL = os.environ.get('DB_REPLICA_URL')
+    SQLALCHEMY_BINDS = {'replica': DB_REPLICA_URL} if DB_REPLICA_URL else {}
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    
+    # Pool de conexiones por proceso: con N workers el servidor puede abrir
+    # hasta N * (DB_POOL_SIZE + DB_MAX_OVERFLOW) conexiones
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+    # Segundos enteros: Flask-SQLAlchemy crea el engine con engine_from_config, que
+    # convierte pool_timeout a int
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 300))
+    # Tiempo máximo de cada sentencia de PostgreSQL durante una petición web
+    # (0 = sin límite); los comandos y las migraciones no tienen límite
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 30000))
+    
     SQLALCHEMY_ENGINE_OPTIONS = {
         'pool_pre_ping': True,
-        'pool_recycle': 300,
+        'pool_recycle': DB_POOL_RECYCLE,
+        'pool_size': DB_POOL_SIZE,
+        'max_overflow': DB_MAX_OVERFLOW,
+        'pool_timeout': DB_POOL_TIMEOUT,
     }
     
     CORS_ORIGINS = [
@@ -42,6 +67,53 @@ class Config:
     MAX_DESCRIPCION_LENGTH = 500
     MIN_PRECIO = 0.01
     MAX_PRECIO = 999999.99
+    
+    # Importación masiva de productos
+    IMPORT_BATCH_SIZE = int(os.environ.get('IMPORT_BATCH_SIZE', 1000))
+    IMPORT_MAX_ERRORS = int(os.environ.get('IMPORT_MAX_ERRORS', 1000))
+    
+    # Hash de contraseñas: método de werkzeug (p. ej. 'scrypt', 'scrypt:65536:8:1',
+    # 'pbkdf2:sha256:600000') y pool de procesos acotado. Los hashes con otro
+    # método o costo se actualizan en el siguiente inicio de sesión
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt')
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 2))
+    PASSWORD_HASH_MAX_QUEUE = int(os.environ.get('PASSWORD_HASH_MAX_QUEUE', 16))
+    PASSWORD_HASH_TIMEOUT = float(os.environ.get('PASSWORD_HASH_TIMEOUT', 5))
+    PASSWORD_HASH_RETRY_AFTER = int(os.environ.get('PASSWORD_HASH_RETRY_AFTER', 1))
+    
+    # Límite de intentos de login por ventana deslizante (0 = sin límite).
+    # Contadores en memoria del proceso ('memory://') o compartidos ('redis://...')
+    LOGIN_RATE_LIMIT_WINDOW = int(os.environ.get('LOGIN_RATE_LIMIT_WINDOW', 60))
+    LOGIN_RATE_LIMIT_PER_EMAIL = int(os.environ.get('LOGIN_RATE_LIMIT_PER_EMAIL', 5))
+    LOGIN_RATE_LIMIT_PER_IP = int(os.environ.get('LOGIN_RATE_LIMIT_PER_IP', 30))
+    RATE_LIMIT_STORAGE_URL = os.environ.get('RATE_LIMIT_STORAGE_URL', 'memory://')
+    
+    # Proveedor JSON de las respuestas: 'default' (json estándar) u 'orjson'
+    # (misma salida byte a byte, requiere el paquete orjson)
+    JSON_PROVIDER = os.environ.get('JSON_PROVIDER', 'default')
+    
+    # Logs JSON por línea en stderr, escritos desde un hilo aparte.
+    # LOG_LEVELS ajusta loggers puntuales: `app.interface.blueprints.auth_bp=DEBUG,...`
+    LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
+    LOG_LEVELS = os.environ.get('LOG_LEVELS', '')
+    LOG_FORMAT = os.environ.get('LOG_FORMAT', 'json')
+    # Fracción de los eventos DEBUG que se escriben (1 = todos)
+    LOG_DEBUG_SAMPLE_RATE = float(os.environ.get('LOG_DEBUG_SAMPLE_RATE', 1.0))
+    # Registros en espera de escritura; con la cola llena se descartan
+    LOG_QUEUE_SIZE = int(os.environ.get('LOG_QUEUE_SIZE', 10000))
+    
+    # Métricas por petición en /api/metrics (formato Prometheus). El endpoint
+    # exige `Authorization: Bearer <METRICS_TOKEN>` o un JWT válido; sólo con
+    # METRICS_PUBLIC=True se permite el acceso anónimo
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True').lower() == 'true'
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+    METRICS_PUBLIC = os.environ.get('METRICS_PUBLIC', 'False').lower() == 'true'
+    # Consultas SQL por petición a partir de las cuales se registra una
+    # advertencia (0 = sin límite)
+    QUERY_BUDGET_PER_REQUEST = int(os.environ.get('QUERY_BUDGET_PER_REQUEST', 20))
+    
+    # Exportación del catálogo (filas por lote del cursor del servidor)
+    EXPORT_BATCH_SIZE = int(os.environ.get('EXPORT_BATCH_SIZE', 1000))
 
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -97,6 +97,13 @@ def run_migrations_online():
     connectable = get_engine()
 
     with connectable.connect() as connection:
+        # Sin límite de tiempo por sentencia (CREATE INDEX, rellenos de datos)
+        # aunque el rol o la base de datos definan statement_timeout. SET sin
+        # LOCAL se conserva tras el COMMIT, que deja la conexión sin transacción
+        if connection.dialect.name == 'postgresql':
+            connection.exec_driver_sql('SET statement_timeout = 0')
+            connection.commit()
+
         context.configure(
             connection=connection,
             target_metadata=get_metadata(),
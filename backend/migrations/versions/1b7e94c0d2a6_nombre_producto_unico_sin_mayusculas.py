@@ -0,0 +1,40 @@
+"""Unicidad de productos.nombre sin distinguir mayúsculas
+
+Revision ID: 1b7e94c0d2a6
+Revises: e2b5f8a61c39
+Create Date: 2025-09-15 12:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1b7e94c0d2a6'
+down_revision = 'e2b5f8a61c39'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # La escritura de productos confía en esta restricción en lugar de
+    # consultar antes si el nombre existe; fallar con un mensaje claro si ya
+    # hay nombres que sólo difieren en mayúsculas.
+    duplicados = op.get_bind().execute(sa.text(
+        'SELECT lower(nombre) FROM productos GROUP BY lower(nombre) HAVING count(*) > 1 LIMIT 10'
+    )).scalars().all()
+    if duplicados:
+        raise RuntimeError(
+            'Existen productos con nombres repetidos (sin distinguir mayúsculas): '
+            + ', '.join(duplicados)
+        )
+
+    with op.batch_alter_table('productos', schema=None) as batch_op:
+        batch_op.drop_index('ix_productos_nombre_lower')
+        batch_op.create_index('ix_productos_nombre_lower', [sa.text('lower(nombre)')], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('productos', schema=None) as batch_op:
+        batch_op.drop_index('ix_productos_nombre_lower')
+        batch_op.create_index('ix_productos_nombre_lower', [sa.text('lower(nombre)')], unique=False)
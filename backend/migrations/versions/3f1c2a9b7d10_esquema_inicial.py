@@ -0,0 +1,94 @@
+"""Esquema inicial del catálogo
+
+Revision ID: 3f1c2a9b7d10
+Revises: 
+Create Date: 2025-08-20 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9b7d10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('categorias',
+    sa.Column('nombre', sa.String(length=100), nullable=False),
+    sa.Column('descripcion', sa.Text(), nullable=True),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('categorias', schema=None) as batch_op:
+        batch_op.create_index('ix_categorias_nombre', ['nombre'], unique=True)
+        batch_op.create_index('ix_categorias_nombre_lower', [sa.text('lower(nombre)')], unique=False)
+
+    op.create_table('presentaciones',
+    sa.Column('nombre', sa.String(length=100), nullable=False),
+    sa.Column('descripcion', sa.Text(), nullable=True),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('presentaciones', schema=None) as batch_op:
+        batch_op.create_index('ix_presentaciones_nombre', ['nombre'], unique=True)
+        batch_op.create_index('ix_presentaciones_nombre_lower', [sa.text('lower(nombre)')], unique=False)
+
+    op.create_table('usuarios',
+    sa.Column('email', sa.String(length=120), nullable=False),
+    sa.Column('password_hash', sa.String(length=255), nullable=False),
+    sa.Column('nombre', sa.String(length=100), nullable=False),
+    sa.Column('activo', sa.Boolean(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('usuarios', schema=None) as batch_op:
+        batch_op.create_index('ix_usuarios_email', ['email'], unique=True)
+
+    op.create_table('productos',
+    sa.Column('nombre', sa.String(length=200), nullable=False),
+    sa.Column('precio', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('activo', sa.Boolean(), nullable=False),
+    sa.Column('categoria_id', sa.Integer(), nullable=False),
+    sa.Column('presentacion_id', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['categoria_id'], ['categorias.id'], ),
+    sa.ForeignKeyConstraint(['presentacion_id'], ['presentaciones.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('productos', schema=None) as batch_op:
+        batch_op.create_index('ix_productos_nombre', ['nombre'], unique=True)
+        batch_op.create_index('ix_productos_nombre_lower', [sa.text('lower(nombre)')], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('productos', schema=None) as batch_op:
+        batch_op.drop_index('ix_productos_nombre_lower')
+        batch_op.drop_index('ix_productos_nombre')
+
+    op.drop_table('productos')
+    with op.batch_alter_table('usuarios', schema=None) as batch_op:
+        batch_op.drop_index('ix_usuarios_email')
+
+    op.drop_table('usuarios')
+    with op.batch_alter_table('presentaciones', schema=None) as batch_op:
+        batch_op.drop_index('ix_presentaciones_nombre_lower')
+        batch_op.drop_index('ix_presentaciones_nombre')
+
+    op.drop_table('presentaciones')
+    with op.batch_alter_table('categorias', schema=None) as batch_op:
+        batch_op.drop_index('ix_categorias_nombre_lower')
+        batch_op.drop_index('ix_categorias_nombre')
+
+    op.drop_table('categorias')
@@ -0,0 +1,41 @@
+"""Tokens JWT revocados por cierre de sesión
+
+Revision ID: 4e8b2d6a0f73
+Revises: 9c3a5e7f1d42
+Create Date: 2025-09-24 16:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4e8b2d6a0f73'
+down_revision = '9c3a5e7f1d42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('tokens_revocados',
+    sa.Column('jti', sa.String(length=36), nullable=False),
+    sa.Column('tipo', sa.String(length=10), nullable=False),
+    sa.Column('usuario_id', sa.Integer(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['usuario_id'], ['usuarios.id'], ),
+    sa.PrimaryKeyConstraint('jti')
+    )
+    with op.batch_alter_table('tokens_revocados', schema=None) as batch_op:
+        batch_op.create_index('ix_tokens_revocados_expires_at', ['expires_at'], unique=False)
+
+    # Contador de generación con el que los workers sincronizan la lista en memoria
+    op.execute("INSERT INTO tabla_versiones (tabla, version) VALUES ('tokens_revocados', 0)")
+
+
+def downgrade():
+    op.execute("DELETE FROM tabla_versiones WHERE tabla = 'tokens_revocados'")
+    with op.batch_alter_table('tokens_revocados', schema=None) as batch_op:
+        batch_op.drop_index('ix_tokens_revocados_expires_at')
+
+    op.drop_table('tokens_revocados')
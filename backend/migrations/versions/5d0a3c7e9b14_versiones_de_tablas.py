@@ -0,0 +1,33 @@
+"""Contadores de versión por tabla para los ETag de la API
+
+Revision ID: 5d0a3c7e9b14
+Revises: 1b7e94c0d2a6
+Create Date: 2025-09-18 10:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d0a3c7e9b14'
+down_revision = '1b7e94c0d2a6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tabla_versiones = op.create_table('tabla_versiones',
+    sa.Column('tabla', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('tabla')
+    )
+    op.bulk_insert(tabla_versiones, [
+        {'tabla': 'categorias', 'version': 0},
+        {'tabla': 'presentaciones', 'version': 0},
+        {'tabla': 'productos', 'version': 0},
+    ])
+
+
+def downgrade():
+    op.drop_table('tabla_versiones')
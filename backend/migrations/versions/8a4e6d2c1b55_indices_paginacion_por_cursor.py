@@ -0,0 +1,45 @@
+"""Índices (nombre, id) para la paginación por cursor
+
+Revision ID: 8a4e6d2c1b55
+Revises: 3f1c2a9b7d10
+Create Date: 2025-09-02 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8a4e6d2c1b55'
+down_revision = '3f1c2a9b7d10'
+branch_labels = None
+depends_on = None
+
+
+TABLAS = ('categorias', 'presentaciones', 'productos')
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        for tabla in TABLAS:
+            with op.batch_alter_table(tabla, schema=None) as batch_op:
+                batch_op.create_index(f'ix_{tabla}_nombre_id', ['nombre', 'id'], unique=False)
+        return
+
+    # CONCURRENTLY evita bloquear las escrituras mientras se construyen los
+    # índices; requiere ejecutarse fuera de una transacción.
+    with op.get_context().autocommit_block():
+        for tabla in TABLAS:
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{tabla}_nombre_id ON {tabla} (nombre, id)')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        for tabla in reversed(TABLAS):
+            with op.batch_alter_table(tabla, schema=None) as batch_op:
+                batch_op.drop_index(f'ix_{tabla}_nombre_id')
+        return
+
+    with op.get_context().autocommit_block():
+        for tabla in reversed(TABLAS):
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS ix_{tabla}_nombre_id')
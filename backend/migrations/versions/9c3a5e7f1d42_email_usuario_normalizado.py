@@ -0,0 +1,39 @@
+"""Emails de usuarios normalizados (sin espacios y en minúsculas)
+
+Revision ID: 9c3a5e7f1d42
+Revises: 5d0a3c7e9b14
+Create Date: 2025-09-22 09:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c3a5e7f1d42'
+down_revision = '5d0a3c7e9b14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # El login busca por igualdad sobre ix_usuarios_email; si dos cuentas sólo
+    # difieren en mayúsculas o espacios hay que resolverlo a mano antes de migrar
+    duplicados = op.get_bind().execute(sa.text(
+        'SELECT lower(trim(email)) FROM usuarios GROUP BY lower(trim(email)) HAVING count(*) > 1 LIMIT 10'
+    )).scalars().all()
+    if duplicados:
+        raise RuntimeError(
+            'Existen usuarios con emails repetidos (sin distinguir mayúsculas): '
+            + ', '.join(duplicados)
+        )
+
+    op.execute('UPDATE usuarios SET email = lower(trim(email)) WHERE email <> lower(trim(email))')
+
+    with op.batch_alter_table('usuarios', schema=None) as batch_op:
+        batch_op.create_check_constraint('ck_usuarios_email_normalizado', 'email = lower(trim(email))')
+
+
+def downgrade():
+    with op.batch_alter_table('usuarios', schema=None) as batch_op:
+        batch_op.drop_constraint('ck_usuarios_email_normalizado', type_='check')
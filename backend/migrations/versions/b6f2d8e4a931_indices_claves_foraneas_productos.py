@@ -0,0 +1,54 @@
+"""Índices (categoria_id, nombre, id) y (presentacion_id, nombre, id) de productos
+
+Revision ID: b6f2d8e4a931
+Revises: 4e8b2d6a0f73
+Create Date: 2025-10-02 11:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6f2d8e4a931'
+down_revision = '4e8b2d6a0f73'
+branch_labels = None
+depends_on = None
+
+
+INDICES = {
+    'ix_productos_categoria_nombre_id': ('categoria_id', 'nombre', 'id'),
+    'ix_productos_presentacion_nombre_id': ('presentacion_id', 'nombre', 'id'),
+}
+
+
+def upgrade():
+    # Filtros por categoría o presentación ordenados por (nombre, id) y
+    # verificación de productos asociados antes de borrar una categoría o
+    # una presentación; la columna inicial también indexa la clave foránea
+    if op.get_bind().dialect.name != 'postgresql':
+        with op.batch_alter_table('productos', schema=None) as batch_op:
+            for nombre, columnas in INDICES.items():
+                batch_op.create_index(nombre, list(columnas), unique=False)
+        return
+
+    # CONCURRENTLY evita bloquear las escrituras en productos mientras se
+    # construyen los índices; requiere ejecutarse fuera de una transacción.
+    with op.get_context().autocommit_block():
+        for nombre, columnas in INDICES.items():
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {nombre} '
+                f'ON productos ({", ".join(columnas)})'
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        with op.batch_alter_table('productos', schema=None) as batch_op:
+            for nombre in reversed(list(INDICES)):
+                batch_op.drop_index(nombre)
+        return
+
+    with op.get_context().autocommit_block():
+        for nombre in reversed(list(INDICES)):
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {nombre}')
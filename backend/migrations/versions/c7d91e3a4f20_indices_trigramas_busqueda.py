@@ -0,0 +1,45 @@
+"""Índices GIN pg_trgm para la búsqueda por subcadena en nombre
+
+Revision ID: c7d91e3a4f20
+Revises: 8a4e6d2c1b55
+Create Date: 2025-09-04 11:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d91e3a4f20'
+down_revision = '8a4e6d2c1b55'
+branch_labels = None
+depends_on = None
+
+TABLAS = ('categorias', 'presentaciones', 'productos')
+
+
+def upgrade():
+    # Los índices de trigramas sólo existen en PostgreSQL; en otros motores
+    # la búsqueda funciona igual pero sin índice.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # CONCURRENTLY evita bloquear escrituras mientras se construye el índice
+    # sobre tablas grandes; requiere ejecutarse fuera de una transacción.
+    with op.get_context().autocommit_block():
+        for tabla in TABLAS:
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{tabla}_nombre_trgm '
+                f'ON {tabla} USING gin (lower(nombre) gin_trgm_ops)'
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        for tabla in TABLAS:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS ix_{tabla}_nombre_trgm')
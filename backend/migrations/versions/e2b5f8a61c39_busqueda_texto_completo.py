@@ -0,0 +1,75 @@
+"""Búsqueda de texto completo en español sin acentos (productos y categorías)
+
+Revision ID: e2b5f8a61c39
+Revises: c7d91e3a4f20
+Create Date: 2025-09-09 16:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b5f8a61c39'
+down_revision = 'c7d91e3a4f20'
+branch_labels = None
+depends_on = None
+
+# Pesos: el nombre (A) pesa más que la descripción (B) en el ranking
+VECTORES = {
+    'productos': (
+        "setweight(to_tsvector('es_unaccent'::regconfig, coalesce(nombre, '')), 'A')"
+    ),
+    'categorias': (
+        "setweight(to_tsvector('es_unaccent'::regconfig, coalesce(nombre, '')), 'A') || "
+        "setweight(to_tsvector('es_unaccent'::regconfig, coalesce(descripcion, '')), 'B')"
+    ),
+}
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Configuración española que además elimina acentos. to_tsvector con una
+    # configuración explícita es IMMUTABLE, por lo que puede usarse en una
+    # columna generada (unaccent() por sí sola no lo es).
+    op.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+    op.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'es_unaccent') THEN
+                CREATE TEXT SEARCH CONFIGURATION es_unaccent (COPY = spanish);
+                ALTER TEXT SEARCH CONFIGURATION es_unaccent
+                    ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+            END IF;
+        END
+        $$
+    """)
+
+    for tabla, vector in VECTORES.items():
+        op.execute(
+            f'ALTER TABLE {tabla} ADD COLUMN IF NOT EXISTS search_vector tsvector '
+            f'GENERATED ALWAYS AS ({vector}) STORED'
+        )
+
+    with op.get_context().autocommit_block():
+        for tabla in VECTORES:
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{tabla}_search_vector '
+                f'ON {tabla} USING gin (search_vector)'
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        for tabla in VECTORES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS ix_{tabla}_search_vector')
+
+    for tabla in VECTORES:
+        op.execute(f'ALTER TABLE {tabla} DROP COLUMN IF EXISTS search_vector')
+
+    op.execute('DROP TEXT SEARCH CONFIGURATION IF EXISTS es_unaccent')
@@ -0,0 +1,129 @@
+"""
+Fixtures compartidas por las pruebas del backend (`pytest` desde `backend/`).
+
+Cada prueba usa una base de datos SQLite nueva en un directorio temporal,
+creada con `db.create_all()`. Con `TEST_DATABASE_URL` (p. ej. un PostgreSQL
+local vacío) las pruebas usan esa base de datos en su lugar y se ejecutan
+también las que dependen de PostgreSQL; las tablas se eliminan al terminar
+cada prueba.
+"""
+
+import os
+from contextlib import contextmanager
+
+os.environ.setdefault('JWT_SECRET_KEY', 'clave-jwt-de-pruebas-no-usar-en-produccion')
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from config import Config
+
+
+class PruebasConfig(Config):
+    TESTING = True
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    SQLALCHEMY_BINDS = {}
+    LOG_LEVEL = 'WARNING'
+    # Hash rápido y en el hilo de la prueba (las pruebas del pool lo activan)
+    PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1000'
+    PASSWORD_HASH_WORKERS = 0
+    LOGIN_RATE_LIMIT_PER_EMAIL = 0
+    LOGIN_RATE_LIMIT_PER_IP = 0
+
+
+@pytest.fixture
+def config_class(tmp_path):
+    """Configuración de la prueba; las pruebas pueden redefinir este fixture"""
+    class ConfigDePrueba(PruebasConfig):
+        SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL') or f"sqlite:///{tmp_path / 'test.db'}"
+    return ConfigDePrueba
+
+
+@pytest.fixture
+def app(config_class):
+    from app import create_app
+    from app.infrastructure.db.base import db
+    
+    app = create_app(config_class)
+    with app.app_context():
+        # Sólo el bind principal: las pruebas con réplica crean su esquema
+        db.create_all(bind_key=None)
+    
+    yield app
+    
+    with app.app_context():
+        db.session.remove()
+        db.drop_all(bind_key=None)
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+@pytest.fixture
+def auth_headers(client):
+    response = client.post('/api/auth/register', json={
+        'email': 'pruebas@example.com', 'password': 'secreto123', 'nombre': 'Pruebas'
+    })
+    assert response.status_code == 201, response.json
+    return {'Authorization': f"Bearer {response.json['data']['access_token']}"}
+
+
+@pytest.fixture
+def catalogo(app):
+    """Una categoría y una presentación; devuelve sus IDs"""
+    from app.infrastructure.db.base import db
+    from app.infrastructure.db.models import CategoriaModel, PresentacionModel
+    
+    with app.app_context():
+        categoria = CategoriaModel(nombre='Bebidas', descripcion='Bebidas frías')
+        presentacion = PresentacionModel(nombre='Botella 500 ml')
+        db.session.add_all([categoria, presentacion])
+        db.session.commit()
+        return categoria.id, presentacion.id
+
+
+@pytest.fixture
+def productos(app):
+    """60 productos sintéticos repartidos entre 8 categorías y 5 presentaciones"""
+    from app.infrastructure.db.base import db
+    from app.infrastructure.db.seed import CatalogSeeder
+    
+    with app.app_context():
+        seeder = CatalogSeeder(batch_size=25)
+        seeder.seed_categorias(8)
+        seeder.seed_presentaciones(5)
+        seeder.seed_productos(60)
+        db.session.remove()
+
+
+class QueryCounter:
+    """Sentencias SQL enviadas a cualquier engine mientras está activo.
+    
+    No cuenta los `SET` de configuración de la transacción (statement_timeout),
+    que no son consultas de la operación medida.
+    """
+    
+    def __init__(self):
+        self.statements = []
+    
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+    
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith('SET '):
+            self.statements.append(statement)
+
+
+@pytest.fixture
+def count_queries():
+    """`with count_queries() as counter:` registra las sentencias del bloque"""
+    @contextmanager
+    def counting():
+        counter = QueryCounter()
+        event.listen(Engine, 'before_cursor_execute', counter._before_cursor_execute)
+        try:
+            yield counter
+        finally:
+            event.remove(Engine, 'before_cursor_execute', counter._before_cursor_execute)
+    return counting
@@ -0,0 +1,116 @@
+import asyncio
+from urllib.parse import urlsplit
+
+import pytest
+
+pytest.importorskip('aiosqlite')
+
+from app.infrastructure.db.async_engine import async_db
+from app.interface.asgi.application import AsgiApplication, build_environ
+
+# Encabezados que deben coincidir entre ambos modos
+ENCABEZADOS = ('Content-Type', 'Content-Length', 'ETag', 'Cache-Control', 'Vary', 'Access-Control-Allow-Origin')
+
+
+@pytest.fixture
+def asgi_app(app):
+    async_db.init_app(app)
+    yield AsgiApplication(app, async_db)
+    asyncio.run(async_db.dispose())
+
+
+def asgi_get(asgi_app, url, headers=None):
+    """GET mínimo a través de la interfaz ASGI: (estado, encabezados, cuerpo)"""
+    partes = urlsplit(url)
+    scope = {
+        'type': 'http', 'http_version': '1.1', 'method': 'GET', 'scheme': 'http',
+        'path': partes.path, 'raw_path': partes.path.encode(), 'query_string': partes.query.encode(),
+        'root_path': '', 'server': ('localhost', 80), 'client': ('127.0.0.1', 50000),
+        'headers': [(nombre.lower().encode('latin-1'), valor.encode('latin-1'))
+                    for nombre, valor in (headers or {}).items()],
+    }
+    mensajes = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+    enviados = []
+    
+    async def receive():
+        return mensajes.pop(0) if mensajes else {'type': 'http.disconnect'}
+    
+    async def send(message):
+        enviados.append(message)
+    
+    asyncio.run(asgi_app(scope, receive, send))
+    inicio = enviados[0]
+    encabezados = {nombre.decode('latin-1').lower(): valor.decode('latin-1') for nombre, valor in inicio['headers']}
+    return inicio['status'], encabezados, b''.join(m.get('body', b'') for m in enviados[1:])
+
+
+def _comparar(client, asgi_app, url, headers=None):
+    wsgi = client.get(url, headers=headers)
+    status, encabezados, cuerpo = asgi_get(asgi_app, url, headers)
+    
+    assert status == wsgi.status_code, url
+    assert cuerpo == wsgi.get_data(), url
+    for nombre in ENCABEZADOS:
+        assert encabezados.get(nombre.lower()) == wsgi.headers.get(nombre), (url, nombre)
+    return wsgi
+
+
+@pytest.fixture
+def urls(app, productos):
+    from app.infrastructure.db.models import CategoriaModel, PresentacionModel, ProductoModel
+    
+    with app.app_context():
+        producto = ProductoModel.query.order_by(ProductoModel.id).first()
+        categoria_id = CategoriaModel.query.order_by(CategoriaModel.id).first().id
+        presentacion_id = PresentacionModel.query.order_by(PresentacionModel.id).first().id
+    return [
+        '/api/health',
+        '/api/productos',
+        '/api/productos?page=2&size=7',
+        '/api/productos?size=5&expand=categoria,presentacion',
+        f'/api/productos?categoria_id={producto.categoria_id}&count=none',
+        '/api/productos?q=00000&count=estimate',
+        '/api/productos?after=&size=10',
+        '/api/productos?count=otro',
+        '/api/productos?expand=proveedor',
+        f'/api/productos/{producto.id}',
+        f'/api/productos/{producto.id}?expand=categoria',
+        '/api/productos/999999',
+        '/api/categorias',
+        '/api/categorias?after=&size=3',
+        f'/api/categorias/{categoria_id}',
+        '/api/categorias/999999',
+        '/api/presentaciones?q=Presentación',
+        f'/api/presentaciones/{presentacion_id}',
+    ]
+
+
+def test_lecturas_identicas_en_asgi_y_wsgi(client, asgi_app, auth_headers, urls):
+    # Todas las URLs las atienden las vistas asíncronas, no la aplicación Flask
+    for url in urls:
+        partes = urlsplit(url)
+        scope = {'method': 'GET', 'path': partes.path, 'query_string': partes.query.encode()}
+        assert asgi_app._match(build_environ(scope)) is not None, url
+    
+    headers = {**auth_headers, 'Origin': 'http://localhost:8080'}
+    estados = {_comparar(client, asgi_app, url, headers).status_code for url in urls}
+    # Se cubrieron respuestas correctas, errores de validación y 404
+    assert estados == {200, 400, 404}
+
+
+@pytest.mark.parametrize('headers', [{}, {'Authorization': 'Bearer no-es-un-jwt'}])
+def test_sin_jwt_valido_identico(client, asgi_app, productos, headers):
+    wsgi = _comparar(client, asgi_app, '/api/productos', headers)
+    # Sin token 401; un token mal formado lo rechaza Flask-JWT-Extended con 422
+    assert wsgi.status_code == (422 if headers else 401)
+    assert wsgi.json['msg']
+
+
+def test_if_none_match_responde_304_en_ambos_modos(client, asgi_app, auth_headers, productos):
+    for url in ('/api/productos?size=5', '/api/categorias'):
+        etag = client.get(url, headers=auth_headers).headers['ETag']
+        headers = {**auth_headers, 'If-None-Match': etag}
+        
+        wsgi = _comparar(client, asgi_app, url, headers)
+        assert wsgi.status_code == 304
+        assert wsgi.get_data() == b''
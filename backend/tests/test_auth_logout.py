@@ -0,0 +1,35 @@
+import pytest
+
+
+@pytest.fixture
+def tokens(client):
+    response = client.post('/api/auth/register', json={
+        'email': 'logout@example.com', 'password': 'secreto123', 'nombre': 'Logout'
+    })
+    assert response.status_code == 201
+    return response.json['data']
+
+
+def _bearer(token):
+    return {'Authorization': f'Bearer {token}'}
+
+
+@pytest.mark.parametrize('body', ['[]', '["refresh_token"]', '"texto"', '123', '{"refresh_token": 5}'])
+def test_cuerpo_invalido_responde_400(client, tokens, body):
+    response = client.post('/api/auth/logout', data=body, content_type='application/json',
+                           headers=_bearer(tokens['access_token']))
+    assert response.status_code == 400, response.json
+    assert response.json['success'] is False
+
+
+def test_logout_sin_cuerpo(client, tokens):
+    response = client.post('/api/auth/logout', headers=_bearer(tokens['access_token']))
+    assert response.status_code == 200
+    assert client.get('/api/auth/me', headers=_bearer(tokens['access_token'])).status_code == 401
+
+
+def test_logout_revoca_el_refresh_token(client, tokens):
+    response = client.post('/api/auth/logout', json={'refresh_token': tokens['refresh_token']},
+                           headers=_bearer(tokens['access_token']))
+    assert response.status_code == 200
+    assert client.post('/api/auth/refresh', headers=_bearer(tokens['refresh_token'])).status_code == 401
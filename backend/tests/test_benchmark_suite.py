@@ -0,0 +1,56 @@
+import json
+from argparse import Namespace
+
+import pytest
+
+from benchmarks import suite
+
+STATS = {'p50_ms', 'p95_ms', 'p99_ms', 'mean_ms', 'ops_s'}
+
+
+@pytest.fixture
+def resultados(tmp_path):
+    """Ejecución reducida de la suite sobre una base SQLite nueva"""
+    class ConfigReducida(suite.SuiteConfig):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'bench.db'}"
+        SQLALCHEMY_ENGINE_OPTIONS = {}
+        SQLALCHEMY_BINDS = {}
+        PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1000'
+        PASSWORD_HASH_WORKERS = 0
+    
+    salida = tmp_path / 'resultados.json'
+    suite.ejecutar(Namespace(tamanos='100,50', repeat=2, semilla=1, salida=str(salida)), ConfigReducida)
+    return salida
+
+
+def test_esquema_de_resultados(resultados):
+    datos = json.loads(resultados.read_text(encoding='utf-8'))
+    
+    assert set(datos) == {'meta', 'resultados'}
+    assert set(datos['meta']) == {'commit', 'fecha', 'python', 'sqlalchemy', 'base_de_datos', 'repeat', 'semilla'}
+    assert datos['meta']['base_de_datos'] == 'sqlite'
+    assert datos['meta']['repeat'] == 2 and datos['meta']['semilla'] == 1
+    
+    # Tamaños en orden creciente, cada uno con los tres grupos y los mismos casos
+    assert list(datos['resultados']) == ['50', '100']
+    for grupos in datos['resultados'].values():
+        assert set(grupos) == {'http', 'repositorio', 'serializacion'}
+        assert {'listado página 1', 'búsqueda selectiva', 'alta', 'login'} <= set(grupos['http'])
+        for casos in grupos.values():
+            assert casos
+            for stats in casos.values():
+                assert set(stats) == STATS
+                assert 0 < stats['p50_ms'] <= stats['p95_ms'] <= stats['p99_ms']
+                assert stats['ops_s'] > 0
+    assert datos['resultados']['50']['http'].keys() == datos['resultados']['100']['http'].keys()
+
+
+def test_comparar_detecta_regresiones(resultados, tmp_path):
+    assert suite.comparar(resultados, resultados, 1.25)
+    
+    datos = json.loads(resultados.read_text(encoding='utf-8'))
+    datos['resultados']['100']['http']['login']['p50_ms'] *= 2
+    lento = tmp_path / 'lento.json'
+    lento.write_text(json.dumps(datos), encoding='utf-8')
+    assert not suite.comparar(resultados, lento, 1.25)
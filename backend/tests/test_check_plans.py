@@ -0,0 +1,22 @@
+import pytest
+
+from app.infrastructure.db.base import db
+from benchmarks.check_plans import verificar_planes
+
+
+def test_ninguna_consulta_recorre_secuencialmente_una_tabla_grande(app):
+    with app.app_context():
+        if db.engine.dialect.name != 'postgresql':
+            pytest.skip('El plan de ejecución sólo es representativo en PostgreSQL (TEST_DATABASE_URL)')
+        
+        # Volumen reducido respecto a `python -m benchmarks.check_plans`, suficiente
+        # para que productos supere el umbral y el Seq Scan no sea lo más barato
+        grandes, resultados = verificar_planes(50_000, 2_000, 300, min_filas=10_000)
+        
+        assert 'productos' in grandes
+        assert all(total > 0 for total, _ in resultados.values()), resultados
+        fallidos = {
+            nombre: [tablas for _, tablas in fallas]
+            for nombre, (_, fallas) in resultados.items() if fallas
+        }
+        assert not fallidos, fallidos
@@ -0,0 +1,45 @@
+import sqlite3
+
+import pytest
+
+
+@pytest.fixture
+def ruta_db(tmp_path):
+    return tmp_path / 'datos' / 'bootstrap.db'
+
+
+@pytest.fixture
+def cli_app(config_class, ruta_db):
+    """Aplicación sin `create_all`: el archivo de la base todavía no existe"""
+    from app import create_app
+    
+    class ConfigBootstrap(config_class):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{ruta_db}'
+    
+    return create_app(ConfigBootstrap)
+
+
+def test_db_bootstrap_crea_la_base_sqlite(cli_app, ruta_db):
+    runner = cli_app.test_cli_runner()
+    
+    resultado = runner.invoke(args=['db-bootstrap'])
+    
+    assert resultado.exit_code == 0, resultado.output
+    assert f"Base de datos '{ruta_db}' creada" in resultado.output
+    assert ruta_db.exists()
+    # Sólo crea la base: el esquema queda para `flask db upgrade`
+    tablas = sqlite3.connect(ruta_db).execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+    assert tablas == []
+
+
+def test_db_bootstrap_repetido_no_hace_nada(cli_app, ruta_db):
+    runner = cli_app.test_cli_runner()
+    assert runner.invoke(args=['db-bootstrap']).exit_code == 0
+    antes = ruta_db.stat()
+    
+    resultado = runner.invoke(args=['db-bootstrap'])
+    
+    assert resultado.exit_code == 0, resultado.output
+    assert f"Base de datos '{ruta_db}' ya existe" in resultado.output
+    despues = ruta_db.stat()
+    assert (despues.st_size, despues.st_mtime_ns) == (antes.st_size, antes.st_mtime_ns)
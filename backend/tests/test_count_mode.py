@@ -0,0 +1,66 @@
+import pytest
+
+# Total de cada listado con el fixture `productos`
+LISTADOS = [('/api/productos', 60), ('/api/categorias', 8), ('/api/presentaciones', 5)]
+
+
+def _pagina(client, auth_headers, url, query):
+    response = client.get(f'{url}?{query}', headers=auth_headers)
+    assert response.status_code == 200, response.json
+    return response.json['data']
+
+
+def _conteos(counter):
+    return [s for s in counter.statements if 'count(' in s.lower()]
+
+
+@pytest.mark.parametrize('url,total', LISTADOS)
+def test_exact(client, auth_headers, productos, count_queries, url, total):
+    with count_queries() as counter:
+        data = _pagina(client, auth_headers, url, 'page=2&size=2&count=exact')
+    
+    assert data['total'] == total
+    assert (data['page'], data['size'], data['has_more'], data['count_mode']) == (2, 2, True, 'exact')
+    assert len(data['items']) == 2
+    assert len(_conteos(counter)) == 1
+    # `exact` es el modo por defecto
+    assert _pagina(client, auth_headers, url, 'page=2&size=2') == data
+
+
+@pytest.mark.parametrize('url,total', LISTADOS)
+def test_none_no_cuenta(client, auth_headers, productos, count_queries, url, total):
+    with count_queries() as counter:
+        data = _pagina(client, auth_headers, url, 'page=1&size=2&count=none')
+    
+    assert data['total'] is None
+    assert (data['has_more'], data['count_mode']) == (True, 'none')
+    assert len(data['items']) == 2
+    assert _conteos(counter) == []
+    
+    # La fila extra detecta la última página sin contar
+    ultima = _pagina(client, auth_headers, url, f'page={(total + 1) // 2}&size=2&count=none')
+    assert ultima['total'] is None
+    assert ultima['has_more'] is False
+    assert len(ultima['items']) == 2 - total % 2
+
+
+@pytest.mark.parametrize('url,total', LISTADOS)
+def test_estimate(client, auth_headers, productos, count_queries, url, total):
+    # Con pocas filas (o fuera de PostgreSQL) la estimación recurre al conteo exacto
+    data = _pagina(client, auth_headers, url, 'page=1&size=2&count=estimate')
+    assert (data['total'], data['has_more'], data['count_mode']) == (total, True, 'exact')
+    
+    # En la última página el total se conoce sin COUNT(*)
+    with count_queries() as counter:
+        ultima = _pagina(client, auth_headers, url, f'page=1&size={total}&count=estimate')
+    assert (ultima['total'], ultima['has_more'], ultima['count_mode']) == (total, False, 'exact')
+    assert _conteos(counter) == []
+
+
+@pytest.mark.parametrize('url', [url for url, _ in LISTADOS])
+def test_count_invalido(client, auth_headers, url):
+    response = client.get(f'{url}?count=todos', headers=auth_headers)
+    
+    assert response.status_code == 400
+    assert response.json['success'] is False
+    assert response.json['message'].startswith('Modo de conteo no válido')
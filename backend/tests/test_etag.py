@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import select
+
+from app.infrastructure.db.base import db
+from app.infrastructure.db.models import ProductoModel
+
+
+def _etag(client, auth_headers, url='/api/productos'):
+    response = client.get(url, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'private, no-cache'
+    return response.headers['ETag']
+
+
+@pytest.fixture
+def producto_id(app, productos):
+    with app.app_context():
+        return db.session.scalar(select(ProductoModel.id).order_by(ProductoModel.id))
+
+
+def test_if_none_match_responde_304_sin_consultar_el_listado(client, auth_headers, productos, count_queries):
+    etag = _etag(client, auth_headers)
+    
+    with count_queries() as counter:
+        response = client.get('/api/productos', headers={**auth_headers, 'If-None-Match': etag})
+    
+    assert response.status_code == 304
+    assert response.get_data() == b''
+    assert response.headers['ETag'] == etag
+    # Sólo la versión de la tabla: ni la página ni el conteo
+    assert len(counter.statements) == 1
+    assert 'tabla_versiones' in counter.statements[0]
+    
+    otra = client.get('/api/productos', headers={**auth_headers, 'If-None-Match': '"otra-version"'})
+    assert otra.status_code == 200 and otra.json['data']['items']
+
+
+def test_etag_distinto_por_url(client, auth_headers, productos):
+    urls = [
+        '/api/productos',
+        '/api/productos?page=2',
+        '/api/productos?expand=categoria',
+        '/api/productos?expand=categoria,presentacion',
+        '/api/productos?q=00001',
+    ]
+    assert len({_etag(client, auth_headers, url) for url in urls}) == len(urls)
+
+
+def test_etag_cambia_con_cada_escritura(app, client, auth_headers, producto_id, catalogo):
+    categoria_id, presentacion_id = catalogo
+    vistos = [_etag(client, auth_headers)]
+    detalle = _etag(client, auth_headers, f'/api/productos/{producto_id}')
+    
+    def escribir(response, status=200):
+        assert response.status_code == status, response.json
+        etag = _etag(client, auth_headers)
+        assert etag not in vistos
+        vistos.append(etag)
+        return response
+    
+    nuevo = escribir(client.post('/api/productos', headers=auth_headers, json={
+        'nombre': 'Producto ETag', 'precio': 5, 'categoria_id': categoria_id, 'presentacion_id': presentacion_id
+    }), 201).json['data']['id']
+    escribir(client.put(f'/api/productos/{nuevo}', headers=auth_headers, json={
+        'nombre': 'Producto ETag 2', 'precio': 6, 'categoria_id': categoria_id, 'presentacion_id': presentacion_id
+    }))
+    escribir(client.delete(f'/api/productos/{nuevo}', headers=auth_headers))
+    escribir(client.patch('/api/productos/bulk', headers=auth_headers, json={
+        'ids': [producto_id], 'changes': {'activo': False}
+    }))
+    assert _etag(client, auth_headers, f'/api/productos/{producto_id}') != detalle
+    escribir(client.delete('/api/productos/bulk', headers=auth_headers, json={'ids': [producto_id]}))
+
+
+def test_escritura_en_otra_tabla_solo_cambia_los_expandidos(client, auth_headers, productos, catalogo):
+    categoria_id, _ = catalogo
+    simple = _etag(client, auth_headers)
+    expandido = _etag(client, auth_headers, '/api/productos?expand=categoria')
+    
+    response = client.put(f'/api/categorias/{categoria_id}', headers=auth_headers,
+                          json={'nombre': 'Bebidas frías', 'descripcion': 'Renombrada'})
+    assert response.status_code == 200, response.json
+    
+    assert _etag(client, auth_headers) == simple
+    assert _etag(client, auth_headers, '/api/productos?expand=categoria') != expandido
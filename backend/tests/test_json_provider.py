@@ -0,0 +1,61 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from flask.json.provider import DefaultJSONProvider
+
+from app.interface.http.serializers import OrjsonProvider
+
+pytest.importorskip('orjson')
+
+DATOS = {
+    'nombre': 'Jugo de maracuyá ñ ¿?',
+    'precio': Decimal('12.50'),
+    'creado': datetime(2025, 9, 20, 12, 30, 45),
+    'activo': True,
+    'items': [{'z': 1, 'a': None}, 2.5],
+    'b': 'sin acentos',
+}
+
+
+@pytest.fixture
+def providers(app):
+    return DefaultJSONProvider(app), OrjsonProvider(app)
+
+
+@pytest.mark.parametrize('sort_keys', [True, False])
+@pytest.mark.parametrize('ensure_ascii', [True, False])
+def test_dumps_sin_argumentos_igual_al_proveedor_por_defecto(providers, sort_keys, ensure_ascii):
+    for provider in providers:
+        provider.sort_keys = sort_keys
+        provider.ensure_ascii = ensure_ascii
+    por_defecto, rapido = providers
+    
+    assert rapido.dumps(DATOS) == por_defecto.dumps(DATOS)
+    assert rapido.dumps(DATOS, separators=(',', ':')) == por_defecto.dumps(DATOS, separators=(',', ':'))
+
+
+@pytest.mark.parametrize('compact', [None, True, False])
+@pytest.mark.parametrize('sort_keys', [True, False])
+def test_respuesta_igual_al_proveedor_por_defecto(app, providers, compact, sort_keys):
+    for provider in providers:
+        provider.compact = compact
+        provider.sort_keys = sort_keys
+    por_defecto, rapido = providers
+    
+    assert rapido.response(DATOS).get_data() == por_defecto.response(DATOS).get_data()
+
+
+def test_respuesta_en_modo_debug(app, providers):
+    app.debug = True
+    por_defecto, rapido = providers
+    
+    cuerpo = rapido.response(DATOS).get_data(as_text=True)
+    assert cuerpo == por_defecto.response(DATOS).get_data(as_text=True)
+    assert '\n  "activo": true' in cuerpo
+
+
+def test_claves_no_str_usan_json_estandar(providers):
+    por_defecto, rapido = providers
+    assert rapido.dumps({2: 'b', 1: 'a'}, separators=(',', ':')) == por_defecto.dumps(
+        {2: 'b', 1: 'a'}, separators=(',', ':')) == '{"1":"a","2":"b"}'
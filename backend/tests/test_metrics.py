@@ -0,0 +1,98 @@
+import re
+
+import pytest
+
+from app.infrastructure.monitoring.request_metrics import RequestMetrics, render_family
+
+SAMPLE = re.compile(r'^(?P<name>[a-z_]+)(?:\{(?P<labels>.*)\})? (?P<value>\S+)$')
+
+
+def _samples(text):
+    """Muestras del formato de texto de Prometheus: (nombre, etiquetas) -> valor"""
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith('#'):
+            continue
+        match = SAMPLE.match(line)
+        assert match, f'Línea inválida: {line!r}'
+        labels = re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', match['labels'] or '')
+        samples[_key(match['name'], **dict(labels))] = float(match['value'])
+    return samples
+
+
+def _key(name, **labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def test_formato_de_texto():
+    metrics = RequestMetrics()
+    metrics.observe('GET', 'productos.list', 200, 0.02, 3, 0.004)
+    metrics.observe('GET', 'productos.list', 200, 0.3, 25, 0.1, over_budget=True)
+    metrics.observe('GET', 'productos.list', 404, 0.001, 0, 0.0)
+    text = metrics.render()
+    
+    assert text.endswith('\n')
+    assert '# HELP http_requests_total Peticiones HTTP atendidas\n# TYPE http_requests_total counter\n' in text
+    assert '# TYPE http_request_duration_seconds histogram' in text
+    samples = _samples(text)
+    
+    lista = {'method': 'GET', 'endpoint': 'productos.list'}
+    assert samples[_key('http_requests_total', status='200', **lista)] == 2
+    assert samples[_key('http_requests_total', status='404', **lista)] == 1
+    assert samples[_key('http_requests_in_flight')] == 0
+    
+    # Buckets acumulados, con +Inf igual a la cantidad de observaciones
+    assert samples[_key('http_request_duration_seconds_bucket', le='0.025', **lista)] == 2
+    assert samples[_key('http_request_duration_seconds_bucket', le='0.25', **lista)] == 2
+    assert samples[_key('http_request_duration_seconds_bucket', le='+Inf', **lista)] == 3
+    assert samples[_key('http_request_duration_seconds_count', **lista)] == 3
+    assert samples[_key('http_request_duration_seconds_sum', **lista)] == pytest.approx(0.321)
+    
+    assert samples[_key('http_request_db_queries_bucket', endpoint='productos.list', le='20')] == 2
+    assert samples[_key('http_request_db_queries_sum', endpoint='productos.list')] == 28
+    assert samples[_key('http_request_db_seconds_total', endpoint='productos.list')] == pytest.approx(0.104)
+    assert samples[_key('http_requests_over_query_budget_total', endpoint='productos.list')] == 1
+
+
+def test_etiquetas_escapadas():
+    text = render_family('db_pool_size', 'gauge', 'Conexiones', [({'bind': 'a"b\\c'}, 5)])
+    assert text == (
+        '# HELP db_pool_size Conexiones\n'
+        '# TYPE db_pool_size gauge\n'
+        'db_pool_size{bind="a\\"b\\\\c"} 5\n'
+    )
+
+
+def test_metricas_requieren_autenticacion(client, auth_headers):
+    assert client.get('/api/metrics').status_code == 401
+    
+    response = client.get('/api/metrics', headers=auth_headers)
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain; version=0.0.4')
+
+
+def test_metricas_con_token_de_scraper(app, client):
+    app.config['METRICS_TOKEN'] = 'token-del-scraper'
+    
+    assert client.get('/api/metrics', headers={'Authorization': 'Bearer token-del-scraper'}).status_code == 200
+    # Otro Bearer se valida como JWT (y no lo es)
+    assert client.get('/api/metrics', headers={'Authorization': 'Bearer otro'}).status_code == 422
+    assert client.get('/api/metrics').status_code == 401
+
+
+def test_metricas_publicas_solo_por_configuracion(app, client):
+    app.config['METRICS_PUBLIC'] = True
+    assert client.get('/api/metrics').status_code == 200
+
+
+def test_contadores_por_peticion(app, client):
+    app.config['METRICS_PUBLIC'] = True
+    clave = _key('http_requests_total', method='GET', endpoint='health_check', status='200')
+    antes = _samples(client.get('/api/metrics').get_data(as_text=True)).get(clave, 0)
+    
+    for _ in range(3):
+        assert client.get('/api/health').status_code == 200
+    
+    response = client.get('/api/metrics')
+    assert _samples(response.get_data(as_text=True))[clave] == antes + 3
+    assert 'Server-Timing' in client.get('/api/health').headers
@@ -0,0 +1,78 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+from app.infrastructure.db.base import db
+from app.infrastructure.db.models import UsuarioModel
+from app.infrastructure.auth.password_hasher import PasswordHasher, PasswordHasherBusy
+
+
+def _hasher(**config):
+    config = {
+        'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+        'PASSWORD_HASH_WORKERS': 1,
+        'PASSWORD_HASH_MAX_QUEUE': 0,
+        'PASSWORD_HASH_TIMEOUT': 30,
+        'PASSWORD_HASH_RETRY_AFTER': 2,
+        **config,
+    }
+    return PasswordHasher(SimpleNamespace(config=config))
+
+
+@pytest.fixture
+def hasher():
+    hasher = _hasher()
+    yield hasher
+    hasher.shutdown()
+
+
+def test_hash_en_el_pool_de_procesos(hasher):
+    password_hash = hasher.hash('secreto123')
+    
+    assert password_hash.startswith('pbkdf2:sha256:1000$')
+    assert hasher.verify(password_hash, 'secreto123')
+    assert not hasher.verify(password_hash, 'otra')
+    # El trabajo se ejecuta en otro proceso
+    assert hasher._run(os.getpid) != os.getpid()
+
+
+def test_pool_lleno_rechaza_de_inmediato(hasher):
+    # Ocupar el único lugar (1 worker + 0 en espera)
+    hasher._slots.acquire()
+    with pytest.raises(PasswordHasherBusy) as error:
+        hasher.hash('secreto123')
+    assert error.value.retry_after == 2
+    
+    hasher._slots.release()
+    assert hasher.verify(hasher.hash('secreto123'), 'secreto123')
+
+
+def test_needs_rehash(hasher):
+    assert not hasher.needs_rehash(hasher.hash('secreto123'))
+    assert hasher.needs_rehash(generate_password_hash('secreto123', method='pbkdf2:sha256:2000'))
+    assert hasher.needs_rehash(generate_password_hash('secreto123', method='scrypt'))
+
+
+def test_login_actualiza_hashes_con_otro_costo(app, client):
+    with app.app_context():
+        db.session.add(UsuarioModel(
+            email='antiguo@example.com',
+            nombre='Antiguo',
+            password_hash=generate_password_hash('secreto123', method='pbkdf2:sha256:2000'),
+        ))
+        db.session.commit()
+    
+    response = client.post('/api/auth/login', json={'email': 'antiguo@example.com', 'password': 'secreto123'})
+    assert response.status_code == 200, response.json
+    
+    with app.app_context():
+        password_hash = UsuarioModel.query.filter_by(email='antiguo@example.com').one().password_hash
+    assert password_hash.startswith(app.config['PASSWORD_HASH_METHOD'] + '$')
+    
+    # El hash nuevo sigue siendo válido y ya no se vuelve a calcular
+    response = client.post('/api/auth/login', json={'email': 'antiguo@example.com', 'password': 'secreto123'})
+    assert response.status_code == 200
+    with app.app_context():
+        assert UsuarioModel.query.filter_by(email='antiguo@example.com').one().password_hash == password_hash
@@ -0,0 +1,121 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select, text
+
+from app.infrastructure.db.base import db
+from app.infrastructure.db.models import ProductoModel
+
+
+@pytest.fixture
+def ids(app, productos):
+    with app.app_context():
+        return list(db.session.scalars(select(ProductoModel.id).order_by(ProductoModel.id)))
+
+
+def _estado(app):
+    """(id, precio, activo) de todos los productos, leído fuera de la sesión de las peticiones"""
+    with app.app_context():
+        db.session.remove()
+        return db.session.execute(
+            select(ProductoModel.id, ProductoModel.precio, ProductoModel.activo).order_by(ProductoModel.id)
+        ).all()
+
+
+def test_update_por_ids_informa_los_inexistentes(app, client, auth_headers, ids):
+    seleccion = ids[:3] + [999_998, 999_999]
+    response = client.patch('/api/productos/bulk', headers=auth_headers, json={
+        'ids': seleccion, 'changes': {'precio': '7.25', 'activo': False}
+    })
+    
+    assert response.status_code == 200, response.json
+    assert response.json['data'] == {
+        'affected': 3,
+        'failed': [{'id': 999_998, 'message': 'Producto no encontrado'},
+                   {'id': 999_999, 'message': 'Producto no encontrado'}],
+    }
+    estado = {fila.id: (fila.precio, fila.activo) for fila in _estado(app)}
+    assert all(estado[i] == (Decimal('7.25'), False) for i in ids[:3])
+    assert all(estado[i] != (Decimal('7.25'), False) for i in ids[3:])
+
+
+def test_update_por_categoria(app, client, auth_headers, ids):
+    with app.app_context():
+        categoria_id = db.session.scalar(select(ProductoModel.categoria_id).order_by(ProductoModel.id))
+        esperados = set(db.session.scalars(select(ProductoModel.id).where(ProductoModel.categoria_id == categoria_id)))
+    
+    response = client.patch('/api/productos/bulk', headers=auth_headers, json={
+        'categoria_id': categoria_id, 'changes': {'precio': 99}
+    })
+    
+    assert response.json['data'] == {'affected': len(esperados), 'failed': []}
+    assert {fila.id for fila in _estado(app) if fila.precio == Decimal('99')} == esperados
+
+
+def test_delete_por_ids_y_por_categoria(app, client, auth_headers, ids):
+    response = client.delete('/api/productos/bulk', headers=auth_headers, json={'ids': [ids[0], 999_999]})
+    assert response.json['data'] == {'affected': 1, 'failed': [{'id': 999_999, 'message': 'Producto no encontrado'}]}
+    
+    with app.app_context():
+        categoria_id = db.session.scalar(select(ProductoModel.categoria_id).order_by(ProductoModel.id))
+        en_categoria = db.session.scalar(
+            select(db.func.count()).where(ProductoModel.categoria_id == categoria_id))
+    response = client.delete('/api/productos/bulk', headers=auth_headers, json={'categoria_id': categoria_id})
+    
+    assert response.json['data'] == {'affected': en_categoria, 'failed': []}
+    assert len(_estado(app)) == len(ids) - 1 - en_categoria
+
+
+@pytest.mark.parametrize('metodo, cuerpo, mensaje', [
+    ('patch', {'changes': {'precio': 1}}, 'Debe indicar una lista de IDs o un filtro'),
+    ('patch', {'ids': [], 'changes': {'precio': 1}}, 'Datos inválidos'),
+    ('patch', {'ids': [1], 'categoria_id': 1, 'changes': {'precio': 1}}, 'pero no ambos'),
+    ('patch', {'ids': [1], 'changes': {}}, 'Debe indicar al menos un cambio'),
+    ('patch', {'ids': [1]}, 'Los cambios a aplicar son requeridos'),
+    ('patch', {'ids': [1], 'changes': {'precio': 0}}, 'Datos inválidos'),
+    ('delete', {}, 'Debe indicar una lista de IDs o un filtro'),
+    ('delete', {'presentacion_id': 1, 'ids': [1]}, 'pero no ambos'),
+])
+def test_seleccion_o_cambios_invalidos(client, auth_headers, ids, metodo, cuerpo, mensaje):
+    response = getattr(client, metodo)('/api/productos/bulk', headers=auth_headers, json=cuerpo)
+    assert response.status_code == 400
+    assert mensaje in response.json['message']
+
+
+def _fallar_al_modificar(producto_id):
+    """Trigger que aborta la sentencia al llegar a `producto_id` (filas previas ya modificadas)"""
+    if db.engine.dialect.name == 'postgresql':
+        db.session.execute(text(
+            "CREATE FUNCTION falla_simulada() RETURNS trigger AS $$ "
+            "BEGIN RAISE EXCEPTION 'falla simulada'; END $$ LANGUAGE plpgsql"
+        ))
+        for evento in ('UPDATE', 'DELETE'):
+            db.session.execute(text(
+                f"CREATE TRIGGER falla_{evento.lower()} BEFORE {evento} ON productos FOR EACH ROW "
+                f"WHEN (OLD.id = {int(producto_id)}) EXECUTE FUNCTION falla_simulada()"
+            ))
+    else:
+        for evento in ('UPDATE', 'DELETE'):
+            db.session.execute(text(
+                f"CREATE TRIGGER falla_{evento.lower()} BEFORE {evento} ON productos "
+                f"WHEN OLD.id = {int(producto_id)} BEGIN SELECT RAISE(ABORT, 'falla simulada'); END"
+            ))
+    db.session.commit()
+
+
+@pytest.mark.parametrize('metodo, cuerpo', [
+    ('patch', {'changes': {'precio': '1.23'}}),
+    ('delete', {}),
+])
+def test_sentencia_fallida_no_deja_cambios_parciales(app, client, auth_headers, ids, metodo, cuerpo):
+    with app.app_context():
+        _fallar_al_modificar(ids[9])
+    antes = _estado(app)
+    etag = client.get('/api/productos', headers=auth_headers).headers['ETag']
+    
+    response = getattr(client, metodo)('/api/productos/bulk', headers=auth_headers,
+                                       json={**cuerpo, 'ids': ids[:20]})
+    
+    assert response.status_code == 500
+    assert _estado(app) == antes
+    assert client.get('/api/productos', headers=auth_headers).headers['ETag'] == etag
@@ -0,0 +1,29 @@
+def _consultas(client, count_queries, auth_headers, size, expand=None):
+    params = {'size': size}
+    if expand:
+        params['expand'] = expand
+    with count_queries() as counter:
+        response = client.get('/api/productos', query_string=params, headers=auth_headers)
+    assert response.status_code == 200, response.json
+    assert len(response.json['data']['items']) == size
+    return counter.count, response.json['data']['items']
+
+
+def test_expand_usa_un_numero_fijo_de_consultas(client, productos, auth_headers, count_queries):
+    # La primera petición llena las cachés de tokens revocados y de usuarios
+    _consultas(client, count_queries, auth_headers, 5)
+    sin_expand, _ = _consultas(client, count_queries, auth_headers, 5)
+    pequena, _ = _consultas(client, count_queries, auth_headers, 5, 'categoria,presentacion')
+    grande, items = _consultas(client, count_queries, auth_headers, 50, 'categoria,presentacion')
+    
+    assert pequena == grande
+    # Una consulta `IN (...)` por relación expandida
+    assert grande == sin_expand + 2
+    assert all(item['categoria']['id'] == item['categoria_id'] for item in items)
+    assert all(item['presentacion']['id'] == item['presentacion_id'] for item in items)
+
+
+def test_expand_invalido(client, productos, auth_headers):
+    response = client.get('/api/productos?expand=proveedor', headers=auth_headers)
+    assert response.status_code == 400
+    assert 'proveedor' in response.json['message']
@@ -0,0 +1,100 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from sqlalchemy import select
+
+from app.infrastructure.db.base import db
+from app.infrastructure.db.models import ProductoModel
+from app.interface.http.exporters import EXPORT_COLUMNS
+
+
+def _exportar(client, auth_headers, query='', headers=None):
+    # buffered=True consume el stream y cierra su contexto de request antes de la siguiente petición
+    response = client.get(
+        f'/api/productos/export{query}', headers={**auth_headers, **(headers or {})}, buffered=True
+    )
+    assert response.status_code == 200, response.get_data(as_text=True)[:200]
+    return response
+
+
+def _listado(client, auth_headers, query):
+    response = client.get(f'/api/productos?size=100&{query}', headers=auth_headers)
+    assert response.status_code == 200
+    return response.json['data']['items']
+
+
+def test_ndjson(client, auth_headers, productos):
+    response = _exportar(client, auth_headers)
+    
+    assert response.mimetype == 'application/x-ndjson'
+    assert response.headers['Content-Disposition'] == 'attachment; filename=productos.ndjson'
+    assert 'Content-Encoding' not in response.headers
+    lineas = response.get_data(as_text=True).splitlines()
+    assert len(lineas) == 60
+    # Cada línea es el mismo objeto que devuelve el listado
+    exportados = {item['id']: item for item in map(json.loads, lineas)}
+    for item in _listado(client, auth_headers, ''):
+        assert exportados[item['id']] == item
+
+
+def test_csv_con_encabezado_y_comillas(app, client, auth_headers, catalogo):
+    categoria_id, presentacion_id = catalogo
+    nombre = 'Jugo "Naranja", 1 L'
+    client.post('/api/productos', headers=auth_headers, json={
+        'nombre': nombre, 'precio': '2.50', 'categoria_id': categoria_id, 'presentacion_id': presentacion_id
+    })
+    
+    response = _exportar(client, auth_headers, '?format=csv')
+    
+    assert response.mimetype == 'text/csv'
+    texto = response.get_data(as_text=True)
+    assert texto.startswith(','.join(EXPORT_COLUMNS) + '\n')
+    assert '"Jugo ""Naranja"", 1 L"' in texto
+    filas = list(csv.DictReader(io.StringIO(texto)))
+    assert len(filas) == 1
+    assert filas[0]['nombre'] == nombre
+    assert (filas[0]['precio'], filas[0]['categoria_id'], filas[0]['activo']) == ('2.50', str(categoria_id), 'True')
+
+
+def test_csv_vacio_solo_encabezado(client, auth_headers):
+    assert _exportar(client, auth_headers, '?format=CSV').get_data(as_text=True) == ','.join(EXPORT_COLUMNS) + '\n'
+
+
+@pytest.mark.parametrize('filtro', ['categoria_id', 'presentacion_id', 'q'])
+def test_filtros_iguales_al_listado(app, client, auth_headers, productos, filtro):
+    with app.app_context():
+        muestra = db.session.scalars(select(ProductoModel).order_by(ProductoModel.id)).first()
+        valor = muestra.nombre.split()[0] if filtro == 'q' else getattr(muestra, filtro)
+    query = f'{filtro}={valor}'
+    
+    lineas = _exportar(client, auth_headers, f'?{query}').get_data(as_text=True).splitlines()
+    exportados = sorted(json.loads(linea)['id'] for linea in lineas)
+    
+    esperados = sorted(item['id'] for item in _listado(client, auth_headers, query))
+    assert exportados == esperados
+    assert 0 < len(exportados) < 60
+
+
+@pytest.mark.parametrize('formato', ['ndjson', 'csv'])
+def test_gzip_segun_accept_encoding(client, auth_headers, productos, formato):
+    plano = _exportar(client, auth_headers, f'?format={formato}')
+    comprimido = _exportar(client, auth_headers, f'?format={formato}', {'Accept-Encoding': 'gzip, deflate'})
+    
+    assert comprimido.headers['Content-Encoding'] == 'gzip'
+    assert comprimido.headers['Vary'] == plano.headers['Vary'] == 'Accept-Encoding'
+    assert gzip.decompress(comprimido.get_data()) == plano.get_data()
+    
+    assert 'Content-Encoding' not in plano.headers
+    assert not plano.get_data().startswith(b'\x1f\x8b')
+    # gzip;q=0 significa que el cliente no lo acepta
+    rechazado = _exportar(client, auth_headers, f'?format={formato}', {'Accept-Encoding': 'gzip;q=0'})
+    assert 'Content-Encoding' not in rechazado.headers
+
+
+def test_formato_invalido(client, auth_headers):
+    response = client.get('/api/productos/export?format=xlsx', headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json['message'].startswith('Formato de exportación no válido')
@@ -0,0 +1,149 @@
+import json
+
+import pytest
+
+from app.infrastructure.db.models import ProductoModel
+from app.interface.blueprints import producto_bp
+
+
+def _importar(client, auth_headers, cuerpo, formato=None, content_type='text/csv'):
+    url = '/api/productos/import' + (f'?format={formato}' if formato else '')
+    if isinstance(cuerpo, str):
+        cuerpo = cuerpo.encode('utf-8')
+    return client.post(url, data=cuerpo, content_type=content_type, headers=auth_headers)
+
+
+def _ndjson(*filas):
+    return ''.join(json.dumps(fila, ensure_ascii=False) + '\n' for fila in filas)
+
+
+def _nombres(app):
+    with app.app_context():
+        return sorted(nombre for (nombre,) in ProductoModel.query.with_entities(ProductoModel.nombre))
+
+
+def test_csv_con_bom(app, client, auth_headers, catalogo):
+    categoria_id, presentacion_id = catalogo
+    cuerpo = '﻿' + (
+        'nombre,precio,categoria_id,presentacion_id,activo\r\n'
+        f'"Agua, sin gas",1.50,{categoria_id},{presentacion_id},si\r\n'
+        f'Café molido,12.90,{categoria_id},{presentacion_id},no\r\n'
+    )
+    response = _importar(client, auth_headers, cuerpo)
+    
+    assert response.status_code == 200, response.json
+    assert response.json['data'] == {
+        'processed': 2, 'imported': 2, 'failed': 0, 'errors': [], 'errors_truncated': False
+    }
+    with app.app_context():
+        cafe = ProductoModel.query.filter_by(nombre='Café molido').one()
+        assert str(cafe.precio) == '12.90' and cafe.activo is False
+    assert _nombres(app) == ['Agua, sin gas', 'Café molido']
+
+
+def test_ndjson_por_content_type(app, client, auth_headers, catalogo):
+    categoria_id, presentacion_id = catalogo
+    cuerpo = '﻿' + _ndjson(
+        {'nombre': 'Té verde', 'precio': 3.2, 'categoria_id': categoria_id, 'presentacion_id': presentacion_id},
+        {'nombre': 'Té negro', 'precio': '3.10', 'categoria_id': str(categoria_id),
+         'presentacion_id': presentacion_id, 'activo': False},
+    ) + '\n'
+    response = _importar(client, auth_headers, cuerpo, content_type='application/x-ndjson')
+    
+    assert response.status_code == 200, response.json
+    assert response.json['data']['imported'] == 2
+    assert _nombres(app) == ['Té negro', 'Té verde']
+
+
+def test_errores_por_fila(app, client, auth_headers, catalogo):
+    categoria_id, presentacion_id = catalogo
+    valido = {'precio': 1, 'categoria_id': categoria_id, 'presentacion_id': presentacion_id}
+    cuerpo = _ndjson(
+        {**valido, 'nombre': 'Correcto'},
+        {**valido, 'nombre': 'Sin categoría', 'categoria_id': 999},
+        {**valido, 'nombre': 'Sin presentación', 'presentacion_id': 999},
+        {**valido, 'nombre': 'Precio inválido', 'precio': 'abc'},
+        {'nombre': 'Sin columnas', 'precio': 1},
+    ) + '{no es json\n'
+    response = _importar(client, auth_headers, cuerpo, formato='ndjson')
+    
+    assert response.status_code == 200
+    data = response.json['data']
+    assert (data['processed'], data['imported'], data['failed']) == (6, 1, 5)
+    # Primero los errores de formato y luego los de referencias del lote
+    assert sorted(data['errors'], key=lambda error: error['row']) == [
+        {'row': 2, 'message': 'No existe una categoría con ID 999'},
+        {'row': 3, 'message': 'No existe una presentación con ID 999'},
+        {'row': 4, 'message': 'El precio debe ser un número válido'},
+        {'row': 5, 'message': 'Debe especificar una categoría válida'},
+        {'row': 6, 'message': 'La línea no contiene un JSON válido'},
+    ]
+    assert _nombres(app) == ['Correcto']
+
+
+def test_csv_sin_columna_requerida(client, auth_headers, catalogo):
+    response = _importar(client, auth_headers, 'nombre,precio,categoria_id\nAgua,1,1\n')
+    assert response.status_code == 400
+    assert response.json['message'] == 'Faltan columnas en el CSV: presentacion_id'
+
+
+def test_nombres_duplicados(app, client, auth_headers, catalogo):
+    categoria_id, presentacion_id = catalogo
+    fila = {'precio': 1, 'categoria_id': categoria_id, 'presentacion_id': presentacion_id}
+    _importar(client, auth_headers, _ndjson({**fila, 'nombre': 'Existente'}), formato='ndjson')
+    
+    response = _importar(client, auth_headers, _ndjson(
+        {**fila, 'nombre': 'Nuevo'},
+        {**fila, 'nombre': 'NUEVO'},
+        {**fila, 'nombre': 'existente'},
+    ), formato='ndjson')
+    
+    data = response.json['data']
+    assert (data['imported'], data['failed']) == (1, 2)
+    assert data['errors'] == [
+        {'row': 2, 'message': "Ya existe un producto con el nombre 'NUEVO'"},
+        {'row': 3, 'message': "Ya existe un producto con el nombre 'existente'"},
+    ]
+    assert _nombres(app) == ['Existente', 'Nuevo']
+
+
+def test_duplicado_no_detectado_usa_la_insercion_fila_por_fila(app, client, auth_headers, catalogo, monkeypatch,
+                                                               count_queries):
+    categoria_id, presentacion_id = catalogo
+    fila = {'precio': 1, 'categoria_id': categoria_id, 'presentacion_id': presentacion_id}
+    _importar(client, auth_headers, _ndjson({**fila, 'nombre': 'Existente'}), formato='ndjson')
+    
+    # Simula un producto escrito en paralelo después de la verificación previa
+    monkeypatch.setattr(producto_bp.producto_repo, 'get_existing_nombres', lambda nombres: set())
+    with count_queries() as counter:
+        response = _importar(client, auth_headers, _ndjson(
+            {**fila, 'nombre': 'Primero'},
+            {**fila, 'nombre': 'EXISTENTE'},
+            {**fila, 'nombre': 'Último'},
+        ), formato='ndjson')
+    
+    data = response.json['data']
+    assert (data['imported'], data['failed']) == (2, 1)
+    assert data['errors'] == [{'row': 2, 'message': "Ya existe un producto con el nombre 'EXISTENTE'"}]
+    assert _nombres(app) == ['Existente', 'Primero', 'Último']
+    # Tras fallar el INSERT del lote se reintenta cada fila dentro de un SAVEPOINT
+    assert sum(statement.startswith('SAVEPOINT') for statement in counter.statements) == 3
+
+
+def test_limite_de_errores_reportados(app, client, auth_headers, catalogo):
+    app.config['IMPORT_MAX_ERRORS'] = 2
+    app.config['IMPORT_BATCH_SIZE'] = 2
+    cuerpo = _ndjson(*({'nombre': f'Malo {i}', 'precio': 'x'} for i in range(5)))
+    
+    data = _importar(client, auth_headers, cuerpo, formato='ndjson').json['data']
+    
+    assert (data['processed'], data['failed']) == (5, 5)
+    assert [error['row'] for error in data['errors']] == [1, 2]
+    assert data['errors_truncated'] is True
+
+
+@pytest.mark.parametrize('formato, content_type', [('xml', 'text/csv'), (None, 'application/json')])
+def test_formato_desconocido(client, auth_headers, formato, content_type):
+    response = _importar(client, auth_headers, 'a,b\n', formato=formato, content_type=content_type)
+    assert response.status_code == 400
+    assert response.json['message'].startswith('Formato de importación no válido')
@@ -0,0 +1,104 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.domain.entities.producto import Producto
+from app.infrastructure.repository_impl.producto_repo import ProductoRepository
+
+
+def _producto(catalogo, nombre='Agua mineral', precio='1.50'):
+    categoria_id, presentacion_id = catalogo
+    return Producto(id=None, nombre=nombre, precio=Decimal(precio), categoria_id=categoria_id,
+                    presentacion_id=presentacion_id, activo=True)
+
+
+def _sin_version(statements):
+    """Sentencias de la operación sin el incremento de `tabla_versiones` del COMMIT"""
+    return [s for s in statements if 'tabla_versiones' not in s]
+
+
+def test_create_usa_una_sola_sentencia(app, catalogo, count_queries):
+    repo = ProductoRepository()
+    with app.app_context():
+        with count_queries() as counter:
+            creado = repo.create(_producto(catalogo))
+    
+    assert creado.id is not None and creado.nombre == 'Agua mineral'
+    statements = _sin_version(counter.statements)
+    assert len(statements) == 1
+    assert statements[0].startswith('INSERT INTO productos') and 'RETURNING' in statements[0]
+    # La versión de la tabla se incrementa una sola vez, al hacer COMMIT
+    assert counter.count == 2
+
+
+def test_update_usa_una_sola_sentencia(app, catalogo, count_queries):
+    repo = ProductoRepository()
+    with app.app_context():
+        creado = repo.create(_producto(catalogo))
+        with count_queries() as counter:
+            actualizado = repo.update(creado.id, _producto(catalogo, nombre='Agua con gas', precio='2.00'))
+    
+    assert actualizado.nombre == 'Agua con gas' and actualizado.precio == Decimal('2.00')
+    statements = _sin_version(counter.statements)
+    assert len(statements) == 1
+    assert statements[0].startswith('UPDATE productos') and 'RETURNING' in statements[0]
+    assert counter.count == 2
+
+
+def test_update_de_producto_inexistente(app, catalogo):
+    with app.app_context():
+        assert ProductoRepository().update(999, _producto(catalogo)) is None
+
+
+def test_nombre_duplicado_sin_distinguir_mayusculas(app, catalogo):
+    repo = ProductoRepository()
+    with app.app_context():
+        repo.create(_producto(catalogo))
+        with pytest.raises(ValueError, match="Ya existe un producto con el nombre 'AGUA MINERAL'"):
+            repo.create(_producto(catalogo, nombre='AGUA MINERAL'))
+
+
+def _integrity_error(orig):
+    return IntegrityError('INSERT INTO productos ...', {}, orig)
+
+
+class _DriverError(Exception):
+    def __init__(self, message, constraint_name=None):
+        super().__init__(message)
+        self.diag = SimpleNamespace(constraint_name=constraint_name)
+
+
+@pytest.mark.parametrize('constraint, esperado', [
+    ('productos_categoria_id_fkey', 'No existe una categoría con ID 7'),
+    ('productos_presentacion_id_fkey', 'No existe una presentación con ID 8'),
+    ('ix_productos_nombre_lower', 'duplicado'),
+])
+def test_mensaje_segun_nombre_de_restriccion(constraint, esperado):
+    producto = Producto(id=None, nombre='X', precio=Decimal('1'), categoria_id=7, presentacion_id=8)
+    error = _integrity_error(_DriverError('violación', constraint_name=constraint))
+    assert ProductoRepository()._integrity_error_message(error, producto, 'duplicado') == esperado
+
+
+def test_restriccion_desconocida_no_se_adivina():
+    producto = Producto(id=None, nombre='X', precio=Decimal('1'), categoria_id=7, presentacion_id=8)
+    # El detalle menciona la categoría, pero la restricción violada es otra
+    error = _integrity_error(_DriverError(
+        'duplicate key value violates unique constraint "otra_restriccion"\n'
+        'DETAIL: Key (categoria_id, codigo)=(7, A) already exists.',
+        constraint_name='otra_restriccion',
+    ))
+    assert ProductoRepository()._integrity_error_message(error, producto, 'duplicado') is None
+    
+    sin_nombre = _integrity_error(_DriverError('FOREIGN KEY constraint failed (categoria_id)'))
+    assert ProductoRepository()._integrity_error_message(sin_nombre, producto, 'duplicado') is None
+
+
+def test_create_propaga_restricciones_desconocidas(app, catalogo, monkeypatch):
+    repo = ProductoRepository()
+    monkeypatch.setattr(repo, '_integrity_error_message', lambda *args: None)
+    with app.app_context():
+        repo.create(_producto(catalogo))
+        with pytest.raises(IntegrityError):
+            repo.create(_producto(catalogo))
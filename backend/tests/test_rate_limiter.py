@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure.auth.rate_limiter import LoginRateLimiter, MemoryRateLimitBackend, RateLimitExceeded
+
+
+def test_contadores_por_ventana():
+    backend = MemoryRateLimitBackend()
+    assert backend.hit('a', 10) == (1, 0)
+    assert backend.hit('a', 10) == (2, 0)
+    # La ventana siguiente conserva los intentos de la anterior
+    assert backend.hit('a', 11) == (1, 2)
+    # Tras una ventana sin intentos el contador vuelve a empezar
+    assert backend.hit('a', 13) == (1, 0)
+
+
+def test_claves_vencidas_se_descartan():
+    backend = MemoryRateLimitBackend()
+    backend.hit('vieja', 10)
+    backend.hit('reciente', 11)
+    backend.hit('actual', 12)
+    
+    assert list(backend._counters) == ['reciente', 'actual']
+
+
+def test_tope_de_claves_descarta_la_menos_reciente(monkeypatch):
+    monkeypatch.setattr(MemoryRateLimitBackend, 'MAX_KEYS', 3)
+    backend = MemoryRateLimitBackend()
+    for key in ('a', 'b', 'c'):
+        backend.hit(key, 10)
+    backend.hit('a', 10)
+    backend.hit('d', 10)
+    
+    assert list(backend._counters) == ['c', 'a', 'd']
+    assert backend.hit('a', 10) == (3, 0)
+
+
+def test_limite_por_email():
+    limiter = LoginRateLimiter(SimpleNamespace(config={
+        'LOGIN_RATE_LIMIT_WINDOW': 60,
+        'LOGIN_RATE_LIMIT_PER_EMAIL': 3,
+        'LOGIN_RATE_LIMIT_PER_IP': 0,
+        'RATE_LIMIT_STORAGE_URL': 'memory://',
+    }))
+    for _ in range(3):
+        limiter.check('10.0.0.1', 'user@example.com')
+    
+    with pytest.raises(RateLimitExceeded) as error:
+        limiter.check('10.0.0.1', 'user@example.com')
+    assert 1 <= error.value.retry_after <= 120
+    # Otros emails no se ven afectados
+    limiter.check('10.0.0.1', 'otro@example.com')
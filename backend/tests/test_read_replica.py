@@ -0,0 +1,76 @@
+import pytest
+from sqlalchemy import select, update
+
+from app.infrastructure.db.base import db
+from app.infrastructure.db.models import CategoriaModel
+from app.infrastructure.db.routing import REPLICA_BIND, read_only
+
+
+@pytest.fixture
+def config_class(config_class, tmp_path):
+    class ConfigConReplica(config_class):
+        SQLALCHEMY_BINDS = {REPLICA_BIND: f"sqlite:///{tmp_path / 'replica.db'}"}
+    return ConfigConReplica
+
+
+@pytest.fixture
+def bases(app):
+    """Mismo esquema en ambas bases, con una categoría distinta en cada una"""
+    with app.app_context():
+        replica = db.engines[REPLICA_BIND]
+        db.metadata.create_all(replica)
+        with replica.begin() as conn:
+            conn.execute(CategoriaModel.__table__.insert(), {'nombre': 'En la réplica'})
+        db.session.add(CategoriaModel(nombre='En el primario'))
+        db.session.commit()
+        db.session.remove()
+    yield
+    with app.app_context():
+        db.metadata.drop_all(db.engines[REPLICA_BIND])
+
+
+def _nombres():
+    return list(db.session.scalars(select(CategoriaModel.nombre)))
+
+
+def test_lecturas_de_solo_lectura_van_a_la_replica(app, bases):
+    with app.app_context():
+        assert _nombres() == ['En el primario']
+        with read_only():
+            assert _nombres() == ['En la réplica']
+
+
+def test_escrituras_van_al_primario(app, bases):
+    with app.app_context():
+        with read_only():
+            db.session.add(CategoriaModel(nombre='Nueva'))
+            db.session.commit()
+            db.session.execute(update(CategoriaModel).values(descripcion='actualizada'))
+            db.session.commit()
+        
+        primario = db.session.execute(select(CategoriaModel.nombre, CategoriaModel.descripcion)).all()
+        assert sorted(primario) == [('En el primario', 'actualizada'), ('Nueva', 'actualizada')]
+        with db.engines[REPLICA_BIND].connect() as conn:
+            assert conn.execute(select(CategoriaModel.nombre)).scalars().all() == ['En la réplica']
+
+
+def test_lecturas_tras_una_escritura_van_al_primario(app, bases):
+    with app.app_context():
+        db.session.add(CategoriaModel(nombre='Recién creada'))
+        db.session.commit()
+        with read_only():
+            assert sorted(_nombres()) == ['En el primario', 'Recién creada']
+        
+        # Una sesión nueva (la siguiente petición) vuelve a leer de la réplica
+        db.session.remove()
+        with read_only():
+            assert _nombres() == ['En la réplica']
+
+
+def test_endpoint_de_lectura_usa_la_replica(app, bases, client, auth_headers):
+    # pytest-flask comparte el app context entre peticiones: descartar la
+    # sesión que escribió en el registro, como al terminar una petición real
+    db.session.remove()
+    response = client.get('/api/categorias', headers=auth_headers)
+    assert response.status_code == 200
+    assert [item['nombre'] for item in response.json['data']['items']] == ['En la réplica']
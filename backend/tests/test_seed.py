@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import delete, select
+
+from app.infrastructure.db.base import db
+from app.infrastructure.db.models import CategoriaModel, PresentacionModel, ProductoModel
+from app.infrastructure.db.seed import CatalogSeeder
+
+
+@pytest.fixture
+def seeder(app):
+    with app.app_context():
+        seeder = CatalogSeeder(batch_size=7)
+        seeder.seed_categorias(4)
+        seeder.seed_presentaciones(3)
+        yield seeder
+
+
+def _nombres(model):
+    return list(db.session.scalars(select(model.nombre).order_by(model.id)))
+
+
+def _numero(nombre):
+    return int(nombre.rsplit(' ', 1)[1])
+
+
+def test_deterministico_con_cualquier_tamano_de_lote(seeder):
+    assert seeder.seed_productos(30) == 30
+    primeros = _nombres(ProductoModel)
+    
+    db.session.execute(delete(ProductoModel))
+    db.session.commit()
+    assert CatalogSeeder(batch_size=100).seed_productos(30) == 30
+    assert _nombres(ProductoModel) == primeros
+    assert [_numero(nombre) for nombre in primeros] == list(range(1, 31))
+
+
+def test_completar_tras_borrar_filas_no_repite_nombres(seeder):
+    seeder.seed_productos(30)
+    borrados = [producto.id for producto in ProductoModel.query.order_by(ProductoModel.id).all()[10:30:4]]
+    db.session.execute(delete(ProductoModel).where(ProductoModel.id.in_(borrados)))
+    db.session.commit()
+    
+    assert seeder.seed_productos(30) == len(borrados)
+    nombres = _nombres(ProductoModel)
+    assert len(nombres) == 30 == len({nombre.lower() for nombre in nombres})
+    assert sorted(_numero(nombre) for nombre in nombres[-len(borrados):]) == list(range(31, 31 + len(borrados)))
+    # Ya completo: no agrega nada
+    assert seeder.seed_productos(30) == 0
+
+
+def test_numeracion_sigue_a_nombres_existentes(seeder):
+    # Un producto cargado a mano cuyo nombre también termina en un número
+    db.session.add(ProductoModel(nombre='Pack surtido 00000100', precio=Decimal('5'),
+                                 categoria_id=db.session.scalar(select(CategoriaModel.id)),
+                                 presentacion_id=db.session.scalar(select(PresentacionModel.id))))
+    db.session.commit()
+    
+    assert seeder.seed_productos(3) == 2
+    assert [_numero(nombre) for nombre in _nombres(ProductoModel)] == [100, 101, 102]
+
+
+def test_catalogo_tras_borrar_filas(seeder):
+    db.session.execute(delete(CategoriaModel).where(CategoriaModel.nombre == 'Categoría 00002'))
+    db.session.commit()
+    
+    assert seeder.seed_categorias(4) == 1
+    assert _nombres(CategoriaModel) == ['Categoría 00001', 'Categoría 00003', 'Categoría 00004', 'Categoría 00005']
@@ -0,0 +1,110 @@
+import re
+import threading
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+
+from app.infrastructure.db import statement_timeout as modulo
+from app.infrastructure.db.base import db
+from app.infrastructure.db.models import ProductoModel
+
+SET_TIMEOUT = re.compile(r'^\s*SET LOCAL statement_timeout = (\d+)\s*$')
+
+
+class Timeouts:
+    """Límite vigente (el último `SET LOCAL` de la transacción) al consultar productos"""
+    
+    def __init__(self):
+        self.sets = []
+        self.consultas = []
+        self._vigente = None
+    
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        coincidencia = SET_TIMEOUT.match(statement)
+        if coincidencia:
+            self._vigente = int(coincidencia.group(1))
+            self.sets.append(self._vigente)
+            # SQLite no conoce SET: se reemplaza por una sentencia inocua
+            return 'SELECT 1', ()
+        if 'productos' in statement:
+            self.consultas.append(self._vigente)
+        return statement, parameters
+    
+    def _fin_de_transaccion(self, conn):
+        # SET LOCAL deja de valer con el COMMIT o ROLLBACK
+        self._vigente = None
+
+
+def _en_otro_hilo(fn):
+    """Ejecutar `fn` sin el request context que pytest-flask mantiene durante la prueba"""
+    resultado = {}
+    hilo = threading.Thread(target=lambda: resultado.update(valor=fn()))
+    hilo.start()
+    hilo.join()
+    return resultado['valor']
+
+
+@pytest.fixture
+def timeouts(app, monkeypatch):
+    """Hace que el módulo trate a SQLite como PostgreSQL y registra los límites enviados"""
+    monkeypatch.setattr(modulo, '_supports_statement_timeout', lambda dialect: True)
+    # Cada petición empieza sin transacción abierta, como en un worker
+    db.session.remove()
+    registro = Timeouts()
+    event.listen(Engine, 'before_cursor_execute', registro._before_cursor_execute, retval=True)
+    event.listen(Engine, 'commit', registro._fin_de_transaccion)
+    event.listen(Engine, 'rollback', registro._fin_de_transaccion)
+    yield registro
+    event.remove(Engine, 'before_cursor_execute', registro._before_cursor_execute)
+    event.remove(Engine, 'commit', registro._fin_de_transaccion)
+    event.remove(Engine, 'rollback', registro._fin_de_transaccion)
+
+
+@pytest.fixture
+def limite(app):
+    return app.config['DB_STATEMENT_TIMEOUT_MS']
+
+
+def test_peticion_web_usa_el_limite(client, auth_headers, productos, timeouts, limite):
+    response = client.get('/api/productos', headers=auth_headers)
+    
+    assert response.status_code == 200
+    assert limite > 0
+    assert timeouts.sets and set(timeouts.sets) == {limite}
+    assert timeouts.consultas and set(timeouts.consultas) == {limite}
+
+
+@pytest.mark.parametrize('metodo,url,cuerpo', [
+    ('get', '/api/productos/export?format=csv', None),
+    ('patch', '/api/productos/bulk', {'ids': [1, 2], 'changes': {'activo': False}}),
+    ('delete', '/api/productos/bulk', {'ids': [3, 4]}),
+])
+def test_exportacion_y_cambios_masivos_sin_limite(client, auth_headers, productos, timeouts, metodo, url, cuerpo):
+    response = getattr(client, metodo)(url, headers=auth_headers, json=cuerpo, buffered=True)
+    
+    assert response.status_code == 200, response.get_data(as_text=True)[:200]
+    # Si la autenticación abrió la transacción con el límite, la vista lo anula
+    assert timeouts.consultas and set(timeouts.consultas) <= {0, None}
+
+
+def test_comando_flask_anula_el_limite(app, productos, timeouts):
+    resultado = _en_otro_hilo(lambda: app.test_cli_runner().invoke(
+        args=['seed', '--productos', '60', '--categorias', '8', '--presentaciones', '5']
+    ))
+    
+    assert resultado.exit_code == 0, resultado.output
+    assert timeouts.sets and set(timeouts.sets) == {0}
+
+
+def test_fuera_de_peticiones_y_comandos_no_se_envia(app, productos, timeouts):
+    def consultar():
+        with app.app_context():
+            total = len(db.session.scalars(select(ProductoModel)).all())
+            db.session.remove()
+            return total
+    
+    assert _en_otro_hilo(consultar) == 60
+    
+    assert timeouts.sets == []
+    assert timeouts.consultas == [None]
@@ -0,0 +1,59 @@
+import json
+import logging
+import os
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure.monitoring.structured_logging import REDACTED, redact, structured_logging
+
+
+def test_redaccion():
+    assert redact('Authorization: Bearer abc.def') == f'Authorization: Bearer {REDACTED}'
+    assert redact({'password': 'secreto', 'nombre': 'Ana', 'anidado': {'token': 'x'}}) == {
+        'password': REDACTED, 'nombre': 'Ana', 'anidado': {'token': REDACTED}
+    }
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requiere fork')
+def test_hijo_inicia_el_hilo_escritor_con_el_primer_registro(app):
+    lectura, escritura = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Proceso hijo: no debe haber hilo escritor hasta el primer registro
+        try:
+            antes = (structured_logging.listener_pending, structured_logging._listener._thread is None)
+            logging.getLogger('pruebas').warning('registro del hijo')
+            despues = (structured_logging.listener_pending, structured_logging._listener._thread is not None)
+            structured_logging.shutdown()
+            os.write(escritura, json.dumps([antes, despues]).encode())
+        finally:
+            os._exit(0)
+    
+    os.close(escritura)
+    with os.fdopen(lectura) as archivo:
+        antes, despues = json.loads(archivo.read())
+    os.waitpid(pid, 0)
+    
+    assert antes == [True, True]
+    assert despues == [False, True]
+    # En el padre el hilo escritor sigue activo
+    assert not structured_logging.listener_pending
+    assert structured_logging._listener._thread is not None
+
+
+def _hilos_del_proceso():
+    return threading.active_count()
+
+
+def test_pool_de_hash_sin_hilo_escritor(app):
+    from app.infrastructure.auth.password_hasher import PasswordHasher
+    
+    config = {**app.config, 'PASSWORD_HASH_WORKERS': 1}
+    hasher = PasswordHasher(SimpleNamespace(config=config))
+    try:
+        # Los procesos del pool no escriben logs: sólo tienen el hilo principal
+        assert hasher._run(_hilos_del_proceso) == 1
+    finally:
+        hasher.shutdown()
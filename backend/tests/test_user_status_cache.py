@@ -0,0 +1,79 @@
+import time
+from types import SimpleNamespace
+
+from sqlalchemy import update
+
+from app.infrastructure.auth import user_status_cache as modulo_cache
+from app.infrastructure.auth.user_status_cache import user_status_cache
+from app.infrastructure.db.base import db
+from app.infrastructure.db.models import UsuarioModel
+from app.infrastructure.repository_impl.usuario_repo import UsuarioRepository
+
+URL = '/api/categorias'
+
+
+def _consultas_usuarios(counter):
+    return [s for s in counter.statements if 'FROM usuarios' in s]
+
+
+def _usuario(app):
+    with app.app_context():
+        return UsuarioRepository().get_by_email('pruebas@example.com')
+
+
+def _cambiar_activo(app, activo):
+    """Cambio a través del repositorio, como lo haría la aplicación"""
+    usuario = _usuario(app)
+    usuario.activo = activo
+    with app.app_context():
+        UsuarioRepository().update(usuario.id, usuario)
+
+
+def test_segunda_peticion_no_consulta_usuarios(client, auth_headers, count_queries):
+    with count_queries() as primera:
+        assert client.get(URL, headers=auth_headers).status_code == 200
+    with count_queries() as segunda:
+        assert client.get(URL, headers=auth_headers).status_code == 200
+    
+    assert len(_consultas_usuarios(primera)) == 1
+    assert _consultas_usuarios(segunda) == []
+    assert user_status_cache.stats()['hits'] >= 1
+
+
+def test_usuario_desactivado_recibe_401(app, client, auth_headers):
+    # Estado en caché antes de desactivar: la invalidación debe surtir efecto
+    assert client.get(URL, headers=auth_headers).status_code == 200
+    
+    _cambiar_activo(app, False)
+    response = client.get(URL, headers=auth_headers)
+    
+    assert response.status_code == 401
+    assert response.json['message'] == 'La cuenta de usuario está desactivada'
+    
+    _cambiar_activo(app, True)
+    assert client.get(URL, headers=auth_headers).status_code == 200
+
+
+def test_update_sin_cambiar_activo_no_invalida(app, client, auth_headers, count_queries):
+    assert client.get(URL, headers=auth_headers).status_code == 200
+    
+    _cambiar_activo(app, True)
+    with count_queries() as counter:
+        assert client.get(URL, headers=auth_headers).status_code == 200
+    
+    assert _consultas_usuarios(counter) == []
+
+
+def test_cambio_externo_se_aplica_al_expirar_el_ttl(app, client, auth_headers, monkeypatch):
+    assert client.get(URL, headers=auth_headers).status_code == 200
+    
+    # Desactivación hecha por otro worker: esta caché no se entera
+    with app.app_context():
+        db.session.execute(update(UsuarioModel).values(activo=False))
+        db.session.commit()
+    assert client.get(URL, headers=auth_headers).status_code == 200
+    
+    desplazado = time.monotonic() + user_status_cache.ttl + 1
+    monkeypatch.setattr(modulo_cache, 'time', SimpleNamespace(monotonic=lambda: desplazado))
+    
+    assert client.get(URL, headers=auth_headers).status_code == 401
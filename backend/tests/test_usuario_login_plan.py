@@ -0,0 +1,52 @@
+import json
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from app.infrastructure.db.base import db
+from app.infrastructure.db.models import UsuarioModel
+from app.infrastructure.repository_impl.usuario_repo import UsuarioRepository
+
+
+def _index_scans(plan):
+    """Índices usados en el árbol `plan`"""
+    if 'Index Name' in plan:
+        yield plan['Index Name']
+    for hijo in plan.get('Plans', ()):
+        yield from _index_scans(hijo)
+
+
+def test_login_busca_el_email_por_indice(app):
+    with app.app_context():
+        if db.engine.dialect.name != 'postgresql':
+            pytest.skip('El plan de ejecución sólo es representativo en PostgreSQL (TEST_DATABASE_URL)')
+        
+        # Suficientes filas para que un recorrido secuencial no sea lo más barato
+        db.session.execute(insert(UsuarioModel), [
+            {'email': f'usuario{i:05d}@example.com', 'password_hash': 'x', 'nombre': f'Usuario {i}'}
+            for i in range(20_000)
+        ])
+        db.session.commit()
+        db.session.execute(text('ANALYZE usuarios'))
+        db.session.commit()
+        
+        consultas = []
+        
+        def registrar(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith('SELECT'):
+                consultas.append((statement, parameters))
+        
+        event.listen(db.engine, 'before_cursor_execute', registrar)
+        try:
+            usuario = UsuarioRepository().get_by_email('  Usuario01234@Example.com ')
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', registrar)
+        
+        assert usuario is not None and usuario.email == 'usuario01234@example.com'
+        assert len(consultas) == 1
+        statement, parameters = consultas[0]
+        plan = db.session.connection().exec_driver_sql('EXPLAIN (FORMAT JSON) ' + statement, parameters).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        assert 'ix_usuarios_email' in set(_index_scans(plan[0]['Plan'])), plan
+        db.session.rollback()
@@ -62,11 +62,12 @@ export const authApi = {
   },
 
   /**
-   * Cierra la sesión del usuario (invalida el refresh token)
+   * Cierra la sesión del usuario (revoca el access token y el refresh token)
+   * @param {string|null} refreshToken - Refresh token a revocar junto con el access token
    * @returns {Promise<Object>} Respuesta del servidor
    */
-  async logout() {
-    const response = await api.post('/auth/logout')
+  async logout(refreshToken) {
+    const response = await api.post('/auth/logout', refreshToken ? { refresh_token: refreshToken } : {})
     return response.data
   }
 }
@@ -166,9 +166,18 @@ export const useAuthStore = defineStore('auth', {
 
     /**
      * Cierra la sesión del usuario
-     * Limpia todos los datos de autenticación
+     * Revoca los tokens en el servidor y limpia todos los datos de autenticación
      */
-    logout() {
+    async logout() {
+      // Revocar los tokens en el servidor; la sesión local se cierra aunque falle
+      if (this.accessToken) {
+        try {
+          await authApi.logout(this.refreshToken)
+        } catch (error) {
+          console.error('Error al cerrar sesión en el servidor:', error)
+        }
+      }
+      
       // Limpiar estado del store
       this.user = null
       this.accessToken = null
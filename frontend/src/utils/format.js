@@ -0,0 +1,19 @@
+// Formatear el total de un listado según el modo de conteo del backend
+export function formatTotal(total, countMode = 'exact') {
+  if (total === null || total === undefined) return ''
+  if (countMode !== 'estimate') return total.toLocaleString('es-ES')
+
+  // Los totales estimados se muestran aproximados: ~950, ~12K, ~1.2M
+  const units = [
+    { value: 1e9, suffix: 'B' },
+    { value: 1e6, suffix: 'M' },
+    { value: 1e3, suffix: 'K' }
+  ]
+  for (const unit of units) {
+    if (total >= unit.value) {
+      const scaled = total / unit.value
+      return `~${scaled.toFixed(scaled < 10 ? 1 : 0).replace(/\.0$/, '')}${unit.suffix}`
+    }
+  }
+  return `~${total}`
+}
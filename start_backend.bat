@@ -26,8 +26,8 @@ if not exist ".env" (
 
 REM Inicializar base de datos
 echo Inicializando base de datos...
-flask db init
-flask db migrate -m "Initial migration"
+REM db-bootstrap crea la base de datos del .env si no existe; create_app() ya no lo hace
+flask db-bootstrap
 flask db upgrade
 
 REM Iniciar servidor